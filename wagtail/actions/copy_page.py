@@ -1,11 +1,19 @@
 import logging
 import uuid
+from collections import defaultdict
 
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import PermissionDenied
-from modelcluster.models import get_all_child_relations
+from django.db import connections, router, transaction
+from django.utils import timezone
+from modelcluster.models import (
+    ClusterableModel,
+    get_all_child_m2m_relations,
+    get_all_child_relations,
+)
 
 from wagtail.log_actions import log
-from wagtail.models.copying import _copy, _copy_m2m_relations
+from wagtail.models.copying import _bulk_insert, _copy, _copy_m2m_relations
 from wagtail.models.i18n import TranslatableMixin
 from wagtail.signals import page_published
 
@@ -31,6 +39,13 @@ class CopyPagePermissionError(PermissionDenied):
 class CopyPageAction:
     """
     Copies pages and page trees.
+
+    When copying recursively with ``bulk=True``, the descendants of the page are
+    inserted in bulk: tree positions are reserved for the whole subtree up front,
+    pages, child objects and revisions are inserted with a query per model for each
+    batch, and the reference and search indexes are updated once at the end. As with
+    ``bulk_create()``, ``save()`` is not called on the copied descendants, and no
+    ``pre_save`` or ``post_save`` signals are sent for them.
     """
 
     def __init__(
@@ -46,6 +61,8 @@ class CopyPageAction:
         process_child_object=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
+        batch_size=1000,
     ):
         # Note: These four parameters don't apply to any copied children
         self.page = page
@@ -60,6 +77,8 @@ class CopyPageAction:
         self.process_child_object = process_child_object
         self.log_action = log_action
         self.reset_translation_key = reset_translation_key
+        self.bulk = bulk
+        self.batch_size = batch_size
         self._uuid_mapping = {}
 
     def generate_translation_key(self, old_uuid):
@@ -107,15 +126,14 @@ class CopyPageAction:
                         "You do not have permission to publish a page at the destination."
                     )
 
-    def _copy_page(
-        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
-    ):
-        specific_page = page.specific
-        exclude_fields = (
+    def _get_exclude_fields(self, specific_page, exclude_fields=None):
+        return (
             specific_page.default_exclude_fields_in_copy
             + specific_page.exclude_fields_in_copy
             + (exclude_fields or [])
         )
+
+    def _get_base_update_attrs(self, update_attrs=None):
         if self.keep_live:
             base_update_attrs = {
                 "alias_of": None,
@@ -140,10 +158,10 @@ class CopyPageAction:
         if update_attrs:
             base_update_attrs.update(update_attrs)
 
-        page_copy, child_object_map = _copy(
-            specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
-        )
-        # Save copied child objects and run process_child_object on them if we need to
+        return base_update_attrs
+
+    def _process_child_objects(self, specific_page, page_copy, child_object_map):
+        # Run process_child_object on copied child objects if we need to
         for (child_relation, old_pk), child_object in child_object_map.items():
             if self.process_child_object:
                 self.process_child_object(
@@ -157,6 +175,19 @@ class CopyPageAction:
                     child_object.translation_key
                 )
 
+    def _copy_page(
+        self, page, to=None, update_attrs=None, exclude_fields=None, _mpnode_attrs=None
+    ):
+        specific_page = page.specific
+        exclude_fields = self._get_exclude_fields(specific_page, exclude_fields)
+        base_update_attrs = self._get_base_update_attrs(update_attrs)
+
+        page_copy, child_object_map = _copy(
+            specific_page, exclude_fields=exclude_fields, update_attrs=base_update_attrs
+        )
+        # Save copied child objects and run process_child_object on them if we need to
+        self._process_child_objects(specific_page, page_copy, child_object_map)
+
         # Save the new page
         if _mpnode_attrs:
             # We've got a tree position already reserved. Perform a quick save
@@ -188,49 +219,14 @@ class CopyPageAction:
 
             for revision in page.revisions.all():
                 use_as_latest_revision = revision.pk == page.latest_revision_id
-                revision.pk = None
-                revision.approved_go_live_at = None
-                revision.object_id = page_copy.id
-
-                # Update ID fields in content
-                revision_content = revision.content
-                revision_content["pk"] = page_copy.pk
-
-                for child_relation in get_all_child_relations(specific_page):
-                    accessor_name = child_relation.get_accessor_name()
-                    try:
-                        child_objects = revision_content[accessor_name]
-                    except KeyError:
-                        # KeyErrors are possible if the revision was created
-                        # before this child relation was added to the database
-                        continue
-
-                    for child_object in child_objects:
-                        child_object[child_relation.field.name] = page_copy.pk
-                        # Remap primary key to copied versions
-                        # If the primary key is not recognised (eg, the child object has been deleted from the database)
-                        # set the primary key to None
-                        copied_child_object = child_object_map.get(
-                            (child_relation, child_object["pk"])
-                        )
-                        child_object["pk"] = (
-                            copied_child_object.pk if copied_child_object else None
-                        )
-                        if (
-                            self.reset_translation_key
-                            and "translation_key" in child_object
-                        ):
-                            child_object["translation_key"] = (
-                                self.generate_translation_key(
-                                    child_object["translation_key"]
-                                )
-                            )
-
-                for field_name in exclude_fields:
-                    if field_name in revision_content:
-                        revision_content[field_name] = page_copy_data.get(field_name)
-
-                revision.content = revision_content
+                self._copy_revision(
+                    revision,
+                    specific_page,
+                    page_copy,
+                    page_copy_data,
+                    child_object_map,
+                    exclude_fields,
+                )
 
                 # Save
                 revision.save()
@@ -280,8 +276,112 @@ class CopyPageAction:
             )
 
         # Log
+        self._log_copy(
+            page,
+            page_copy,
+            latest_revision_as_page_revision,
+            parent=specific_page.get_parent(),
+            to=to,
+        )
+
+        # Copy child pages
+        from wagtail.models import Page, PageViewRestriction
+
+        if self.recursive and self.bulk:
+            self._bulk_copy_descendants(page, page_copy)
+
+        elif self.recursive:
+            numchild = 0
+
+            for child_page in page.get_children().specific().iterator():
+                newdepth = _mpnode_attrs[1] + 1
+                child_mpnode_attrs = (
+                    Page._get_path(_mpnode_attrs[0], newdepth, numchild),
+                    newdepth,
+                )
+                numchild += 1
+                self._copy_page(
+                    child_page, to=page_copy, _mpnode_attrs=child_mpnode_attrs
+                )
+
+            if numchild > 0:
+                page_copy.numchild = numchild
+                page_copy.save(clean=False, update_fields=["numchild"])
+
+        # Copy across any view restrictions defined directly on the page,
+        # unless the destination page already has view restrictions defined
+        if to:
+            parent_page_restriction = to.get_view_restrictions()
+        else:
+            parent_page_restriction = self.page.get_parent().get_view_restrictions()
+
+        if not parent_page_restriction.exists():
+            for view_restriction in self.page.view_restrictions.all():
+                view_restriction_copy = PageViewRestriction(
+                    restriction_type=view_restriction.restriction_type,
+                    password=view_restriction.password,
+                    page=page_copy,
+                )
+                view_restriction_copy.save(user=self.user)
+                view_restriction_copy.groups.set(view_restriction.groups.all())
+
+        return page_copy
+
+    def _copy_revision(
+        self,
+        revision,
+        specific_page,
+        page_copy,
+        page_copy_data,
+        child_object_map,
+        exclude_fields,
+    ):
+        """
+        Updates the given revision of ``specific_page`` in place to become an unsaved
+        revision of ``page_copy``.
+        """
+        revision.pk = None
+        revision.approved_go_live_at = None
+        revision.object_id = page_copy.id
+
+        # Update ID fields in content
+        revision_content = revision.content
+        revision_content["pk"] = page_copy.pk
+
+        for child_relation in get_all_child_relations(specific_page):
+            accessor_name = child_relation.get_accessor_name()
+            try:
+                child_objects = revision_content[accessor_name]
+            except KeyError:
+                # KeyErrors are possible if the revision was created
+                # before this child relation was added to the database
+                continue
+
+            for child_object in child_objects:
+                child_object[child_relation.field.name] = page_copy.pk
+                # Remap primary key to copied versions
+                # If the primary key is not recognised (eg, the child object has been deleted from the database)
+                # set the primary key to None
+                copied_child_object = child_object_map.get(
+                    (child_relation, child_object["pk"])
+                )
+                child_object["pk"] = (
+                    copied_child_object.pk if copied_child_object else None
+                )
+                if self.reset_translation_key and "translation_key" in child_object:
+                    child_object["translation_key"] = self.generate_translation_key(
+                        child_object["translation_key"]
+                    )
+
+        for field_name in exclude_fields:
+            if field_name in revision_content:
+                revision_content[field_name] = page_copy_data.get(field_name)
+
+        revision.content = revision_content
+        return revision
+
+    def _log_copy(self, page, page_copy, revision, parent=None, to=None):
         if self.log_action:
-            parent = specific_page.get_parent()
             log(
                 instance=page_copy,
                 action=self.log_action,
@@ -320,51 +420,242 @@ class CopyPageAction:
                     instance=page_copy,
                     action="wagtail.publish",
                     user=self.user,
-                    revision=latest_revision_as_page_revision,
+                    revision=revision,
                 )
         logger.info(
             'Page copied: "%s" id=%d from=%d', page_copy.title, page_copy.id, page.id
         )
 
-        # Copy child pages
-        from wagtail.models import Page, PageViewRestriction
+    def _bulk_copy_descendants(self, page, page_copy):
+        """
+        Copies all descendants of ``page`` to below ``page_copy``, inserting the pages,
+        their child objects and revisions in bulk.
+        """
+        from wagtail.models import Locale, Page, Revision
+        from wagtail.search.tasks import insert_or_update_objects_task
+        from wagtail.signal_handlers import batch_reference_index_updates
+        from wagtail.tasks import update_reference_index_task
 
-        if self.recursive:
-            numchild = 0
+        descendants = list(page.get_descendants().specific().order_by("path"))
+        if not descendants:
+            return
 
-            for child_page in page.get_children().specific().iterator():
-                newdepth = _mpnode_attrs[1] + 1
-                child_mpnode_attrs = (
-                    Page._get_path(_mpnode_attrs[0], newdepth, numchild),
-                    newdepth,
+        locales = Locale.objects.in_bulk(
+            {page.locale_id} | {descendant.locale_id for descendant in descendants}
+        )
+        page.locale = locales[page.locale_id]
+
+        # The source page and its copy, keyed by the path of the source page
+        sources = {page.path: page}
+        copies = {page.path: page_copy}
+        numchild = defaultdict(int)
+        child_object_maps = {}
+        exclude_fields_by_path = {}
+
+        for descendant in descendants:
+            parent_path = descendant.path[: -Page.steplen]
+            descendant.locale = locales[descendant.locale_id]
+            exclude_fields = self._get_exclude_fields(descendant)
+            descendant_copy, child_object_map = _copy(
+                descendant,
+                exclude_fields=exclude_fields,
+                update_attrs=self._get_base_update_attrs(),
+            )
+            self._process_child_objects(descendant, descendant_copy, child_object_map)
+
+            # Reserve the tree position for the copy up front. Descendants keep their
+            # position relative to the copied page, so only the path prefix changes
+            descendant_copy.path = page_copy.path + descendant.path[len(page.path) :]
+            descendant_copy.depth = descendant.depth - page.depth + page_copy.depth
+            descendant_copy.set_url_path(copies[parent_path])
+            descendant_copy.locale = descendant.locale
+            numchild[parent_path] += 1
+
+            sources[descendant.path] = descendant
+            copies[descendant.path] = descendant_copy
+            child_object_maps[descendant.path] = child_object_map
+            exclude_fields_by_path[descendant.path] = exclude_fields
+
+        descendant_paths = [descendant.path for descendant in descendants]
+        for path in descendant_paths:
+            copies[path].numchild = numchild[path]
+
+        with transaction.atomic(), batch_reference_index_updates():
+            copies_by_model = defaultdict(list)
+            for path in descendant_paths:
+                copies_by_model[type(copies[path])].append(copies[path])
+            for model, model_copies in copies_by_model.items():
+                _bulk_insert(model, model_copies, batch_size=self.batch_size)
+
+            for path in descendant_paths:
+                _copy_m2m_relations(
+                    sources[path],
+                    copies[path],
+                    exclude_fields=exclude_fields_by_path[path],
                 )
-                numchild += 1
-                self._copy_page(
-                    child_page, to=page_copy, _mpnode_attrs=child_mpnode_attrs
+            self._bulk_save_child_objects([copies[path] for path in descendant_paths])
+
+            # Copy revisions
+            latest_revisions = {}
+            if self.copy_revisions:
+                revisions = []
+                paths_by_page_id = {
+                    str(sources[path].pk): path for path in descendant_paths
+                }
+                # Field data for the copies in the format written to revisions, used to
+                # replace excluded fields found in the revision data
+                copy_data = {}
+                for revision in Revision.page_revisions.filter(
+                    object_id__in=paths_by_page_id
+                ).order_by("pk"):
+                    path = paths_by_page_id[revision.object_id]
+                    source, descendant_copy = sources[path], copies[path]
+                    use_as_latest_revision = revision.pk == source.latest_revision_id
+                    if path not in copy_data:
+                        copy_data[path] = descendant_copy.serializable_data()
+                    self._copy_revision(
+                        revision,
+                        source,
+                        descendant_copy,
+                        copy_data[path],
+                        child_object_maps[path],
+                        exclude_fields_by_path[path],
+                    )
+                    revisions.append(revision)
+                    if use_as_latest_revision:
+                        latest_revisions[path] = revision
+                self._bulk_save(Revision, revisions)
+
+            # Create a new revision for each copy, as _copy_page does with save_revision()
+            new_revisions = {}
+            now = timezone.now()
+            for path in descendant_paths:
+                descendant_copy = copies[path]
+                latest_revision = latest_revisions.get(path)
+                if latest_revision and descendant_copy.has_unpublished_changes:
+                    latest_object = descendant_copy.with_content_json(
+                        latest_revision.content
+                    )
+                else:
+                    latest_object = descendant_copy
+
+                new_revisions[path] = Revision(
+                    content_type=ContentType.objects.get_for_model(
+                        latest_object, for_concrete_model=False
+                    ),
+                    base_content_type=descendant_copy.get_base_content_type(),
+                    object_id=str(descendant_copy.pk),
+                    created_at=now,
+                    user=self.user,
+                    content=latest_object.serializable_data(),
+                    object_str=str(latest_object),
                 )
+                descendant_copy.draft_title = latest_object.title
+            self._bulk_save(Revision, list(new_revisions.values()))
+
+            update_fields = [
+                "latest_revision",
+                "latest_revision_created_at",
+                "draft_title",
+            ]
+            if self.keep_live:
+                update_fields += [
+                    "live_revision",
+                    "last_published_at",
+                    "first_published_at",
+                ]
+            for path in descendant_paths:
+                descendant_copy = copies[path]
+                revision = new_revisions[path]
+                descendant_copy.latest_revision = revision
+                descendant_copy.latest_revision_created_at = revision.created_at
+                if self.keep_live:
+                    descendant_copy.live_revision = revision
+                    descendant_copy.last_published_at = revision.created_at
+                    descendant_copy.first_published_at = revision.created_at
+            Page.objects.bulk_update(
+                [copies[path] for path in descendant_paths],
+                update_fields,
+                batch_size=self.batch_size,
+            )
 
-            if numchild > 0:
-                page_copy.numchild = numchild
-                page_copy.save(clean=False, update_fields=["numchild"])
+            page_copy.numchild = numchild[page.path]
+            page_copy.save(clean=False, update_fields=["numchild"])
 
-        # Copy across any view restrictions defined directly on the page,
-        # unless the destination page already has view restrictions defined
-        if to:
-            parent_page_restriction = to.get_view_restrictions()
-        else:
-            parent_page_restriction = self.page.get_parent().get_view_restrictions()
+            for path in descendant_paths:
+                self._log_copy(
+                    sources[path],
+                    copies[path],
+                    new_revisions[path],
+                    parent=sources[path[: -Page.steplen]],
+                    to=copies[path[: -Page.steplen]],
+                )
 
-        if not parent_page_restriction.exists():
-            for view_restriction in self.page.view_restrictions.all():
-                view_restriction_copy = PageViewRestriction(
-                    restriction_type=view_restriction.restriction_type,
-                    password=view_restriction.password,
-                    page=page_copy,
+            # Update the reference and search indexes for all copies at once
+            for model, model_copies in copies_by_model.items():
+                pks = [str(descendant_copy.pk) for descendant_copy in model_copies]
+                update_reference_index_task.enqueue(
+                    model._meta.app_label, model._meta.model_name, *pks
+                )
+                insert_or_update_objects_task.enqueue(
+                    model._meta.app_label, model._meta.model_name, *pks
                 )
-                view_restriction_copy.save(user=self.user)
-                view_restriction_copy.groups.set(view_restriction.groups.all())
 
-        return page_copy
+        for path in descendant_paths:
+            descendant_copy = copies[path]
+            if descendant_copy.live:
+                page_published.send(
+                    sender=descendant_copy.specific_class,
+                    instance=descendant_copy,
+                    revision=new_revisions[path],
+                )
+
+    def _bulk_save(self, model, objs):
+        """
+        Saves new instances of a model that doesn't use multi-table inheritance with
+        bulk_create(), or one at a time if the database cannot return the primary keys
+        of rows inserted in bulk.
+        """
+        connection = connections[router.db_for_write(model)]
+        if connection.features.can_return_rows_from_bulk_insert:
+            model._default_manager.bulk_create(objs, batch_size=self.batch_size)
+        else:
+            for obj in objs:
+                obj.save()
+
+    def _bulk_save_child_objects(self, page_copies):
+        """
+        Saves the child objects of the given saved page copies, inserting them in bulk
+        where they don't have child objects of their own.
+        """
+        child_objects_by_model = defaultdict(list)
+        for page_copy in page_copies:
+            for child_relation in get_all_child_relations(page_copy):
+                accessor_name = child_relation.get_accessor_name()
+                child_model = child_relation.related_model
+                if child_model._meta.parents or (
+                    issubclass(child_model, ClusterableModel)
+                    and (
+                        get_all_child_relations(child_model)
+                        or get_all_child_m2m_relations(child_model)
+                    )
+                ):
+                    getattr(page_copy, accessor_name).commit()
+                    continue
+
+                try:
+                    child_objects = page_copy._cluster_related_objects[accessor_name]
+                except (AttributeError, KeyError):
+                    continue
+                for child_object in child_objects:
+                    setattr(child_object, child_relation.field.attname, page_copy.pk)
+                    child_objects_by_model[child_model].append(child_object)
+
+            for field in get_all_child_m2m_relations(page_copy):
+                getattr(page_copy, field.name).commit()
+
+        for child_model, child_objects in child_objects_by_model.items():
+            self._bulk_save(child_model, child_objects)
 
     def execute(self, skip_permission_checks=False):
         self.check(skip_permission_checks=skip_permission_checks)
@@ -1,14 +1,25 @@
 import logging
+import operator
+from collections import Counter, namedtuple
+from functools import reduce
 
-from django.core.exceptions import PermissionDenied
+from django.core.exceptions import PermissionDenied, ValidationError
 from django.db import transaction
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Concat, Substr
+from django.utils.translation import gettext_lazy as _
+from treebeard.exceptions import InvalidMoveToDescendant
 from treebeard.mp_tree import MP_MoveHandler
 
 from wagtail.log_actions import log
-from wagtail.signals import post_page_move, pre_page_move
+from wagtail.signals import post_bulk_page_move, post_page_move, pre_page_move
 
 logger = logging.getLogger("wagtail")
 
+_PageMove = namedtuple(
+    "PageMove", ["page", "old_path", "new_path", "old_url_path", "new_url_path"]
+)
+
 
 class MovePagePermissionError(PermissionDenied):
     """
@@ -105,3 +116,218 @@ class MovePageAction:
         self.check(parent_after, skip_permission_checks=skip_permission_checks)
 
         return self._move_page(self.page, self.target, parent_after)
+
+
+class BulkMovePageAction:
+    """
+    Moves several pages, along with their descendants, to the end of the children of
+    ``target``.
+
+    Rather than moving the pages one at a time, the tree paths, depths and url_paths of
+    the moved pages and all of their descendants are rewritten with a single UPDATE
+    for each batch of pages. Instead of ``pre_page_move`` and ``post_page_move`` signals
+    for each page, a single ``post_bulk_page_move`` signal is sent once all pages have
+    been moved, and the search index entries of the moved pages and their descendants
+    are updated by a single task.
+    """
+
+    def __init__(self, pages, target, user=None, batch_size=100):
+        self.pages = list(pages)
+        self.target = target
+        self.user = user
+        self.batch_size = batch_size
+
+    def check(self, skip_permission_checks=False):
+        from wagtail.models import Page
+
+        paths = sorted(page.path for page in self.pages)
+        for path, next_path in zip(paths, paths[1:]):
+            if next_path.startswith(path):
+                raise ValueError("Cannot move a page along with one of its ancestors")
+
+        for page in self.pages:
+            if page.pk == self.target.pk or self.target.is_descendant_of(page):
+                raise InvalidMoveToDescendant(_("Can't move node to a descendant."))
+
+        # Check that the slugs of the moved pages are unique within the target
+        page_ids = {page.pk for page in self.pages}
+        slugs = set(
+            Page.objects.child_of(self.target)
+            .exclude(pk__in=page_ids)
+            .values_list("slug", flat=True)
+        )
+        for page in self.pages:
+            if page.slug in slugs:
+                raise ValidationError(
+                    {
+                        "slug": _(
+                            "The slug '%(page_slug)s' is already in use within the parent page at '%(parent_url_path)s'."
+                        )
+                        % {"page_slug": page.slug, "parent_url_path": self.target.url}
+                    }
+                )
+            slugs.add(page.slug)
+
+        if self.user and not skip_permission_checks:
+            for page in self.pages:
+                if not page.permissions_for_user(self.user).can_move_to(self.target):
+                    raise MovePagePermissionError(
+                        "You do not have permission to move the page to the target specified."
+                    )
+
+    def _move_pages(self, page_ids):
+        from wagtail.models import Page
+        from wagtail.search.tasks import insert_or_update_objects_task
+
+        # Work with freshly loaded pages, as the tree positions of the given instances
+        # may be out of date
+        target = Page.objects.get(pk=self.target.pk)
+        pages = list(Page.objects.filter(pk__in=page_ids).order_by("path"))
+        parents_before = Page.objects.in_bulk(
+            {page.path[: -Page.steplen] for page in pages}, field_name="path"
+        )
+
+        # Reserve the positions after the last child of the target
+        last_child = target.get_last_child()
+        if last_child:
+            next_step = Page._str2int(last_child.path[-Page.steplen :]) + 1
+        else:
+            next_step = 1
+
+        moves = []
+        for index, page in enumerate(pages):
+            moves.append(
+                _PageMove(
+                    page=page,
+                    old_path=page.path,
+                    new_path=Page._get_path(
+                        target.path, target.depth + 1, next_step + index
+                    ),
+                    old_url_path=page.url_path,
+                    new_url_path=page.set_url_path(parent=target),
+                )
+            )
+
+        for start in range(0, len(moves), self.batch_size):
+            batch = moves[start : start + self.batch_size]
+            Page.objects.filter(
+                reduce(
+                    operator.or_,
+                    (Q(path__startswith=move.old_path) for move in batch),
+                )
+            ).update(
+                path=Case(
+                    *(
+                        When(
+                            path__startswith=move.old_path,
+                            then=Concat(
+                                Value(move.new_path),
+                                Substr("path", len(move.old_path) + 1),
+                            ),
+                        )
+                        for move in batch
+                    )
+                ),
+                depth=Case(
+                    *(
+                        When(
+                            path__startswith=move.old_path,
+                            then=F("depth") + (target.depth + 1 - move.page.depth),
+                        )
+                        for move in batch
+                    )
+                ),
+                url_path=Case(
+                    *(
+                        When(
+                            path__startswith=move.old_path,
+                            then=Concat(
+                                Value(move.new_url_path),
+                                Substr("url_path", len(move.old_url_path) + 1),
+                            ),
+                        )
+                        for move in batch
+                    )
+                ),
+            )
+
+        # Update the number of children of the parents before and after the move
+        numchild_changes = Counter(page.path[: -Page.steplen] for page in pages)
+        for path, count in numchild_changes.items():
+            numchild_changes[path] = -count
+        numchild_changes[target.path] += len(pages)
+        for path, change in numchild_changes.items():
+            if change:
+                Page.objects.filter(path=path).update(numchild=F("numchild") + change)
+
+        # Update the search index of the moved pages and their descendants, as their
+        # tree paths have changed
+        moved_page_ids = list(
+            Page.objects.filter(
+                reduce(
+                    operator.or_,
+                    (Q(path__startswith=move.new_path) for move in moves),
+                )
+            ).values_list("pk", flat=True)
+        )
+        for start in range(0, len(moved_page_ids), 1000):
+            insert_or_update_objects_task.enqueue(
+                "wagtailcore",
+                "page",
+                *[str(pk) for pk in moved_page_ids[start : start + 1000]],
+            )
+
+        new_pages = Page.objects.in_bulk(page_ids)
+        return [
+            {
+                "instance": new_pages[move.page.pk],
+                "parent_page_before": parents_before[move.old_path[: -Page.steplen]],
+                "parent_page_after": target,
+                "url_path_before": move.old_url_path,
+                "url_path_after": move.new_url_path,
+            }
+            for move in moves
+        ]
+
+    def execute(self, skip_permission_checks=False):
+        from wagtail.models import Page
+
+        self.check(skip_permission_checks=skip_permission_checks)
+
+        if not self.pages:
+            return
+
+        # Only commit when all pages and their descendants are properly updated
+        with transaction.atomic():
+            moves = self._move_pages([page.pk for page in self.pages])
+
+        # Emit a single signal for all moved pages
+        post_bulk_page_move.send(sender=Page, moves=moves)
+
+        # Log
+        for move in moves:
+            page = move["instance"]
+            parent_before = move["parent_page_before"]
+            parent_after = move["parent_page_after"]
+            url_path_changed = move["url_path_before"] != move["url_path_after"]
+            log(
+                instance=page,
+                action="wagtail.move" if url_path_changed else "wagtail.reorder",
+                user=self.user,
+                data={
+                    "source": {
+                        "id": parent_before.id,
+                        "title": parent_before.specific_deferred.get_admin_display_title(),
+                    },
+                    "destination": {
+                        "id": parent_after.id,
+                        "title": parent_after.specific_deferred.get_admin_display_title(),
+                    },
+                },
+            )
+            logger.info(
+                'Page moved: "%s" id=%d path=%s',
+                page.title,
+                page.id,
+                move["url_path_after"],
+            )
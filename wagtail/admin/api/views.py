@@ -68,6 +68,9 @@ class PagesAdminAPIViewSet(PagesAPIViewSet):
     # Allow the parent field to appear on listings
     detail_only_fields = []
 
+    # Draft changes and workflow states aren't reflected in last_published_at
+    last_modified_field = None
+
     known_query_parameters = PagesAPIViewSet.known_query_parameters.union(
         ["for_explorer", "has_children"]
     )
@@ -148,7 +151,10 @@ class PagesAdminAPIViewSet(PagesAPIViewSet):
         """
         This returns a list of URL patterns for the endpoint
         """
-        urlpatterns = super().get_urlpatterns()
+        # The export view is only provided by the public API
+        urlpatterns = [
+            pattern for pattern in super().get_urlpatterns() if pattern.name != "export"
+        ]
         urlpatterns.extend(
             [
                 path(
@@ -1,15 +1,18 @@
 import collections
 import datetime
 import json
+from unittest import mock
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group, Permission
 from django.test import TestCase
 from django.test.utils import override_settings
-from django.urls import reverse
+from django.urls import NoReverseMatch, reverse
 from django.utils import timezone
 
 from wagtail import hooks
+from wagtail.api.v2 import views
+from wagtail.api.v2.serializers import get_serializer_class
 from wagtail.api.v2.tests.test_pages import (
     TestPageDetail,
     TestPageListing,
@@ -120,6 +123,13 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
     # Not applicable to the admin API
     test_unpublished_pages_dont_appear_in_list = None
     test_private_pages_dont_appear_in_list = None
+    test_private_pages_with_passed_password = None
+    test_private_pages_restrictions_cache_is_cleared = None
+    test_private_pages_query_count_is_independent_of_restrictions = None
+
+    # The admin API fetches the specific pages of each type in the listing, so the
+    # number of queries depends on the types of the pages on each page
+    test_cursor_query_count_is_independent_of_position = None
 
     def test_unpublished_pages_appear_in_list(self):
         total_count = get_total_page_count()
@@ -131,6 +141,17 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
         content = json.loads(response.content.decode("UTF-8"))
         self.assertEqual(content["meta"]["total_count"], total_count)
 
+    def test_no_etag(self):
+        # The listing includes draft changes, which last_published_at doesn't reflect
+        response = self.get_response()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    def test_no_export_view(self):
+        with self.assertRaises(NoReverseMatch):
+            reverse("wagtailadmin_api:pages:export")
+
     def test_private_pages_appear_in_list(self):
         total_count = get_total_page_count()
 
@@ -177,6 +198,35 @@ class TestAdminPageListing(AdminAPITestCase, TestPageListing):
                 {"id", "meta", "title", "admin_display_title", "date", "feed_image"},
             )
 
+    def test_serializer_classes_are_cached(self):
+        views._get_cached_serializer_class.cache_clear()
+
+        with mock.patch(
+            "wagtail.api.v2.views.get_serializer_class",
+            wraps=get_serializer_class,
+        ) as get_serializer_class_mock:
+            for _ in range(2):
+                response = self.get_response(
+                    type="demosite.BlogEntryPage",
+                    fields="title,feed_image(width),related_links",
+                )
+                self.assertEqual(response.status_code, 200)
+
+        # The serializers for the pages, images and related links are only built once
+        self.assertEqual(get_serializer_class_mock.call_count, 3)
+
+        # Changing the fields builds a new serializer for the pages only
+        response = self.get_response(
+            type="demosite.BlogEntryPage",
+            fields="title,feed_image(width)",
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+        for page in content["items"]:
+            self.assertEqual(
+                set(page.keys()),
+                {"id", "meta", "title", "admin_display_title", "feed_image"},
+            )
+
     def test_fields_default(self):
         response = self.get_response(type="demosite.BlogEntryPage")
         content = json.loads(response.content.decode("UTF-8"))
@@ -9,6 +9,7 @@ from django.views.generic import FormView
 from wagtail import hooks
 from wagtail.admin import messages
 from wagtail.admin.utils import get_valid_next_url_from_request
+from wagtail.signal_handlers import batch_reference_index_updates
 
 
 class BulkAction(ABC, FormView):
@@ -149,9 +150,10 @@ class BulkAction(ABC, FormView):
             )
             if before_hook_result is not None:
                 return before_hook_result
-            num_parent_objects, num_child_objects = self.execute_action(
-                objects, **self.get_execution_context()
-            )
+            with batch_reference_index_updates():
+                num_parent_objects, num_child_objects = self.execute_action(
+                    objects, **self.get_execution_context()
+                )
             after_hook_result = self.__run_after_hooks(
                 self.action_type, request, objects
             )
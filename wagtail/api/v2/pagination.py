@@ -1,22 +1,35 @@
+import base64
+import binascii
+import json
 from collections import OrderedDict
 
 from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q, QuerySet
 from rest_framework.pagination import BasePagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 from .utils import BadRequestError
 
 
 class WagtailPagination(BasePagination):
-    def paginate_queryset(self, queryset, request, view=None):
-        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
+    """
+    Paginates listings with the ``offset`` and ``limit`` parameters, or, when the
+    ``cursor`` parameter is given, with keyset ("cursor") pagination.
 
-        try:
-            offset = int(request.GET.get("offset", 0))
-            if offset < 0:
-                raise ValueError()
-        except ValueError as e:
-            raise BadRequestError("offset must be a positive integer") from e
+    Cursor pagination filters the results on the ordering field and id of the last
+    item of the previous page rather than skipping over ``offset`` items, and
+    doesn't count the results, so each page takes the same time to fetch however
+    deep into the listing it is. The first page is requested with an empty
+    ``cursor`` parameter, and each page links to the next with ``meta.next``.
+    """
+
+    cursor_query_param = "cursor"
+
+    def get_limit(self, request):
+        limit_max = getattr(settings, "WAGTAILAPI_LIMIT_MAX", 20)
 
         try:
             limit_default = 20 if not limit_max else min(20, limit_max)
@@ -29,24 +42,153 @@ class WagtailPagination(BasePagination):
         if limit_max and limit > limit_max:
             raise BadRequestError("limit cannot be higher than %d" % limit_max)
 
+        return limit
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.view = view
+        self.request = request
+
+        self.use_cursor = self.cursor_query_param in request.GET
+        if self.use_cursor:
+            return self.paginate_queryset_by_cursor(queryset, request)
+
+        try:
+            offset = int(request.GET.get("offset", 0))
+            if offset < 0:
+                raise ValueError()
+        except ValueError as e:
+            raise BadRequestError("offset must be a positive integer") from e
+
+        limit = self.get_limit(request)
+
         start = offset
         stop = offset + limit
 
-        self.view = view
-        self.total_count = queryset.count()
+        # Reuse the count made by the view to generate the ETag of the listing
+        self.total_count = getattr(view, "listing_count", None)
+        if self.total_count is None:
+            self.total_count = queryset.count()
         return queryset[start:stop]
 
+    def get_cursor_ordering(self, queryset):
+        """
+        Return the field to paginate the queryset by (or ``None`` to paginate by id
+        alone), and whether the results are in descending order.
+        """
+        if not isinstance(queryset, QuerySet):
+            raise BadRequestError("cursor pagination cannot be used with search")
+
+        ordering = list(queryset.query.order_by)
+        if not ordering and queryset.query.default_ordering:
+            ordering = list(queryset.model._meta.ordering)
+
+        if not all(isinstance(order, str) for order in ordering):
+            raise BadRequestError("cursor pagination cannot be used with this ordering")
+
+        # The id is always used to order results with the same value
+        if ordering and ordering[-1].lstrip("-") in ("id", "pk"):
+            id_ordering = ordering.pop()
+            if not ordering:
+                return None, id_ordering.startswith("-")
+
+        if not ordering:
+            return None, False
+
+        if len(ordering) > 1:
+            raise BadRequestError(
+                "cursor pagination can only be used when ordering by a single field"
+            )
+
+        field_name = ordering[0].lstrip("-")
+        try:
+            field = queryset.model._meta.get_field(field_name)
+        except FieldDoesNotExist as e:
+            raise BadRequestError(
+                "cursor pagination cannot be used with this ordering"
+            ) from e
+
+        if field.is_relation or field.null:
+            raise BadRequestError(
+                "cursor pagination cannot be used when ordering by '%s'" % field_name
+            )
+
+        return field, ordering[0].startswith("-")
+
+    def decode_cursor(self, cursor, field):
+        try:
+            value, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if field is not None:
+                value = field.to_python(value)
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            TypeError,
+            ValidationError,
+        ) as e:
+            raise BadRequestError("cursor is invalid") from e
+
+        return value, pk
+
+    def encode_cursor(self, item, field):
+        # Serialise the value as the field does, as DjangoJSONEncoder would truncate
+        # datetimes to milliseconds
+        value = field.value_to_string(item) if field is not None else None
+        cursor = json.dumps([value, item.pk], cls=DjangoJSONEncoder)
+        return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+    def paginate_queryset_by_cursor(self, queryset, request):
+        if "offset" in request.GET:
+            raise BadRequestError("offset cannot be used with cursor pagination")
+
+        limit = self.get_limit(request)
+        field, descending = self.get_cursor_ordering(queryset)
+        prefix = "-" if descending else ""
+
+        if field is not None:
+            queryset = queryset.order_by(prefix + field.name, prefix + "pk")
+        else:
+            queryset = queryset.order_by(prefix + "pk")
+
+        cursor = request.GET[self.cursor_query_param]
+        if cursor:
+            value, pk = self.decode_cursor(cursor, field)
+            lookup = "lt" if descending else "gt"
+
+            after_cursor = Q(**{f"pk__{lookup}": pk})
+            if field is not None:
+                after_cursor = Q(**{f"{field.name}__{lookup}": value}) | (
+                    Q(**{field.name: value}) & after_cursor
+                )
+            queryset = queryset.filter(after_cursor)
+
+        # Fetch an extra item to find out whether there is another page
+        items = list(queryset[: limit + 1])
+        if limit and len(items) > limit:
+            items = items[:limit]
+            self.next_cursor = self.encode_cursor(items[-1], field)
+        else:
+            items = items[:limit]
+            self.next_cursor = None
+
+        return items
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
     def get_paginated_response(self, data):
+        if self.use_cursor:
+            meta = OrderedDict([("next", self.get_next_link())])
+        else:
+            meta = OrderedDict([("total_count", self.total_count)])
+
         data = OrderedDict(
             [
-                (
-                    "meta",
-                    OrderedDict(
-                        [
-                            ("total_count", self.total_count),
-                        ]
-                    ),
-                ),
+                ("meta", meta),
                 ("items", data),
             ]
         )
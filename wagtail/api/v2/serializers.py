@@ -1,3 +1,4 @@
+import copy
 from collections import OrderedDict
 
 from django.urls.exceptions import NoReverseMatch
@@ -63,7 +64,13 @@ class PageHtmlUrlField(Field):
         return instance
 
     def to_representation(self, page):
+        # Views serialising many pages may provide a PageURLResolver to share the
+        # work of finding their URLs
+        url_resolver = self.context.get("url_resolver")
+
         try:
+            if url_resolver is not None:
+                return url_resolver.get_full_url(page)
             return page.full_url
         except NoReverseMatch:
             return None
@@ -298,6 +305,15 @@ class BaseSerializer(serializers.ModelSerializer):
     type = TypeField(read_only=True)
     detail_url = DetailUrlField(read_only=True)
 
+    def get_fields(self):
+        # Introspecting the model to build the fields is relatively slow, so only do
+        # it once for each serializer class, and give each instance copies of them
+        cls = type(self)
+        if "_model_fields" not in cls.__dict__:
+            cls._model_fields = super().get_fields()
+
+        return copy.deepcopy(cls._model_fields)
+
     def to_representation(self, instance):
         data = OrderedDict()
         fields = [field for field in self.fields.values() if not field.write_only]
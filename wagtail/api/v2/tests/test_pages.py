@@ -1,4 +1,5 @@
 import collections
+import datetime
 import json
 from io import StringIO
 from unittest import mock
@@ -6,14 +7,17 @@ from unittest import mock
 from django.contrib.auth.models import Group
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
+from django.db import connection
 from django.test import TestCase, TransactionTestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework.test import APIClient
 
-from wagtail.api.v2 import signal_handlers
+from wagtail.api.v2 import signal_handlers, views
+from wagtail.api.v2.serializers import get_serializer_class
 from wagtail.api.v2.views import PagesAPIViewSet
-from wagtail.models import Locale, Page, Site
+from wagtail.models import Locale, Page, PageViewRestriction, Site
 from wagtail.models.view_restrictions import BaseViewRestriction
 from wagtail.test.demosite import models
 from wagtail.test.testapp.models import StreamPage
@@ -140,6 +144,86 @@ class TestPageListing(WagtailTestUtils, TestCase):
         ]
         self.assertEqual(new_total_count, old_total_count)
 
+    def test_private_pages_with_user_not_in_groups(self):
+        client = APIClient()
+        user = self.create_user(username="alice", password="password")
+        page = models.BlogIndexPage.objects.get(id=5)
+        page_restriction_instance = page.view_restrictions.create(
+            restriction_type="groups"
+        )
+        page_restriction_instance.groups.add(Group.objects.get(name="Editors"))
+        client.force_authenticate(user)
+
+        response = client.get(reverse("wagtailapi_v2:pages:listing"))
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], get_total_page_count())
+        self.assertNotIn(5, self.get_page_id_list(content))
+
+    def test_private_pages_with_passed_password(self):
+        old_total_count = get_total_page_count()
+        page = models.BlogIndexPage.objects.get(id=5)
+        restriction = page.view_restrictions.create(
+            restriction_type=BaseViewRestriction.PASSWORD, password="test"
+        )
+        session = self.client.session
+        session[restriction.passed_view_restrictions_session_key] = [restriction.id]
+        session.save()
+
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], old_total_count)
+
+    def test_private_pages_restrictions_cache_is_cleared(self):
+        old_total_count = get_total_page_count()
+        page = models.BlogIndexPage.objects.get(id=5)
+        restriction = page.view_restrictions.create(restriction_type="groups")
+
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertLess(content["meta"]["total_count"], old_total_count)
+
+        # Anonymous users can't be in the group, so the restriction still applies
+        restriction.groups.add(Group.objects.get(name="Editors"))
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertLess(content["meta"]["total_count"], old_total_count)
+
+        restriction.restriction_type = BaseViewRestriction.NONE
+        restriction.save()
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], old_total_count)
+
+        restriction.restriction_type = "login"
+        restriction.save()
+        restriction.delete()
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], old_total_count)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            }
+        }
+    )
+    def test_private_pages_query_count_is_independent_of_restrictions(self):
+        self.addCleanup(PageViewRestriction.clear_cached_restrictions)
+        for page in models.BlogEntryPage.objects.all():
+            page.view_restrictions.create(restriction_type="login")
+        self.get_response()
+
+        with self.assertNumQueries(0):
+            rejected_ids = PageViewRestriction.get_rejected_restriction_ids(
+                mock.Mock(user=mock.Mock(is_authenticated=False))
+            )
+        self.assertEqual(len(rejected_ids), models.BlogEntryPage.objects.count())
+
+        response = self.get_response()
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], get_total_page_count())
+
     def test_page_listing_with_missing_page_model(self):
         # Create a ContentType that doesn't correspond to a real model
         missing_page_content_type = ContentType.objects.create(
@@ -457,6 +541,32 @@ class TestPageListing(WagtailTestUtils, TestCase):
             self.assertEqual(set(page.keys()), {"id", "meta", "title", "related_links"})
             self.assertIsInstance(page["related_links"], list)
 
+    def test_serializer_classes_are_cached(self):
+        views._get_cached_serializer_class.cache_clear()
+
+        with mock.patch(
+            "wagtail.api.v2.views.get_serializer_class",
+            wraps=get_serializer_class,
+        ) as get_serializer_class_mock:
+            for _ in range(2):
+                response = self.get_response(
+                    type="demosite.BlogEntryPage",
+                    fields="title,feed_image(width),related_links",
+                )
+                self.assertEqual(response.status_code, 200)
+
+        # The serializers for the pages, images and related links are only built once
+        self.assertEqual(get_serializer_class_mock.call_count, 3)
+
+        # Changing the fields builds a new serializer for the pages only
+        response = self.get_response(
+            type="demosite.BlogEntryPage",
+            fields="title,feed_image(width)",
+        )
+        content = json.loads(response.content.decode("UTF-8"))
+        for page in content["items"]:
+            self.assertEqual(set(page.keys()), {"id", "meta", "title", "feed_image"})
+
     def test_fields_foreign_key(self):
         response = self.get_response(
             type="demosite.BlogEntryPage", fields="title,date,feed_image"
@@ -1084,6 +1194,108 @@ class TestPageListing(WagtailTestUtils, TestCase):
         self.assertEqual(response.status_code, 400)
         self.assertEqual(content, {"message": "offset must be a positive integer"})
 
+    # CURSOR PAGINATION
+
+    def get_all_pages_by_cursor(self, **params):
+        page_ids = []
+        response = self.get_response(cursor="", **params)
+        while True:
+            content = json.loads(response.content.decode("UTF-8"))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(set(content["meta"].keys()), {"next"})
+            page_ids.extend(self.get_page_id_list(content))
+            if content["meta"]["next"] is None:
+                return page_ids
+            response = self.client.get(content["meta"]["next"])
+
+    @override_settings(WAGTAILAPI_LIMIT_MAX=None)
+    def test_cursor(self):
+        response = self.get_response(limit=100)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(
+            self.get_all_pages_by_cursor(limit=3), self.get_page_id_list(content)
+        )
+
+    @override_settings(WAGTAILAPI_LIMIT_MAX=None)
+    def test_cursor_with_order(self):
+        response = self.get_response(order="-title", limit=100)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        page_ids = self.get_all_pages_by_cursor(order="-title", limit=2)
+        self.assertEqual(sorted(page_ids), sorted(self.get_page_id_list(content)))
+
+        titles = dict(Page.objects.values_list("id", "title"))
+        self.assertEqual(
+            [titles[page_id] for page_id in page_ids],
+            sorted((titles[page_id] for page_id in page_ids), reverse=True),
+        )
+
+    def test_cursor_with_filter(self):
+        response = self.get_response(type="demosite.BlogEntryPage", cursor="", limit=2)
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(len(content["items"]), 2)
+        self.assertIn("type=demosite.BlogEntryPage", content["meta"]["next"])
+
+        response = self.client.get(content["meta"]["next"])
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(len(content["items"]), 1)
+        self.assertIsNone(content["meta"]["next"])
+
+    def test_cursor_query_count_is_independent_of_position(self):
+        query_counts = []
+        response = self.get_response(cursor="", limit=2, fields="_")
+        while True:
+            content = json.loads(response.content.decode("UTF-8"))
+            if content["meta"]["next"] is None:
+                break
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.get(content["meta"]["next"])
+            query_counts.append(len(queries))
+
+        self.assertGreater(len(query_counts), 2)
+        self.assertEqual(len(set(query_counts)), 1)
+
+    def test_cursor_with_offset_gives_error(self):
+        response = self.get_response(cursor="", offset=10)
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content, {"message": "offset cannot be used with cursor pagination"}
+        )
+
+    def test_invalid_cursor_gives_error(self):
+        response = self.get_response(cursor="abc")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "cursor is invalid"})
+
+    def test_cursor_with_nullable_order_field_gives_error(self):
+        response = self.get_response(cursor="", order="first_published_at")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content,
+            {
+                "message": "cursor pagination cannot be used when ordering by 'first_published_at'"
+            },
+        )
+
+    def test_cursor_with_multiple_order_fields_gives_error(self):
+        response = self.get_response(cursor="", order="title,slug")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            content,
+            {
+                "message": "cursor pagination can only be used when ordering by a single field"
+            },
+        )
+
     # REGRESSION TESTS
 
     def test_issue_3967(self):
@@ -1792,6 +2004,248 @@ class TestPageFind(TestCase):
         self.assertEqual(content, {"message": "not found"})
 
 
+class TestPageExport(TestCase):
+    fixtures = ["demosite.json"]
+
+    def get_response(self, **params):
+        return self.client.get(reverse("wagtailapi_v2:pages:export"), params)
+
+    def get_lines(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        content = b"".join(response.streaming_content).decode("UTF-8")
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_export(self):
+        lines = self.get_lines(self.get_response())
+
+        listing_response = self.client.get(
+            reverse("wagtailapi_v2:pages:listing"), {"limit": 20}
+        )
+        listing_content = json.loads(listing_response.content.decode("UTF-8"))
+        self.assertEqual(len(lines), get_total_page_count())
+        self.assertEqual(
+            [line["id"] for line in lines][:20],
+            [page["id"] for page in listing_content["items"]],
+        )
+
+        for line in lines:
+            self.assertEqual(set(line.keys()), {"id", "meta", "title"})
+            self.assertEqual(
+                set(line["meta"].keys()),
+                {"type", "detail_url", "html_url", "slug", "first_published_at"},
+            )
+
+    def test_export_all_fields_of_each_page_type(self):
+        lines = self.get_lines(self.get_response(fields="*"))
+
+        blog_entries = [
+            line for line in lines if line["meta"]["type"] == "demosite.BlogEntryPage"
+        ]
+        self.assertEqual(len(blog_entries), 3)
+        for line in blog_entries:
+            self.assertIn("body", line)
+            self.assertIn("tags", line)
+
+    def test_export_with_filters(self):
+        lines = self.get_lines(
+            self.get_response(type="demosite.BlogEntryPage", order="-title")
+        )
+
+        titles = [line["title"] for line in lines]
+        self.assertEqual(len(titles), 3)
+        self.assertEqual(titles, sorted(titles, reverse=True))
+
+    def test_export_excludes_private_pages(self):
+        page = models.BlogIndexPage.objects.get(id=5)
+        page.view_restrictions.create(restriction_type="login")
+
+        lines = self.get_lines(self.get_response())
+
+        self.assertEqual(len(lines), get_total_page_count())
+        self.assertNotIn(5, [line["id"] for line in lines])
+
+    def test_export_unknown_field_gives_error(self):
+        response = self.get_response(fields="title,foo")
+        content = json.loads(response.content.decode("UTF-8"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(content, {"message": "unknown fields: foo"})
+
+    def test_export_rejects_pagination_parameters(self):
+        for params in [{"limit": 10}, {"offset": 10}, {"cursor": ""}]:
+            with self.subTest(params=params):
+                response = self.get_response(**params)
+                content = json.loads(response.content.decode("UTF-8"))
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    content,
+                    {
+                        "message": "pagination is not supported by the export view: %s"
+                        % next(iter(params))
+                    },
+                )
+
+    def test_export_in_chunks(self):
+        with mock.patch.object(PagesAPIViewSet, "export_chunk_size", 2):
+            lines = self.get_lines(self.get_response())
+
+        self.assertEqual(len(lines), get_total_page_count())
+
+
+class TestPageConditionalRequests(TestCase):
+    fixtures = ["demosite.json"]
+
+    def setUp(self):
+        self.page = Page.objects.get(id=16)
+        self.page.last_published_at = datetime.datetime(
+            2026, 1, 1, 12, 0, tzinfo=datetime.timezone.utc
+        )
+        self.page.save(update_fields=["last_published_at"])
+
+    def get_listing_response(self, headers=None, **params):
+        return self.client.get(
+            reverse("wagtailapi_v2:pages:listing"), params, headers=headers
+        )
+
+    def get_detail_response(self, page_id, headers=None, **params):
+        return self.client.get(
+            reverse("wagtailapi_v2:pages:detail", args=(page_id,)),
+            params,
+            headers=headers,
+        )
+
+    def test_listing_not_modified(self):
+        response = self.get_listing_response()
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)
+        etag = response["ETag"]
+
+        with mock.patch.object(PagesAPIViewSet, "get_serializer") as get_serializer:
+            response = self.get_listing_response(headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+        get_serializer.assert_not_called()
+
+    def test_listing_etag_changes_with_parameters(self):
+        etag = self.get_listing_response()["ETag"]
+
+        self.assertNotEqual(self.get_listing_response(limit=5)["ETag"], etag)
+        self.assertNotEqual(self.get_listing_response(fields="*")["ETag"], etag)
+
+    def test_listing_etag_changes_on_publish(self):
+        etag = self.get_listing_response()["ETag"]
+
+        self.page.last_published_at = timezone.now()
+        self.page.save(update_fields=["last_published_at"])
+
+        response = self.get_listing_response(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_listing_etag_changes_on_unpublish(self):
+        etag = self.get_listing_response()["ETag"]
+
+        Page.objects.filter(id=4).update(live=False)
+
+        response = self.get_listing_response(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_listing_etag_changes_on_move(self):
+        etag = self.get_listing_response()["ETag"]
+
+        # Moving the page changes its html_url and position in the listing
+        self.page.move(Page.objects.get(id=2), pos="last-child")
+
+        response = self.get_listing_response(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_listing_is_counted_once(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_listing_response()
+
+        self.assertEqual(response.status_code, 200)
+        content = json.loads(response.content.decode("UTF-8"))
+        self.assertEqual(content["meta"]["total_count"], get_total_page_count())
+        page_count_queries = [
+            query["sql"]
+            for query in queries.captured_queries
+            if "COUNT(" in query["sql"].upper() and "wagtailcore_page" in query["sql"]
+        ]
+        self.assertEqual(len(page_count_queries), 1)
+
+    def test_listing_etag_changes_with_view_restrictions(self):
+        etag = self.get_listing_response()["ETag"]
+
+        PageViewRestriction.objects.create(
+            page=self.page, restriction_type=BaseViewRestriction.LOGIN
+        )
+
+        response = self.get_listing_response(headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_cursor_listing_has_no_etag(self):
+        # The listing isn't counted, so that each page takes the same time to fetch
+        with CaptureQueriesContext(connection) as queries:
+            response = self.get_listing_response(cursor="", limit=2)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+        self.assertFalse(
+            any("MAX(" in query["sql"].upper() for query in queries.captured_queries)
+        )
+
+    def test_search_listing_has_no_etag(self):
+        response = self.get_listing_response(search="blog")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("ETag", response)
+
+    def test_detail_not_modified(self):
+        response = self.get_detail_response(16)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Last-Modified"], "Thu, 01 Jan 2026 12:00:00 GMT")
+        etag = response["ETag"]
+
+        with mock.patch.object(PagesAPIViewSet, "get_serializer") as get_serializer:
+            response = self.get_detail_response(16, headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        get_serializer.assert_not_called()
+
+    def test_detail_not_modified_since(self):
+        response = self.get_detail_response(
+            16, headers={"If-Modified-Since": "Thu, 01 Jan 2026 12:00:00 GMT"}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = self.get_detail_response(
+            16, headers={"If-Modified-Since": "Thu, 01 Jan 2026 11:59:59 GMT"}
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_detail_etag_changes_on_move(self):
+        etag = self.get_detail_response(16)["ETag"]
+
+        self.page.move(Page.objects.get(id=2), pos="last-child")
+
+        response = self.get_detail_response(16, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_detail_etag_changes_with_fields(self):
+        etag = self.get_detail_response(16)["ETag"]
+
+        self.assertNotEqual(self.get_detail_response(16, fields="_,id")["ETag"], etag)
+
+
 class TestPageDetailWithStreamField(TestCase):
     fixtures = ["test.json"]
 
@@ -1802,6 +2256,37 @@ class TestPageDetailWithStreamField(TestCase):
         stream_page = StreamPage(title="stream page", slug="stream-page", body=body)
         return self.homepage.add_child(instance=stream_page)
 
+    def test_export_prefetches_streamfield_blocks(self):
+        body = '[{"type": "image", "value": 1}, {"type": "text", "value": "foo"}]'
+        self.make_stream_page(body)
+
+        def export():
+            response = self.client.get(
+                reverse("wagtailapi_v2:pages:export"),
+                {"type": "tests.StreamPage", "fields": "body"},
+            )
+            with CaptureQueriesContext(connection) as queries:
+                content = b"".join(response.streaming_content).decode("UTF-8")
+            return [json.loads(line) for line in content.splitlines()], len(queries)
+
+        lines, _ = export()
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["body"][0]["type"], "image")
+        self.assertEqual(lines[0]["body"][0]["value"], 1)
+
+        # Export again now that the site root paths are cached
+        lines, query_count = export()
+
+        for i in range(3):
+            stream_page = StreamPage(
+                title="stream page", slug="stream-page-%d" % i, body=body
+            )
+            self.homepage.add_child(instance=stream_page)
+
+        lines, more_pages_query_count = export()
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(more_pages_query_count, query_count)
+
     def test_can_fetch_streamfield_content(self):
         stream_page = self.make_stream_page('[{"type": "text", "value": "foo"}]')
 
@@ -1870,7 +2355,7 @@ class TestPageDetailWithStreamField(TestCase):
     },
     WAGTAILAPI_BASE_URL="http://api.example.com",
 )
-@mock.patch("wagtail.contrib.frontend_cache.backends.http.HTTPBackend.purge")
+@mock.patch("wagtail.contrib.frontend_cache.backends.http.HTTPBackend.purge_batch")
 class TestPageCacheInvalidation(TestCase):
     fixtures = ["demosite.json"]
 
@@ -1884,29 +2369,37 @@ class TestPageCacheInvalidation(TestCase):
         super().tearDownClass()
         signal_handlers.unregister_signal_handlers()
 
-    def test_republish_page_purges(self, purge):
+    def assertPurged(self, purge_batch, url):
+        purged_urls = [
+            purged_url
+            for call in purge_batch.call_args_list
+            for purged_url in call.args[0]
+        ]
+        self.assertIn(url, purged_urls)
+
+    def test_republish_page_purges(self, purge_batch):
         with self.captureOnCommitCallbacks(execute=True):
             Page.objects.get(id=2).specific.save_revision().publish()
 
-        purge.assert_any_call("http://api.example.com/api/main/pages/2/")
+        self.assertPurged(purge_batch, "http://api.example.com/api/main/pages/2/")
 
-    def test_unpublish_page_purges(self, purge):
+    def test_unpublish_page_purges(self, purge_batch):
         with self.captureOnCommitCallbacks(execute=True):
             Page.objects.get(id=2).unpublish()
 
-        purge.assert_any_call("http://api.example.com/api/main/pages/2/")
+        self.assertPurged(purge_batch, "http://api.example.com/api/main/pages/2/")
 
-    def test_delete_page_purges(self, purge):
+    def test_delete_page_purges(self, purge_batch):
         with self.captureOnCommitCallbacks(execute=True):
             Page.objects.get(id=16).delete()
 
-        purge.assert_any_call("http://api.example.com/api/main/pages/16/")
+        self.assertPurged(purge_batch, "http://api.example.com/api/main/pages/16/")
 
-    def test_save_draft_doesnt_purge(self, purge):
+    def test_save_draft_doesnt_purge(self, purge_batch):
         with self.captureOnCommitCallbacks(execute=True):
             Page.objects.get(id=2).specific.save_revision()
 
-        purge.assert_not_called()
+        purge_batch.assert_not_called()
 
 
 class TestPageViewSetSubclassing(PagesAPIViewSet):
@@ -1,20 +1,32 @@
 from collections import OrderedDict
+from functools import lru_cache
 
 from django.apps import apps
 from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import FieldDoesNotExist
-from django.http import Http404
+from django.core.signals import setting_changed
+from django.db.models import Count, Max, QuerySet
+from django.dispatch import receiver
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import redirect
 from django.urls import path, reverse
+from django.utils.cache import get_conditional_response
+from django.utils.encoding import force_bytes
 from django.utils.functional import classproperty
+from django.utils.http import http_date, quote_etag
 from modelcluster.fields import ParentalKey
 from rest_framework import status
 from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
 from rest_framework.response import Response
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.viewsets import GenericViewSet
 
 from wagtail.api import APIField
+from wagtail.coreutils import safe_md5
+from wagtail.fields import StreamField
 from wagtail.models import Page, PageViewRestriction, Site
+from wagtail.url_routing import PageURLResolver, route_cache
 
 from .filters import (
     AncestorOfFilter,
@@ -36,6 +48,37 @@ from .utils import (
 )
 
 
+def _freeze_fields_config(fields_config):
+    # Convert a fields config from parse_fields_parameter into nested tuples, so
+    # that it can be used as a cache key
+    return tuple(
+        (
+            field_name,
+            negated,
+            _freeze_fields_config(sub_fields) if sub_fields is not None else None,
+        )
+        for field_name, negated, sub_fields in fields_config
+    )
+
+
+@lru_cache(maxsize=1000)
+def _get_cached_serializer_class(
+    viewset_class, router, model, fields_config, show_details=False, nested=False
+):
+    return viewset_class._get_serializer_class(
+        router, model, fields_config, show_details=show_details, nested=nested
+    )
+
+
+@receiver(setting_changed)
+def reset_serializer_class_cache(**kwargs):
+    """
+    Clear the serializer class cache when settings are changed, as the default fields
+    of the endpoints may depend on them (such as WAGTAIL_I18N_ENABLED)
+    """
+    _get_cached_serializer_class.cache_clear()
+
+
 class BaseAPIViewSet(GenericViewSet):
     @classproperty
     def renderer_classes(cls):
@@ -57,6 +100,7 @@ class BaseAPIViewSet(GenericViewSet):
         [
             "limit",
             "offset",
+            "cursor",
             "fields",
             "order",
             "search",
@@ -75,6 +119,12 @@ class BaseAPIViewSet(GenericViewSet):
     detail_only_fields = []
     name = None  # Set on subclass.
 
+    # The model field that records when an object was last changed. If set, the
+    # listing and detail views send ETag and Last-Modified headers generated from it,
+    # and answer conditional requests for unchanged responses with "304 Not Modified"
+    # without serialising them
+    last_modified_field = None
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
@@ -84,6 +134,10 @@ class BaseAPIViewSet(GenericViewSet):
         # summary of the used types to the response.
         self.seen_types = OrderedDict()
 
+        # The number of objects in the listing, if it has already been counted to
+        # generate its ETag, so that the paginator doesn't count them again
+        self.listing_count = None
+
     def get_queryset(self):
         return self.model.objects.all().order_by("id")
 
@@ -91,14 +145,26 @@ class BaseAPIViewSet(GenericViewSet):
         queryset = self.get_queryset()
         self.check_query_parameters(queryset)
         queryset = self.filter_queryset(queryset)
-        queryset = self.paginate_queryset(queryset)
-        serializer = self.get_serializer(queryset, many=True)
-        return self.get_paginated_response(serializer.data)
+
+        etag, last_modified = self.get_listing_validators(queryset)
+        response = self.get_conditional_response(etag, last_modified)
+        if response is None:
+            queryset = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(queryset, many=True)
+            response = self.get_paginated_response(serializer.data)
+
+        return self.set_validator_headers(response, etag, last_modified)
 
     def detail_view(self, request, pk):
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return Response(serializer.data)
+
+        etag, last_modified = self.get_object_validators(instance)
+        response = self.get_conditional_response(etag, last_modified)
+        if response is None:
+            serializer = self.get_serializer(instance)
+            response = Response(serializer.data)
+
+        return self.set_validator_headers(response, etag, last_modified)
 
     def find_view(self, request):
         queryset = self.get_queryset()
@@ -132,6 +198,96 @@ class BaseAPIViewSet(GenericViewSet):
 
         return redirect(f"{url}?{query.urlencode()}")
 
+    def get_etag_components(self):
+        """
+        The values, other than the state of the objects, that the response to the
+        current request depends on, and that its ETag is generated from.
+        """
+        return [self.request.build_absolute_uri(), self.request.accepted_media_type]
+
+    def get_etag(self, components):
+        """
+        Returns a strong ETag for the response to the current request, generated
+        from the given values identifying the state of the objects in it.
+        """
+        hasher = safe_md5(usedforsecurity=False)
+
+        for component in self.get_etag_components() + list(components):
+            hasher.update(force_bytes(component))
+
+        return quote_etag(hasher.hexdigest())
+
+    def get_object_etag_components(self, instance):
+        return [instance.pk, getattr(instance, self.last_modified_field)]
+
+    def get_object_validators(self, instance):
+        """
+        Returns the ETag and last modified time of the detail view of the given
+        object, or ``(None, None)`` if conditional requests aren't supported.
+        """
+        if self.last_modified_field is None:
+            return None, None
+
+        return (
+            self.get_etag(self.get_object_etag_components(instance)),
+            getattr(instance, self.last_modified_field),
+        )
+
+    def get_listing_validators(self, queryset):
+        """
+        Returns the ETag and last modified time of the listing of the given queryset,
+        or ``(None, None)`` if conditional requests aren't supported.
+
+        The ETag is generated from the latest modification time and the number of
+        objects in the queryset, which are fetched with a single query (the count is
+        also reused for the ``total_count`` of the listing). This isn't done for
+        cursor pagination, which avoids counting the whole listing so that each page
+        takes the same time to fetch.
+        """
+        # Search results can't be aggregated
+        if self.last_modified_field is None or not isinstance(queryset, QuerySet):
+            return None, None
+
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        if cursor_query_param in self.request.GET:
+            return None, None
+
+        aggregates = queryset.order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count("pk")
+        )
+        self.listing_count = aggregates["count"]
+
+        # The latest modification time isn't sent as the Last-Modified header, as it
+        # stays the same when objects are removed from the listing
+        return self.get_etag(self.get_listing_etag_components(aggregates)), None
+
+    def get_listing_etag_components(self, aggregates):
+        return [aggregates["last_modified"], aggregates["count"]]
+
+    def get_conditional_response(self, etag, last_modified):
+        """
+        Returns a "304 Not Modified" (or "412 Precondition Failed") response if the
+        conditional headers of the request match the given ETag and last modified
+        time, or ``None`` if the response should be generated.
+        """
+        if etag is None and last_modified is None:
+            return None
+
+        return get_conditional_response(
+            self.request,
+            etag=etag,
+            last_modified=int(last_modified.timestamp()) if last_modified else None,
+        )
+
+    def set_validator_headers(self, response, etag, last_modified):
+        if etag is not None:
+            response.headers.setdefault("ETag", etag)
+        if last_modified is not None:
+            response.headers.setdefault(
+                "Last-Modified", http_date(last_modified.timestamp())
+            )
+        return response
+
     def find_object(self, queryset, request):
         """
         Override this to implement more find methods.
@@ -322,10 +478,12 @@ class BaseAPIViewSet(GenericViewSet):
                 child_endpoint_class = (
                     child_endpoint_class[1] if child_endpoint_class else BaseAPIViewSet
                 )
-                child_serializer_classes[field_name] = (
-                    child_endpoint_class._get_serializer_class(
-                        router, child_model, child_sub_fields, nested=True
-                    )
+                child_serializer_classes[field_name] = _get_cached_serializer_class(
+                    child_endpoint_class,
+                    router,
+                    child_model,
+                    _freeze_fields_config(child_sub_fields),
+                    nested=True,
                 )
 
             else:
@@ -352,24 +510,28 @@ class BaseAPIViewSet(GenericViewSet):
             base=cls.base_serializer_class,
         )
 
-    def get_serializer_class(self):
-        request = self.request
+    def get_fields_config(self):
+        """
+        Parse the ?fields= parameter of the request into a fields config, as passed
+        to ``_get_serializer_class``.
+        """
+        if "fields" in self.request.GET:
+            try:
+                return parse_fields_parameter(self.request.GET["fields"])
+            except ValueError as e:
+                raise BadRequestError("fields error: %s" % str(e)) from e
 
+        # Use default fields
+        return []
+
+    def get_serializer_class(self):
         # Get model
         if self.action == "listing_view":
             model = self.get_queryset().model
         else:
             model = type(self.get_object())
 
-        # Fields
-        if "fields" in request.GET:
-            try:
-                fields_config = parse_fields_parameter(request.GET["fields"])
-            except ValueError as e:
-                raise BadRequestError("fields error: %s" % str(e)) from e
-        else:
-            # Use default fields
-            fields_config = []
+        fields_config = self.get_fields_config()
 
         # Allow "detail_only" (eg parent) fields on detail view
         if self.action == "listing_view":
@@ -377,10 +539,14 @@ class BaseAPIViewSet(GenericViewSet):
         else:
             show_details = True
 
-        return self._get_serializer_class(
+        # Serializer classes are cached for each combination of endpoint, model and
+        # fields, so that they are only built (and introspected by Django REST
+        # framework) once
+        return _get_cached_serializer_class(
+            type(self),
             self.request.wagtailapi_router,
             model,
-            fields_config,
+            _freeze_fields_config(fields_config),
             show_details=show_details,
         )
 
@@ -483,6 +649,10 @@ class PagesAPIViewSet(BaseAPIViewSet):
     detail_only_fields = ["parent"]
     name = "pages"
     model = Page
+    last_modified_field = "last_published_at"
+
+    # The number of pages to fetch at a time in the export view
+    export_chunk_size = 100
 
     @classmethod
     def get_detail_default_fields(cls, model):
@@ -523,16 +693,15 @@ class PagesAPIViewSet(BaseAPIViewSet):
         # Get all live pages
         queryset = Page.objects.all().live()
 
-        # Exclude pages that the user doesn't have access to
-        restricted_pages = [
-            restriction.page
-            for restriction in PageViewRestriction.objects.all().select_related("page")
-            if not restriction.accept_request(self.request)
-        ]
-
-        # Exclude the restricted pages and their descendants from the queryset
-        for restricted_page in restricted_pages:
-            queryset = queryset.not_descendant_of(restricted_page, inclusive=True)
+        # Exclude pages that the user doesn't have access to, along with their
+        # descendants
+        rejected_restriction_ids = PageViewRestriction.get_rejected_restriction_ids(
+            self.request
+        )
+        if rejected_restriction_ids:
+            queryset = queryset.exclude(
+                queryset.view_restricted_q(rejected_restriction_ids)
+            )
 
         # Check if we have a specific site to look for
         if "site" in request.GET:
@@ -604,6 +773,35 @@ class PagesAPIViewSet(BaseAPIViewSet):
         base = super().get_object()
         return base.specific
 
+    def get_etag_components(self):
+        # The pages that can be seen depend on the view restrictions the request
+        # passes
+        return super().get_etag_components() + [
+            PageViewRestriction.get_rejected_restriction_ids(self.request)
+        ]
+
+    def get_object_etag_components(self, instance):
+        # Unlike last_published_at, the cache key also changes when the page is moved
+        return [instance.cache_key]
+
+    def get_listing_etag_components(self, aggregates):
+        # The page tree version changes when pages are moved or reordered, which
+        # changes the URLs and order of pages without changing the aggregates
+        return super().get_listing_etag_components(aggregates) + [
+            route_cache.get_version()
+        ]
+
+    @classmethod
+    def get_urlpatterns(cls):
+        """
+        This returns a list of URL patterns for the endpoint
+        """
+        urlpatterns = super().get_urlpatterns()
+        urlpatterns.append(
+            path("export/", cls.as_view({"get": "export_view"}), name="export")
+        )
+        return urlpatterns
+
     def find_object(self, queryset, request):
         site = Site.find_for_request(request)
         if "html_path" in request.GET and site is not None:
@@ -627,3 +825,81 @@ class PagesAPIViewSet(BaseAPIViewSet):
         context = super().get_serializer_context()
         context["base_queryset"] = self.get_base_queryset()
         return context
+
+    def export_view(self, request):
+        """
+        Streams all of the pages of the listing (with the same filters and ordering)
+        as newline-delimited JSON, one page per line.
+
+        Unlike the listing, each page is serialised as its specific type, so that
+        ``?fields=*`` includes all of the fields of each page type. Pages are fetched
+        in chunks with their StreamField blocks prefetched, so the memory used
+        doesn't grow with the number of pages.
+        """
+        cursor_query_param = getattr(self.paginator, "cursor_query_param", None)
+        pagination_parameters = {"limit", "offset", cursor_query_param}
+        unsupported_parameters = pagination_parameters.intersection(request.GET)
+        if unsupported_parameters:
+            raise BadRequestError(
+                "pagination is not supported by the export view: %s"
+                % ", ".join(sorted(unsupported_parameters))
+            )
+
+        queryset = self.get_queryset()
+        self.check_query_parameters(queryset)
+        queryset = self.filter_queryset(queryset)
+        if not isinstance(queryset, QuerySet):
+            raise BadRequestError("search is not supported by the export view")
+
+        router = request.wagtailapi_router
+        fields_config = _freeze_fields_config(self.get_fields_config())
+
+        # Check the fields before starting the response, so that errors can still be
+        # reported with a 400 response
+        _get_cached_serializer_class(type(self), router, queryset.model, fields_config)
+        stream_field_names = self.get_export_stream_field_names(
+            queryset, router, fields_config
+        )
+
+        queryset = queryset.specific().prefetch_stream_blocks(*stream_field_names)
+        return StreamingHttpResponse(
+            self.iter_export_lines(queryset, router, fields_config),
+            content_type="application/x-ndjson",
+        )
+
+    def get_export_stream_field_names(self, queryset, router, fields_config):
+        """
+        Returns the names of the StreamFields that are serialised for any of the page
+        types in the queryset, so that their blocks can be prefetched for each chunk.
+        """
+        content_type_ids = (
+            queryset.order_by().values_list("content_type", flat=True).distinct()
+        )
+        stream_field_names = set()
+        for content_type_id in content_type_ids:
+            model = (
+                ContentType.objects.get_for_id(content_type_id).model_class()
+                or queryset.model
+            )
+            serializer_class = _get_cached_serializer_class(
+                type(self), router, model, fields_config
+            )
+            stream_field_names.update(
+                field.name
+                for field in model._meta.fields
+                if isinstance(field, StreamField)
+                and field.name in serializer_class.Meta.fields
+            )
+        return sorted(stream_field_names)
+
+    def iter_export_lines(self, queryset, router, fields_config):
+        context = self.get_serializer_context()
+        context["url_resolver"] = PageURLResolver()
+        encoder = JSONEncoder()
+
+        for page in queryset.iterator(chunk_size=self.export_chunk_size):
+            serializer_class = _get_cached_serializer_class(
+                type(self), router, type(page), fields_config
+            )
+            serializer = serializer_class(page, context=context)
+            yield encoder.encode(serializer.data) + "\n"
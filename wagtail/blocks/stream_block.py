@@ -730,6 +730,41 @@ class StreamValue(MutableSequence):
                 child_block, value, id=self._raw_data[i].get("id")
             )
 
+    @classmethod
+    def bulk_prefetch_blocks(cls, stream_values):
+        """
+        Populate _bound_blocks for all of the given StreamValues at once, so that the raw
+        values of each block type are converted with a single call to the block's
+        bulk_to_python method across all streams, rather than one call per stream. For chooser
+        blocks, this means one database query per block type, however many streams there are.
+        """
+        # map id(child_block) => (child_block, [(stream_value, index), ...], [raw_value, ...])
+        pending = {}
+        for stream_value in stream_values:
+            if not stream_value.is_lazy:
+                continue
+            for i, raw_item in enumerate(stream_value._raw_data):
+                if stream_value._bound_blocks[i] is not None:
+                    continue
+                child_block = stream_value.stream_block.child_blocks.get(
+                    raw_item["type"]
+                )
+                if child_block is None:
+                    # leave blocks with an unrecognised type to be handled as normal
+                    continue
+                _, positions, raw_values = pending.setdefault(
+                    id(child_block), (child_block, [], [])
+                )
+                positions.append((stream_value, i))
+                raw_values.append(raw_item["value"])
+
+        for child_block, positions, raw_values in pending.values():
+            converted_values = child_block.bulk_to_python(raw_values)
+            for (stream_value, i), value in zip(positions, converted_values):
+                stream_value._bound_blocks[i] = StreamValue.StreamChild(
+                    child_block, value, id=stream_value._raw_data[i].get("id")
+                )
+
     def get_prep_value(self):
         prep_value = []
 
@@ -8,11 +8,30 @@ logger = logging.getLogger("wagtail.frontendcache")
 __all__ = ["BaseBackend"]
 
 
+def is_retryable_status(status_code):
+    """
+    Whether a purge request that failed with the given HTTP status code (a rate
+    limit or server error) should be retried.
+    """
+    return status_code == 429 or status_code >= 500
+
+
 class BaseBackend:
+    # The maximum number of URLs to pass to each purge_batch call, if limited
+    max_batch_size = None
+
     def __init__(self, params):
         # If unspecified, invalidate all hosts
         self.hostnames = params.get("HOSTNAMES", ["*"])
 
+        # The maximum number of purge requests to make per second, if limited
+        self.rate_limit = params.get("RATE_LIMIT")
+
+        # How many times to retry a failed purge request, and how many seconds to
+        # wait before the first retry (doubling for each further retry)
+        self.max_retries = params.get("MAX_RETRIES", 2)
+        self.retry_backoff = params.get("RETRY_BACKOFF", 1.0)
+
     def purge(self, url) -> None:
         raise NotImplementedError
 
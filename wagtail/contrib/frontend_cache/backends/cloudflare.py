@@ -3,7 +3,7 @@ import logging
 import requests
 from django.core.exceptions import ImproperlyConfigured
 
-from .base import BaseBackend
+from .base import BaseBackend, is_retryable_status
 
 logger = logging.getLogger("wagtail.frontendcache")
 
@@ -13,6 +13,7 @@ __all__ = ["CloudflareBackend"]
 
 class CloudflareBackend(BaseBackend):
     CHUNK_SIZE = 30
+    max_batch_size = CHUNK_SIZE
 
     def __init__(self, params):
         super().__init__(params)
@@ -70,6 +71,9 @@ class CloudflareBackend(BaseBackend):
                 headers=headers,
             )
 
+            if is_retryable_status(response.status_code):
+                response.raise_for_status()
+
             try:
                 response_json = response.json()
             except ValueError:
@@ -89,6 +93,9 @@ class CloudflareBackend(BaseBackend):
                     url,
                     e.response.status_code,
                 )
+            if is_retryable_status(e.response.status_code):
+                # Raise rate limit and server errors, so that the request is retried
+                raise
             return
 
         if response_json["success"] is False:
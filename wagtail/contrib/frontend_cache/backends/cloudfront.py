@@ -5,7 +5,7 @@ from urllib.parse import urlparse
 
 from django.core.exceptions import ImproperlyConfigured
 
-from .base import BaseBackend
+from .base import BaseBackend, is_retryable_status
 
 logger = logging.getLogger("wagtail.frontendcache")
 
@@ -13,7 +13,19 @@ logger = logging.getLogger("wagtail.frontendcache")
 __all__ = ["CloudfrontBackend"]
 
 
+# Errors that are returned when requests are made too quickly, or too many
+# invalidations are in progress
+RETRYABLE_ERROR_CODES = {
+    "Throttling",
+    "ThrottlingException",
+    "TooManyInvalidationsInProgress",
+}
+
+
 class CloudfrontBackend(BaseBackend):
+    # CloudFront allows up to 3,000 paths in invalidations in progress at a time
+    max_batch_size = 3000
+
     def __init__(self, params):
         import boto3
 
@@ -74,3 +86,10 @@ class CloudfrontBackend(BaseBackend):
                     e.response["Error"]["Code"],
                     e.response["Error"]["Message"],
                 )
+
+            status_code = e.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+            if e.response["Error"]["Code"] in RETRYABLE_ERROR_CODES or (
+                status_code is not None and is_retryable_status(status_code)
+            ):
+                # Raise throttling and server errors, so that the request is retried
+                raise
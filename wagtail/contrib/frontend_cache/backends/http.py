@@ -1,4 +1,8 @@
 import logging
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlsplit, urlunsplit
 from urllib.request import Request, urlopen
@@ -10,7 +14,7 @@ from .base import BaseBackend
 logger = logging.getLogger("wagtail.frontendcache")
 
 
-__all__ = ["PurgeRequest", "HTTPBackend"]
+__all__ = ["PurgeRequest", "PurgeResult", "HTTPBackend"]
 
 
 class PurgeRequest(Request):
@@ -18,47 +22,164 @@ class PurgeRequest(Request):
         return "PURGE"
 
 
+# The URLs that were purged from, and that couldn't be purged from, a cache node
+PurgeResult = namedtuple("PurgeResult", ["purged", "failed"])
+
+
 class HTTPBackend(BaseBackend):
     def __init__(self, params):
         super().__init__(params)
-        location_url_parsed = urlsplit(params.pop("LOCATION"))
-        self.cache_scheme = location_url_parsed.scheme
-        self.cache_netloc = location_url_parsed.netloc
+        locations = params.pop("LOCATION")
+        if isinstance(locations, str):
+            locations = [locations]
 
-    def purge(self, url):
-        url_parsed = urlsplit(url)
+        self.locations = []
+        for location in locations:
+            location_url_parsed = urlsplit(location)
+            self.locations.append(
+                (location_url_parsed.scheme, location_url_parsed.netloc)
+            )
+        self.cache_scheme, self.cache_netloc = self.locations[0]
+
+        # The maximum number of connections to keep open to each cache node when
+        # purging a batch of URLs
+        self.max_connections = params.get("MAX_CONNECTIONS", 4)
+        self.timeout = params.get("TIMEOUT")
+
+    def _get_host(self, url_parsed):
         host = url_parsed.hostname
 
         # Append port to host if it is set in the original URL
         if url_parsed.port:
             host += ":" + str(url_parsed.port)
 
-        request = PurgeRequest(
-            url=urlunsplit(
-                [
-                    self.cache_scheme,
-                    self.cache_netloc,
-                    url_parsed.path,
-                    url_parsed.query,
-                    url_parsed.fragment,
-                ]
-            ),
-            headers={
-                "Host": host,
-                "User-Agent": "Wagtail-frontendcache/" + __version__,
-            },
+        return host
+
+    def _get_headers(self, url_parsed):
+        return {
+            "Host": self._get_host(url_parsed),
+            "User-Agent": "Wagtail-frontendcache/" + __version__,
+        }
+
+    def get_purge_request(self, url):
+        """
+        Return the path (including the query string) and the headers of the PURGE
+        request sent to each cache node to purge the given URL.
+
+        Override this, rather than ``purge()``, to customise the requests, so that
+        batches of URLs are still purged concurrently.
+        """
+        url_parsed = urlsplit(url)
+        path = url_parsed.path or "/"
+        if url_parsed.query:
+            path += "?" + url_parsed.query
+        return path, self._get_headers(url_parsed)
+
+    def purge(self, url):
+        path, headers = self.get_purge_request(url)
+
+        for cache_scheme, cache_netloc in self.locations:
+            request = PurgeRequest(
+                url=urlunsplit([cache_scheme, cache_netloc, "", "", ""]) + path,
+                headers=headers,
+            )
+
+            try:
+                urlopen(request)
+            except HTTPError as e:
+                logger.error(
+                    "Couldn't purge '%s' from HTTP cache. HTTPError: %d %s",
+                    url,
+                    e.code,
+                    e.reason,
+                )
+            except URLError as e:
+                logger.error(
+                    "Couldn't purge '%s' from HTTP cache. URLError: %s", url, e.reason
+                )
+
+    def _create_connection(self, cache_scheme, cache_netloc):
+        connection_class = (
+            HTTPSConnection if cache_scheme == "https" else HTTPConnection
         )
+        kwargs = {"timeout": self.timeout} if self.timeout is not None else {}
+        return connection_class(cache_netloc, **kwargs)
 
+    def _purge_with_pool(self, pool, url):
+        path, headers = self.get_purge_request(url)
+
+        # Wait for one of the node's connections to be free, so that no more than
+        # MAX_CONNECTIONS requests are made to the node at once
+        connection = pool.get()
         try:
-            urlopen(request)
-        except HTTPError as e:
+            connection.request("PURGE", path, headers=headers)
+            response = connection.getresponse()
+            # Read the body so that the connection can be reused
+            response.read()
+        except (OSError, HTTPException) as e:
+            # Close the connection, to be reopened by the next request that uses it
+            connection.close()
             logger.error(
-                "Couldn't purge '%s' from HTTP cache. HTTPError: %d %s",
+                "Couldn't purge '%s' from HTTP cache at %s. %s: %s",
                 url,
-                e.code,
-                e.reason,
+                connection.host,
+                e.__class__.__name__,
+                e,
             )
-        except URLError as e:
+            return False
+        finally:
+            pool.put(connection)
+
+        if response.status >= 400:
             logger.error(
-                "Couldn't purge '%s' from HTTP cache. URLError: %s", url, e.reason
+                "Couldn't purge '%s' from HTTP cache at %s. HTTPError: %d %s",
+                url,
+                connection.host,
+                response.status,
+                response.reason,
             )
+            return False
+
+        return True
+
+    def purge_batch(self, urls):
+        """
+        Purge the given URLs from each cache node concurrently, reusing up to
+        MAX_CONNECTIONS keep-alive connections per node.
+
+        Returns a dict mapping each cache node location to a ``PurgeResult`` of
+        the URLs that were and were not purged from it.
+        """
+        if type(self).purge is not HTTPBackend.purge:
+            # Keep the behaviour of subclasses that customise purge()
+            return super().purge_batch(urls)
+
+        urls = list(urls)
+        pool_size = max(min(self.max_connections, len(urls)), 1)
+
+        # Each node gets its own pool of connections, with a worker thread for each
+        # connection, so that the requests to all of the nodes run in parallel
+        nodes = {}
+        for cache_scheme, cache_netloc in self.locations:
+            pool = queue.SimpleQueue()
+            for _ in range(pool_size):
+                pool.put(self._create_connection(cache_scheme, cache_netloc))
+            executor = ThreadPoolExecutor(max_workers=pool_size)
+            futures = [
+                executor.submit(self._purge_with_pool, pool, url) for url in urls
+            ]
+            nodes[f"{cache_scheme}://{cache_netloc}"] = (pool, executor, futures)
+
+        results = {}
+        for location, (pool, executor, futures) in nodes.items():
+            executor.shutdown()
+
+            purged, failed = [], []
+            for url, future in zip(urls, futures):
+                (purged if future.result() else failed).append(url)
+            results[location] = PurgeResult(purged, failed)
+
+            while not pool.empty():
+                pool.get().close()
+
+        return results
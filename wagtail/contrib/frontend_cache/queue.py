@@ -0,0 +1,258 @@
+import functools
+import json
+import logging
+import threading
+import time
+import weakref
+from collections import namedtuple
+from contextlib import contextmanager
+
+from asgiref.local import Local
+from django.db import transaction
+
+logger = logging.getLogger("wagtail.frontendcache")
+
+
+PurgeStats = namedtuple(
+    "PurgeStats", ["requests", "urls", "failures", "retries", "total_time", "max_time"]
+)
+
+
+class PurgeQueue:
+    """
+    Coalesces the URLs passed to ``purge_urls_from_cache`` and sends them to the
+    frontend cache backends in as few requests as their limits allow.
+
+    URLs added within a ``batch()`` block, or within a database transaction, are
+    deduplicated and purged by a single task when the block exits or the transaction
+    is committed, rather than by a task for each call. The task passes the URLs to
+    each backend in chunks of up to the backend's ``max_batch_size``, no faster than
+    its ``RATE_LIMIT`` (in requests per second), retrying failed requests with an
+    exponential backoff. The number of requests, failures and retries and the time
+    taken by the requests to each backend are recorded, and can be inspected with
+    ``get_stats()``.
+    """
+
+    def __init__(self):
+        self._local = Local()
+        self._lock = threading.Lock()
+        self._stats = {}
+        self._last_request_times = {}
+
+    def _get_pending(self):
+        try:
+            return self._local.pending
+        except AttributeError:
+            self._local.pending = {}
+            return self._local.pending
+
+    def _is_flush_scheduled(self):
+        # Only a weak reference to the callback is kept, so that it is gone once
+        # Django discards it when the transaction (or savepoint) it was registered
+        # in is rolled back
+        callback_ref = getattr(self._local, "flush_callback", None)
+        return callback_ref is not None and callback_ref() is not None
+
+    def _schedule_flush(self):
+        if self._is_flush_scheduled():
+            return
+
+        # Use a new callable for each transaction, so that a reference to it is only
+        # held by the transaction
+        callback = functools.partial(self.flush)
+        self._local.flush_callback = weakref.ref(callback)
+        # Runs immediately if there is no transaction
+        transaction.on_commit(callback)
+
+    def add(self, urls, backend_settings=None, backends=None):
+        """
+        Add URLs to be purged, once the current batch or transaction ends.
+        """
+        batching = getattr(self._local, "batching", False)
+        if not batching and not self._is_flush_scheduled():
+            # Discard any URLs left over from a rolled back transaction
+            self.clear()
+
+        key = (
+            json.dumps(backend_settings, sort_keys=True, default=str),
+            tuple(backends) if backends is not None else None,
+        )
+        pending = self._get_pending()
+        if key not in pending:
+            pending[key] = (backend_settings, backends, {})
+        # Use a dict as an ordered set, to deduplicate the URLs
+        pending[key][2].update(dict.fromkeys(urls))
+
+        if not batching:
+            self._schedule_flush()
+
+    @contextmanager
+    def batch(self):
+        """
+        A context manager that can be used to coalesce the URLs purged within it, so
+        that they are purged by a single task (enqueued on exit).
+
+        For example:
+
+        with purge_queue.batch():
+            for page in pages:
+                page.save_revision().publish()  # Purged once all pages are published
+        """
+        if getattr(self._local, "batching", False):
+            # Already batching; the outermost block will flush the queue
+            yield
+            return
+
+        if not self._is_flush_scheduled():
+            # Discard any URLs left over from a rolled back transaction
+            self.clear()
+
+        try:
+            self._local.batching = True
+            yield
+        finally:
+            self._local.batching = False
+            self._schedule_flush()
+
+    def flush(self):
+        """
+        Enqueue a task to purge the URLs added so far.
+        """
+        from .tasks import purge_urls_from_cache_task
+
+        pending = self._get_pending()
+        self._local.pending = {}
+        self._local.flush_callback = None
+        for backend_settings, backends, urls in pending.values():
+            if urls:
+                purge_urls_from_cache_task.enqueue(
+                    list(urls), backend_settings, backends
+                )
+
+    def clear(self):
+        """
+        Discard the URLs waiting to be purged, such as those added in a transaction
+        that was rolled back.
+        """
+        self._local.pending = {}
+
+    def _wait_for_rate_limit(self, backend_name, backend):
+        rate_limit = getattr(backend, "rate_limit", None)
+        if not rate_limit:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            next_request_time = max(
+                now, self._last_request_times.get(backend_name, 0) + 1 / rate_limit
+            )
+            self._last_request_times[backend_name] = next_request_time
+
+        if next_request_time > now:
+            time.sleep(next_request_time - now)
+
+    def _record(self, backend_name, urls=0, failures=0, retries=0, duration=None):
+        with self._lock:
+            stats = self._stats.get(backend_name, PurgeStats(0, 0, 0, 0, 0.0, 0.0))
+            if duration is not None:
+                stats = stats._replace(
+                    requests=stats.requests + 1,
+                    total_time=stats.total_time + duration,
+                    max_time=max(stats.max_time, duration),
+                )
+            self._stats[backend_name] = stats._replace(
+                urls=stats.urls + urls,
+                failures=stats.failures + failures,
+                retries=stats.retries + retries,
+            )
+
+    def purge(self, backend_name, backend, urls):
+        """
+        Purge the given URLs with the given backend, in chunks of up to the backend's
+        ``max_batch_size``. Returns ``True`` if all chunks were purged.
+
+        A request is retried if ``purge_batch()`` raises an exception, or if it
+        returns ``PurgeResult``s (as ``HTTPBackend`` does) with failed URLs, in
+        which case only those URLs are retried.
+        """
+        urls = list(urls)
+        chunk_size = getattr(backend, "max_batch_size", None) or len(urls) or 1
+        max_retries = getattr(backend, "max_retries", 0)
+        retry_backoff = getattr(backend, "retry_backoff", 1.0)
+
+        success = True
+        for start in range(0, len(urls), chunk_size):
+            chunk = urls[start : start + chunk_size]
+            for attempt in range(max_retries + 1):
+                self._wait_for_rate_limit(backend_name, backend)
+                start_time = time.monotonic()
+                try:
+                    result = backend.purge_batch(chunk)
+                except Exception:  # noqa: BLE001
+                    failed_urls = chunk
+                    exc_info = True
+                else:
+                    failed_urls = self._get_failed_urls(result)
+                    exc_info = False
+
+                self._record(
+                    backend_name,
+                    urls=len(chunk) - len(failed_urls),
+                    duration=time.monotonic() - start_time,
+                )
+                if not failed_urls:
+                    break
+
+                if attempt < max_retries:
+                    delay = retry_backoff * 2**attempt
+                    logger.warning(
+                        "[%s] Purge request failed, retrying in %.1f seconds",
+                        backend_name,
+                        delay,
+                        exc_info=exc_info,
+                    )
+                    self._record(backend_name, retries=1)
+                    time.sleep(delay)
+                    chunk = failed_urls
+                    continue
+
+                logger.error(
+                    "[%s] Couldn't purge %d URL(s)",
+                    backend_name,
+                    len(failed_urls),
+                    exc_info=exc_info,
+                )
+                self._record(backend_name, failures=1)
+                success = False
+
+        return success
+
+    @staticmethod
+    def _get_failed_urls(result):
+        # HTTPBackend returns a PurgeResult of the purged and failed URLs for each
+        # cache node. Other backends return None, and raise an exception on failure.
+        if not isinstance(result, dict):
+            return []
+
+        return list(
+            dict.fromkeys(
+                url
+                for node_result in result.values()
+                for url in getattr(node_result, "failed", ())
+            )
+        )
+
+    def get_stats(self):
+        """
+        Return a dict mapping the name of each backend to a ``PurgeStats`` tuple of
+        the purge requests made by this process.
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+
+purge_queue = PurgeQueue()
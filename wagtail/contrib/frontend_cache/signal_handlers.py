@@ -1,7 +1,10 @@
+import copy
+
 from django.apps import apps
+from django.db.models import Q
 
-from wagtail.contrib.frontend_cache.utils import purge_page_from_cache
-from wagtail.signals import page_published, page_unpublished
+from wagtail.contrib.frontend_cache.utils import PurgeBatch, purge_page_from_cache
+from wagtail.signals import page_published, page_unpublished, post_bulk_page_move
 
 
 def page_published_signal_handler(instance, **kwargs):
@@ -12,6 +15,38 @@ def page_unpublished_signal_handler(instance, **kwargs):
     purge_page_from_cache(instance)
 
 
+def bulk_page_move_signal_handler(moves, **kwargs):
+    # Purge the URLs of the moved pages and their descendants, both before and
+    # after the move, with a single batch
+    Page = apps.get_model("wagtailcore", "Page")
+    moves_by_path = {
+        move["instance"].path: move
+        for move in moves
+        if move["url_path_before"] != move["url_path_after"]
+    }
+    if not moves_by_path:
+        return
+
+    path_lengths = {len(path) for path in moves_by_path}
+    query = Q()
+    for path in moves_by_path:
+        query |= Q(path__startswith=path)
+
+    batch = PurgeBatch()
+    for page in Page.objects.live().filter(query):
+        move = next(
+            moves_by_path[page.path[:length]]
+            for length in path_lengths
+            if page.path[:length] in moves_by_path
+        )
+        page_before = copy.copy(page)
+        page_before.url_path = (
+            move["url_path_before"] + page.url_path[len(move["url_path_after"]) :]
+        )
+        batch.add_pages([page_before, page])
+    batch.purge()
+
+
 def register_signal_handlers():
     # Get list of models that are page types
     Page = apps.get_model("wagtailcore", "Page")
@@ -21,3 +56,5 @@ def register_signal_handlers():
     for model in indexed_models:
         page_published.connect(page_published_signal_handler, sender=model)
         page_unpublished.connect(page_unpublished_signal_handler, sender=model)
+
+    post_bulk_page_move.connect(bulk_page_move_signal_handler)
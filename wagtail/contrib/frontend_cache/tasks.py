@@ -8,6 +8,7 @@ from django_tasks import task
 
 from wagtail.coreutils import get_content_languages
 
+from .queue import purge_queue
 from .utils import get_backends
 
 logger = logging.getLogger("wagtail.frontendcache")
@@ -80,4 +81,4 @@ def purge_urls_from_cache_task(urls, backend_settings=None, backends=None):
             for url in urls:
                 logger.info("[%s] Purging URL: %s", backend_name, url)
 
-            backend.purge_batch(urls)
+            purge_queue.purge(backend_name, backend, urls)
@@ -1,3 +1,5 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest import mock
 from urllib.error import HTTPError, URLError
 
@@ -5,9 +7,11 @@ import requests
 from azure.mgmt.cdn import CdnManagementClient
 from azure.mgmt.frontdoor import FrontDoorManagementClient
 from django.core.exceptions import ImproperlyConfigured
+from django.db import transaction
 from django.test import SimpleTestCase, TestCase
 from django.test.utils import override_settings
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.contrib.frontend_cache.backends import (
     AzureCdnBackend,
     AzureFrontDoorBackend,
@@ -15,7 +19,9 @@ from wagtail.contrib.frontend_cache.backends import (
     CloudflareBackend,
     CloudfrontBackend,
     HTTPBackend,
+    PurgeResult,
 )
+from wagtail.contrib.frontend_cache.queue import PurgeStats, purge_queue
 from wagtail.contrib.frontend_cache.utils import get_backends
 from wagtail.models import Page
 from wagtail.test.testapp.models import EventIndex, EventPage
@@ -458,6 +464,132 @@ class TestBackendConfiguration(SimpleTestCase):
         self.assertEqual(backends["default"].cache_netloc, "localhost:8000")
 
 
+class StubCacheRequestHandler(BaseHTTPRequestHandler):
+    # Keep connections alive between requests, as Varnish does
+    protocol_version = "HTTP/1.1"
+
+    def do_PURGE(self):
+        self.server.purge_requests.append(
+            (self.headers["Host"], self.path, self.client_address[1])
+        )
+        status = 404 if self.path.startswith("/missing/") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHTTPBackendPurgeBatch(SimpleTestCase):
+    def start_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), StubCacheRequestHandler)
+        server.purge_requests = []
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def get_location(self, server):
+        return "http://127.0.0.1:%d" % server.server_address[1]
+
+    def test_purge_batch(self):
+        server = self.start_server()
+        backend = HTTPBackend(
+            {"LOCATION": self.get_location(server), "MAX_CONNECTIONS": 2}
+        )
+        urls = ["http://www.example.com/page-%d/?q=%d" % (i, i) for i in range(10)]
+
+        results = backend.purge_batch(urls)
+
+        self.assertEqual(results, {self.get_location(server): PurgeResult(urls, [])})
+        self.assertEqual(
+            sorted(request[:2] for request in server.purge_requests),
+            sorted(("www.example.com", "/page-%d/?q=%d" % (i, i)) for i in range(10)),
+        )
+        # The requests are made over no more than two keep-alive connections
+        self.assertLessEqual(len({request[2] for request in server.purge_requests}), 2)
+
+    def test_purge_batch_multiple_nodes(self):
+        servers = [self.start_server(), self.start_server()]
+        backend = HTTPBackend(
+            {"LOCATION": [self.get_location(server) for server in servers]}
+        )
+        urls = ["http://www.example.com/", "http://www.example.com:8000/missing/"]
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR") as log_output:
+            results = backend.purge_batch(urls)
+
+        self.assertEqual(
+            results,
+            {
+                self.get_location(server): PurgeResult(
+                    ["http://www.example.com/"],
+                    ["http://www.example.com:8000/missing/"],
+                )
+                for server in servers
+            },
+        )
+        for server in servers:
+            self.assertEqual(
+                sorted(request[:2] for request in server.purge_requests),
+                [("www.example.com", "/"), ("www.example.com:8000", "/missing/")],
+            )
+        self.assertEqual(len(log_output.output), 2)
+        self.assertIn(
+            "Couldn't purge 'http://www.example.com:8000/missing/' from HTTP cache at "
+            "127.0.0.1. HTTPError: 404 Not Found",
+            log_output.output[0],
+        )
+
+    def test_purge_batch_with_custom_request(self):
+        class CustomHTTPBackend(HTTPBackend):
+            def get_purge_request(self, url):
+                path, headers = super().get_purge_request(url)
+                return "/purge" + path, headers
+
+        server = self.start_server()
+        backend = CustomHTTPBackend({"LOCATION": self.get_location(server)})
+
+        with mock.patch.object(BaseBackend, "purge_batch") as serial_purge_batch:
+            backend.purge_batch(["http://www.example.com/page/"])
+
+        serial_purge_batch.assert_not_called()
+        self.assertEqual(
+            [request[:2] for request in server.purge_requests],
+            [("www.example.com", "/purge/page/")],
+        )
+
+    def test_purge_batch_with_custom_purge(self):
+        purged_urls = []
+
+        class CustomHTTPBackend(HTTPBackend):
+            def purge(self, url):
+                purged_urls.append(url)
+
+        backend = CustomHTTPBackend({"LOCATION": "http://127.0.0.1:1"})
+        backend.purge_batch(["http://www.example.com/page/"])
+
+        self.assertEqual(purged_urls, ["http://www.example.com/page/"])
+
+    def test_purge_batch_connection_error(self):
+        server = self.start_server()
+        location = self.get_location(server)
+        server.shutdown()
+        server.server_close()
+        backend = HTTPBackend({"LOCATION": location})
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR") as log_output:
+            results = backend.purge_batch(["http://www.example.com/"])
+
+        self.assertEqual(
+            results, {location: PurgeResult([], ["http://www.example.com/"])}
+        )
+        self.assertIn("ConnectionRefusedError", log_output.output[0])
+
+
 PURGED_URLS = set()
 
 
@@ -474,6 +606,42 @@ class MockCloudflareBackend(CloudflareBackend):
         PURGED_URLS.update(urls)
 
 
+PURGE_BATCH_CALLS = []
+
+
+class MockBatchBackend(BaseBackend):
+    max_batch_size = 2
+
+    def purge_batch(self, urls):
+        PURGE_BATCH_CALLS.append(list(urls))
+
+
+class MockPartialBackend(BaseBackend):
+    # URLs that fail to be purged from one of the nodes on the first attempt
+    failing_urls = set()
+
+    def purge_batch(self, urls):
+        PURGE_BATCH_CALLS.append(list(urls))
+        failed = [url for url in urls if url in MockPartialBackend.failing_urls]
+        MockPartialBackend.failing_urls = set()
+        return {
+            "http://node-1": PurgeResult(list(urls), []),
+            "http://node-2": PurgeResult(
+                [url for url in urls if url not in failed], failed
+            ),
+        }
+
+
+class MockFlakyBackend(BaseBackend):
+    failures = 0
+
+    def purge_batch(self, urls):
+        if MockFlakyBackend.failures:
+            MockFlakyBackend.failures -= 1
+            raise ConnectionError("Purge request failed")
+        PURGE_BATCH_CALLS.append(list(urls))
+
+
 @override_settings(
     WAGTAILFRONTENDCACHE={
         "varnish": {
@@ -700,6 +868,23 @@ class TestCachePurgingSignals(TestCase):
             PURGED_URLS, {"http://localhost/events/", "http://localhost/events/past/"}
         )
 
+    def test_purge_on_bulk_move(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            page = EventIndex.objects.get(url_path="/home/events/")
+            target = Page.objects.get(url_path="/home/about-us/")
+            BulkMovePageAction([page], target).execute()
+
+        # The old and new URLs of the moved page and its live descendants are purged
+        self.assertIn("http://localhost/events/", PURGED_URLS)
+        self.assertIn("http://localhost/events/past/", PURGED_URLS)
+        self.assertIn("http://localhost/events/christmas/", PURGED_URLS)
+        self.assertIn("http://localhost/about-us/events/", PURGED_URLS)
+        self.assertIn("http://localhost/about-us/events/past/", PURGED_URLS)
+        self.assertIn("http://localhost/about-us/events/christmas/", PURGED_URLS)
+        self.assertNotIn(
+            "http://localhost/events/tentative-unpublished-event/", PURGED_URLS
+        )
+
     def test_purge_with_unroutable_page(self):
         with self.captureOnCommitCallbacks(execute=True):
             root = Page.objects.get(url_path="/")
@@ -820,8 +1005,9 @@ class TestPurgeBatchClass(TestCase):
             },
         )
 
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
     @mock.patch("wagtail.contrib.frontend_cache.backends.cloudflare.requests.delete")
-    def test_http_error_on_cloudflare_purge_batch(self, requests_delete_mock):
+    def test_http_error_on_cloudflare_purge_batch(self, requests_delete_mock, sleep):
         backend_settings = {
             "cloudflare": {
                 "BACKEND": "wagtail.contrib.frontend_cache.backends.CloudflareBackend",
@@ -851,3 +1037,212 @@ class TestPurgeBatchClass(TestCase):
             "Couldn't purge 'http://localhost/events/' from Cloudflare. HTTPError: 500",
             log_output.output[0],
         )
+
+
+@override_settings(
+    WAGTAILFRONTENDCACHE={
+        "batch": {
+            "BACKEND": "wagtail.contrib.frontend_cache.tests.MockBatchBackend",
+        },
+    },
+)
+class TestPurgeQueue(TestCase):
+    def setUp(self):
+        PURGE_BATCH_CALLS.clear()
+        purge_queue.clear()
+        purge_queue.reset_stats()
+
+    @mock.patch("wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task")
+    def test_coalesces_urls_in_batch(self, task):
+        with self.captureOnCommitCallbacks(execute=True), purge_queue.batch():
+            purge_url_from_cache("http://localhost/foo")
+            purge_urls_from_cache(["http://localhost/bar", "http://localhost/foo"])
+            with purge_queue.batch():
+                purge_url_from_cache("http://localhost/baz")
+
+        task.enqueue.assert_called_once_with(
+            ["http://localhost/foo", "http://localhost/bar", "http://localhost/baz"],
+            None,
+            None,
+        )
+
+    @mock.patch("wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task")
+    def test_coalesces_urls_in_transaction(self, task):
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_url_from_cache("http://localhost/foo")
+            purge_url_from_cache("http://localhost/foo")
+            purge_url_from_cache("http://localhost/bar", backends=["batch"])
+
+        self.assertEqual(
+            task.enqueue.call_args_list,
+            [
+                mock.call(["http://localhost/foo"], None, None),
+                mock.call(["http://localhost/bar"], None, ["batch"]),
+            ],
+        )
+
+    @mock.patch("wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task")
+    def test_discards_urls_from_rolled_back_transaction(self, task):
+        try:
+            with transaction.atomic():
+                purge_url_from_cache("http://localhost/foo")
+                raise ValueError
+        except ValueError:
+            pass
+
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_url_from_cache("http://localhost/bar")
+
+        task.enqueue.assert_called_once_with(["http://localhost/bar"], None, None)
+
+    @mock.patch("wagtail.contrib.frontend_cache.tasks.purge_urls_from_cache_task")
+    def test_discards_urls_from_rolled_back_savepoint(self, task):
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    purge_url_from_cache("http://localhost/foo")
+                    raise ValueError
+            except ValueError:
+                pass
+
+            purge_url_from_cache("http://localhost/bar")
+
+        task.enqueue.assert_called_once_with(["http://localhost/bar"], None, None)
+
+    def test_chunks_to_max_batch_size(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            purge_urls_from_cache([f"http://localhost/{i}" for i in range(5)])
+
+        self.assertEqual(
+            PURGE_BATCH_CALLS,
+            [
+                ["http://localhost/0", "http://localhost/1"],
+                ["http://localhost/2", "http://localhost/3"],
+                ["http://localhost/4"],
+            ],
+        )
+        stats = purge_queue.get_stats()["batch"]
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.urls, 5)
+        self.assertEqual(stats.failures, 0)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    def test_retries_with_backoff(self, sleep):
+        backend = MockFlakyBackend({"RETRY_BACKOFF": 0.5})
+        MockFlakyBackend.failures = 2
+
+        with self.assertLogs("wagtail.frontendcache", level="WARNING"):
+            self.assertTrue(
+                purge_queue.purge("flaky", backend, ["http://localhost/foo"])
+            )
+
+        self.assertEqual(PURGE_BATCH_CALLS, [["http://localhost/foo"]])
+        self.assertEqual(sleep.call_args_list, [mock.call(0.5), mock.call(1.0)])
+        stats = purge_queue.get_stats()["flaky"]
+        self.assertIsInstance(stats, PurgeStats)
+        self.assertEqual(stats.requests, 3)
+        self.assertEqual(stats.urls, 1)
+        self.assertEqual(stats.failures, 0)
+        self.assertEqual(stats.retries, 2)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    def test_records_failure_after_retries(self, sleep):
+        backend = MockFlakyBackend({"MAX_RETRIES": 1})
+        MockFlakyBackend.failures = 2
+
+        with self.assertLogs("wagtail.frontendcache", level="ERROR") as log_output:
+            self.assertFalse(
+                purge_queue.purge("flaky", backend, ["http://localhost/foo"])
+            )
+
+        self.assertEqual(PURGE_BATCH_CALLS, [])
+        self.assertIn("[flaky] Couldn't purge 1 URL(s)", log_output.output[-1])
+        stats = purge_queue.get_stats()["flaky"]
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.urls, 0)
+        self.assertEqual(stats.failures, 1)
+        self.assertEqual(stats.retries, 1)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    def test_retries_failed_urls_of_purge_results(self, sleep):
+        backend = MockPartialBackend({})
+        MockPartialBackend.failing_urls = {"http://localhost/bar"}
+
+        with self.assertLogs("wagtail.frontendcache", level="WARNING"):
+            self.assertTrue(
+                purge_queue.purge(
+                    "partial", backend, ["http://localhost/foo", "http://localhost/bar"]
+                )
+            )
+
+        self.assertEqual(
+            PURGE_BATCH_CALLS,
+            [
+                ["http://localhost/foo", "http://localhost/bar"],
+                ["http://localhost/bar"],
+            ],
+        )
+        stats = purge_queue.get_stats()["partial"]
+        self.assertEqual(stats.requests, 2)
+        self.assertEqual(stats.urls, 2)
+        self.assertEqual(stats.failures, 0)
+        self.assertEqual(stats.retries, 1)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    @mock.patch("wagtail.contrib.frontend_cache.backends.cloudflare.requests.delete")
+    def test_retries_cloudflare_rate_limit(self, requests_delete_mock, sleep):
+        rate_limited_response = requests.Response()
+        rate_limited_response.status_code = 429
+        rate_limited_response._content = b'{"success": false, "errors": []}'
+        success_response = requests.Response()
+        success_response.status_code = 200
+        success_response._content = b'{"success": true, "errors": []}'
+        requests_delete_mock.side_effect = [rate_limited_response, success_response]
+        backend = CloudflareBackend({"ZONEID": "zone", "BEARER_TOKEN": "token"})
+
+        with self.assertLogs("wagtail.frontendcache", level="WARNING"):
+            self.assertTrue(
+                purge_queue.purge("cloudflare", backend, ["http://localhost/foo"])
+            )
+
+        self.assertEqual(requests_delete_mock.call_count, 2)
+        self.assertEqual(purge_queue.get_stats()["cloudflare"].retries, 1)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    def test_retries_cloudfront_throttling(self, sleep):
+        from botocore.exceptions import ClientError
+
+        backend = CloudfrontBackend({"DISTRIBUTION_ID": "frontend"})
+        throttling_error = ClientError(
+            {
+                "Error": {"Code": "Throttling", "Message": "Rate exceeded"},
+                "ResponseMetadata": {"HTTPStatusCode": 400},
+            },
+            "CreateInvalidation",
+        )
+
+        with mock.patch.object(
+            backend.client, "create_invalidation", side_effect=throttling_error
+        ) as create_invalidation:
+            with self.assertLogs("wagtail.frontendcache", level="ERROR") as log_output:
+                self.assertFalse(
+                    purge_queue.purge("cloudfront", backend, ["http://localhost/foo"])
+                )
+
+        self.assertEqual(create_invalidation.call_count, 3)
+        self.assertIn("[cloudfront] Couldn't purge 1 URL(s)", log_output.output[-1])
+        stats = purge_queue.get_stats()["cloudfront"]
+        self.assertEqual(stats.retries, 2)
+        self.assertEqual(stats.failures, 1)
+
+    @mock.patch("wagtail.contrib.frontend_cache.queue.time.sleep")
+    def test_rate_limit(self, sleep):
+        backend = MockBatchBackend({"RATE_LIMIT": 2})
+
+        with mock.patch(
+            "wagtail.contrib.frontend_cache.queue.time.monotonic", return_value=100.0
+        ):
+            purge_queue.purge("limited", backend, ["http://localhost/1"] * 3)
+
+        # The second request is delayed by half a second
+        sleep.assert_called_once_with(0.5)
@@ -4,6 +4,8 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.utils.module_loading import import_string
 
+from wagtail.url_routing import PageURLResolver
+
 logger = logging.getLogger("wagtail.frontendcache")
 
 
@@ -97,16 +99,19 @@ def purge_urls_from_cache(urls, backend_settings=None, backends=None):
     NOTE: This function also handles internationalization, creating language-specific URLs if
     ``WAGTAILFRONTENDCACHE_LANGUAGES`` is set and ``USE_I18N`` is ``True``.
     """
-    from .tasks import purge_urls_from_cache_task
+    from .queue import purge_queue
 
     if not urls:
         return
 
-    purge_urls_from_cache_task.enqueue(list(urls), backend_settings, backends)
+    purge_queue.add(urls, backend_settings, backends)
 
 
-def _get_page_cached_urls(page, cache_object=None):
-    page_url = page.get_full_url(cache_object)
+def _get_page_cached_urls(page, cache_object=None, url_resolver=None):
+    if url_resolver is not None:
+        page_url = url_resolver.get_full_url(page)
+    else:
+        page_url = page.get_full_url(cache_object)
     if page_url is None:  # nothing to be done if the page has no routable URL
         return []
 
@@ -213,10 +218,12 @@ class PurgeBatch:
         Adds multiple pages from a QuerySet or an iterable
 
         This is equivalent to running ``.add_page(page)`` on each page
-        individually
+        individually, but the page URLs are computed together with a
+        ``PageURLResolver``
         """
+        url_resolver = PageURLResolver(self.cache_object or self)
         for page in pages:
-            self.add_page(page)
+            self.add_urls(_get_page_cached_urls(page, url_resolver=url_resolver))
 
     def purge(self, backend_settings=None, backends=None):
         """
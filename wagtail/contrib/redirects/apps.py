@@ -9,12 +9,26 @@ class WagtailRedirectsAppConfig(AppConfig):
     default_auto_field = "django.db.models.AutoField"
 
     def ready(self):
-        from wagtail.signals import page_slug_changed, post_page_move
+        from django.db.models.signals import post_delete, post_save
 
+        from wagtail.signals import (
+            page_slug_changed,
+            post_bulk_page_move,
+            post_page_move,
+        )
+
+        from .models import Redirect
         from .signal_handlers import (
+            autocreate_redirects_on_bulk_page_move,
             autocreate_redirects_on_page_move,
             autocreate_redirects_on_slug_change,
+            invalidate_redirect_cache,
+            update_redirect_filter_on_save,
         )
 
         post_page_move.connect(autocreate_redirects_on_page_move)
+        post_bulk_page_move.connect(autocreate_redirects_on_bulk_page_move)
         page_slug_changed.connect(autocreate_redirects_on_slug_change)
+        post_save.connect(invalidate_redirect_cache, sender=Redirect)
+        post_delete.connect(invalidate_redirect_cache, sender=Redirect)
+        post_save.connect(update_redirect_filter_on_save, sender=Redirect)
@@ -0,0 +1,395 @@
+import hashlib
+import math
+import threading
+import uuid
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def hash_path(path):
+    """
+    Return a stable 64-bit hash of a normalised redirect path.
+    """
+    return int.from_bytes(
+        hashlib.blake2b(path.encode(), digest_size=8).digest(), "big", signed=True
+    )
+
+
+class SiteRedirectPaths:
+    """
+    A compact, read-only lookup of redirect ids by ``old_path`` for a single site
+    (or for redirects that apply to all sites).
+
+    Paths are stored as sorted 64-bit hashes in an ``array``, alongside the ids of
+    their redirects, so that tens of thousands of redirects only take up a few
+    hundred kilobytes. As different paths may share a hash, callers must check the
+    ``old_path`` of the redirects they fetch.
+    """
+
+    def __init__(self, redirects):
+        entries = sorted((hash_path(old_path), pk) for pk, old_path in redirects)
+        self.hashes = array("q", (path_hash for path_hash, pk in entries))
+        self.ids = array("q", (pk for path_hash, pk in entries))
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def get_ids(self, path):
+        path_hash = hash_path(path)
+        index = bisect_left(self.hashes, path_hash)
+        ids = []
+        while index < len(self.hashes) and self.hashes[index] == path_hash:
+            ids.append(self.ids[index])
+            index += 1
+        return ids
+
+
+class RedirectCache:
+    """
+    A process-local index of redirects, used by ``RedirectMiddleware`` when the
+    ``WAGTAILREDIRECTS_CACHE_ENABLED`` setting is ``True``, so that requests which
+    don't match a redirect can be answered without a database query.
+
+    The redirects of each site are loaded on first use, and are discarded by every
+    process whenever a redirect is saved or deleted, through a version key held in
+    Django's cache.
+    """
+
+    version_cache_key = "wagtail_redirects_cache_version"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sites = {}
+        self._version = None
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAILREDIRECTS_CACHE_ENABLED", False)
+
+    def get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def get_site_paths(self, site_id, version):
+        """
+        Return the ``SiteRedirectPaths`` for the given site id, or for redirects
+        that apply to all sites if ``site_id`` is ``None``.
+        """
+        from wagtail.contrib.redirects.models import Redirect
+
+        with self._lock:
+            if version != self._version:
+                self._sites.clear()
+                self._version = version
+            site_paths = self._sites.get(site_id)
+
+        if site_paths is None:
+            site_paths = SiteRedirectPaths(
+                Redirect.objects.filter(site_id=site_id)
+                .values_list("pk", "old_path")
+                .iterator()
+            )
+            with self._lock:
+                if version == self._version:
+                    self._sites[site_id] = site_paths
+
+        return site_paths
+
+    def get_redirect(self, site, path, version=None):
+        """
+        Return the redirect for the given path on the given site, preferring
+        site-specific redirects over those that apply to all sites.
+        """
+        from wagtail.contrib.redirects.models import Redirect
+
+        if version is None:
+            version = self.get_version()
+
+        for site_id in (site.pk, None):
+            ids = self.get_site_paths(site_id, version).get_ids(path)
+            if ids:
+                redirect = Redirect.objects.filter(
+                    pk__in=ids, site_id=site_id, old_path=path
+                ).first()
+                if redirect is not None:
+                    return redirect
+        return None
+
+    def invalidate(self):
+        """
+        Discard the cached redirects of all processes, by bumping the version.
+        """
+        cache.set(self.version_cache_key, uuid.uuid4().hex, None)
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._sites.clear()
+            self._version = None
+
+
+redirect_cache = RedirectCache()
+
+
+class BloomFilter:
+    """
+    A probabilistic set of strings, which can report that a string is definitely not
+    in the set, or that it probably is (with a false positive rate of ``error_rate``
+    once ``capacity`` strings have been added).
+    """
+
+    def __init__(self, capacity, error_rate=0.01, bits=None, count=0):
+        self.capacity = max(int(capacity), 1)
+        self.error_rate = error_rate
+        self.num_bits = max(
+            int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)), 8
+        )
+        self.num_hashes = max(
+            int(round(self.num_bits / self.capacity * math.log(2))), 1
+        )
+        self.bits = (
+            bytearray(bits) if bits is not None else bytearray((self.num_bits + 7) // 8)
+        )
+        self.count = count
+
+    def _get_positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self.num_bits for i in range(self.num_hashes))
+
+    def add(self, value):
+        """
+        Add a string to the set. Only strings that set a new bit are counted, so
+        adding a string again doesn't count towards the capacity.
+        """
+        added = False
+        for position in self._get_positions(value):
+            mask = 1 << (position & 7)
+            if not self.bits[position >> 3] & mask:
+                self.bits[position >> 3] |= mask
+                added = True
+
+        if added:
+            self.count += 1
+
+    def __contains__(self, value):
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(value)
+        )
+
+    @property
+    def is_full(self):
+        return self.count > self.capacity
+
+    def get_estimated_error_rate(self):
+        """
+        Estimate the current false positive rate, from the proportion of bits set.
+        """
+        bits_set = sum(bin(byte).count("1") for byte in self.bits)
+        return (bits_set / self.num_bits) ** self.num_hashes
+
+    def to_dict(self):
+        return {
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "bits": bytes(self.bits),
+            "count": self.count,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**data)
+
+
+class RedirectFilter:
+    """
+    Bloom filters of redirect paths, one for each site plus one for redirects that
+    apply to all sites, held in Django's cache and shared by all processes. Used by
+    ``RedirectMiddleware`` when the ``WAGTAILREDIRECTS_BLOOM_FILTER_ENABLED`` setting
+    is ``True``, to skip looking up redirects for paths that don't have one.
+
+    New redirects are added to the existing filters as they are saved. Filters are
+    rebuilt from the database by a task when they are missing, when they reach
+    capacity, or when a concurrent update could not be applied.
+
+    Each process keeps its own copy of the filters, and only fetches a filter from
+    Django's cache again when the version key stored alongside it changes.
+    """
+
+    cache_key_prefix = "wagtail_redirects_filter"
+    lock_timeout = 60
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Map each site id to a (version, BloomFilter) tuple
+        self._filters = {}
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAILREDIRECTS_BLOOM_FILTER_ENABLED", False)
+
+    @property
+    def error_rate(self):
+        return getattr(settings, "WAGTAILREDIRECTS_BLOOM_FILTER_ERROR_RATE", 0.01)
+
+    def _get_cache_key(self, site_id, suffix=""):
+        return f"{self.cache_key_prefix}:{site_id or 'all'}{suffix}"
+
+    def get_filters(self, site_ids, rebuild=False):
+        """
+        Return a dict of the ``BloomFilter`` for each of the given site ids (with
+        ``None`` for redirects that apply to all sites). The value is ``None`` for
+        sites whose filter is not available, in which case paths must be looked
+        up in the database.
+
+        Missing or stale filters are rebuilt by a task, unless ``rebuild`` is true,
+        in which case they are rebuilt straight away.
+        """
+        keys = {}
+        for site_id in site_ids:
+            keys[site_id] = (
+                self._get_cache_key(site_id, ":version"),
+                self._get_cache_key(site_id, ":stale"),
+            )
+        cached = cache.get_many([key for pair in keys.values() for key in pair])
+
+        filters = {}
+        for site_id, (version_key, stale_key) in keys.items():
+            version = cached.get(version_key)
+            if version is None or cached.get(stale_key):
+                if rebuild:
+                    filters[site_id] = self.rebuild(site_id)
+                else:
+                    self.schedule_rebuild(site_id)
+                    filters[site_id] = None
+            else:
+                filters[site_id] = self._get_filter(site_id, version)
+        return filters
+
+    def _get_filter(self, site_id, version):
+        """
+        Return this process's copy of the filter for the given site id, fetching it
+        from the cache if it doesn't match the given version.
+        """
+        with self._lock:
+            local_version, bloom_filter = self._filters.get(site_id, (None, None))
+        if local_version == version:
+            return bloom_filter
+
+        data = cache.get(self._get_cache_key(site_id))
+        if data is None:
+            return None
+
+        bloom_filter = BloomFilter.from_dict(data["filter"])
+        with self._lock:
+            self._filters[site_id] = (data["version"], bloom_filter)
+        return bloom_filter
+
+    def _save_filter(self, site_id, bloom_filter):
+        # The filter is saved before its version, so that a process that sees the
+        # new version fetches the new filter
+        version = uuid.uuid4().hex
+        cache.set(
+            self._get_cache_key(site_id),
+            {"version": version, "filter": bloom_filter.to_dict()},
+            None,
+        )
+        cache.set(self._get_cache_key(site_id, ":version"), version, None)
+        with self._lock:
+            self._filters[site_id] = (version, bloom_filter)
+
+    def schedule_rebuild(self, site_id):
+        """
+        Enqueue a task to rebuild the filter for the given site id, unless one is
+        already waiting to run.
+        """
+        from wagtail.contrib.redirects.tasks import rebuild_redirect_filter_task
+
+        if cache.add(
+            self._get_cache_key(site_id, ":scheduled"), True, self.lock_timeout
+        ):
+            rebuild_redirect_filter_task.enqueue(site_id)
+
+    def rebuild(self, site_id):
+        """
+        Rebuild the filter for the given site id from the database. Returns the
+        new ``BloomFilter``, or ``None`` if another process is updating it.
+        """
+        from wagtail.contrib.redirects.models import Redirect
+
+        # Allow another rebuild to be scheduled if this one can't go ahead, or
+        # the filter goes stale again
+        cache.delete(self._get_cache_key(site_id, ":scheduled"))
+
+        lock_key = self._get_cache_key(site_id, ":lock")
+        if not cache.add(lock_key, True, self.lock_timeout):
+            return None
+
+        try:
+            # Clear the stale flag before reading from the database, so that changes
+            # saved while the filter is being built will flag it as stale again
+            cache.delete(self._get_cache_key(site_id, ":stale"))
+
+            old_paths = Redirect.objects.filter(site_id=site_id).values_list(
+                "old_path", flat=True
+            )
+            # Leave room for redirects added after the rebuild
+            bloom_filter = BloomFilter(
+                max(old_paths.count() * 2, 1000), error_rate=self.error_rate
+            )
+            for old_path in old_paths.iterator():
+                bloom_filter.add(old_path)
+
+            self._save_filter(site_id, bloom_filter)
+            return bloom_filter
+        finally:
+            cache.delete(lock_key)
+
+    def add(self, site_id, old_paths):
+        """
+        Add paths to the filter for the given site id, if it has been built.
+        """
+        lock_key = self._get_cache_key(site_id, ":lock")
+        if not cache.add(lock_key, True, self.lock_timeout):
+            # Another process is updating this filter, and may overwrite this update
+            cache.set(self._get_cache_key(site_id, ":stale"), True, None)
+            return
+
+        try:
+            data = cache.get(self._get_cache_key(site_id))
+            if data is None:
+                # The filter will include these paths when it is next built
+                return
+
+            bloom_filter = BloomFilter.from_dict(data["filter"])
+            for old_path in old_paths:
+                bloom_filter.add(old_path)
+
+            if bloom_filter.is_full:
+                self.clear(site_id)
+            else:
+                self._save_filter(site_id, bloom_filter)
+        finally:
+            cache.delete(lock_key)
+
+    def clear(self, site_id):
+        cache.delete_many(
+            [
+                self._get_cache_key(site_id, ":version"),
+                self._get_cache_key(site_id),
+                self._get_cache_key(site_id, ":stale"),
+            ]
+        )
+        with self._lock:
+            self._filters.pop(site_id, None)
+
+
+redirect_filter = RedirectFilter()
@@ -0,0 +1,61 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail.contrib.redirects.cache import BloomFilter, redirect_filter
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.models import Site
+
+
+class Command(BaseCommand):
+    help = "Inspects or rebuilds the Bloom filters used to skip redirect lookups"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            help="Only process the filter for the site with this id, or 'all' for redirects that apply to all sites",
+            type=str,
+        )
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Rebuild the filters from the database",
+        )
+        parser.add_argument(
+            "--check",
+            help="Report whether this redirect path may be in each filter",
+            type=str,
+        )
+
+    def handle(self, *args, **options):
+        if options["site"] == "all":
+            site_ids = [None]
+        elif options["site"]:
+            try:
+                site_ids = [Site.objects.get(id=options["site"]).pk]
+            except (Site.DoesNotExist, ValueError) as e:
+                raise CommandError(f"Site '{options['site']}' does not exist") from e
+        else:
+            site_ids = list(Site.objects.values_list("pk", flat=True)) + [None]
+
+        if options["rebuild"]:
+            for site_id in site_ids:
+                redirect_filter.clear(site_id)
+
+        filters = redirect_filter.get_filters(site_ids, rebuild=True)
+        for site_id in site_ids:
+            self.describe_filter(site_id, filters[site_id], options["check"])
+
+    def describe_filter(self, site_id, bloom_filter: BloomFilter, check_path):
+        label = f"Site {site_id}" if site_id else "All sites"
+        if bloom_filter is None:
+            self.stdout.write(f"{label}: filter is being updated by another process")
+            return
+
+        self.stdout.write(
+            f"{label}: {bloom_filter.count}/{bloom_filter.capacity} redirects, "
+            f"{len(bloom_filter.bits)} bytes, {bloom_filter.num_hashes} hashes, "
+            f"estimated false positive rate {bloom_filter.get_estimated_error_rate():.4%}"
+        )
+        if check_path:
+            check_path = Redirect.normalise_path(check_path)
+            result = "may be present" if check_path in bloom_filter else "not present"
+            self.stdout.write(f"  {check_path}: {result}")
@@ -5,6 +5,7 @@ from django.utils.deprecation import MiddlewareMixin
 from django.utils.encoding import uri_to_iri
 
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.cache import redirect_cache, redirect_filter
 from wagtail.models import Site
 
 
@@ -15,6 +16,26 @@ def _get_redirect(request, path):
         return None
 
     site = Site.find_for_request(request)
+    if site is not None and redirect_filter.enabled:
+        # only fetch the filters once per request
+        if not hasattr(request, "_wagtail_redirect_filters"):
+            request._wagtail_redirect_filters = redirect_filter.get_filters(
+                [site.pk, None]
+            )
+        if not any(
+            bloom_filter is None or path in bloom_filter
+            for bloom_filter in request._wagtail_redirect_filters.values()
+        ):
+            return None
+
+    if site is not None and redirect_cache.enabled:
+        # only check the cache version once per request
+        if not hasattr(request, "_wagtail_redirects_cache_version"):
+            request._wagtail_redirects_cache_version = redirect_cache.get_version()
+        return redirect_cache.get_redirect(
+            site, path, version=request._wagtail_redirects_cache_version
+        )
+
     try:
         return models.Redirect.get_for_site(site).get(old_path=path)
     except models.Redirect.MultipleObjectsReturned:
@@ -1,14 +1,17 @@
 import logging
+from collections import defaultdict
 from collections.abc import Iterable
 
 from django.apps import apps
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
 
 from wagtail.contrib.frontend_cache.utils import PurgeBatch
 from wagtail.coreutils import BatchCreator, get_dummy_request
 from wagtail.models import Page, Site
 
+from .cache import redirect_cache, redirect_filter
 from .models import Redirect
 
 logger = logging.getLogger(__name__)
@@ -30,6 +33,10 @@ class BatchRedirectCreator(BatchCreator):
         Redirect.objects.filter(automatically_created=True).filter(clashes_q).delete()
 
     def post_process(self):
+        # bulk_create() doesn't send post_save signals
+        invalidate_redirect_cache()
+        add_redirects_to_filter(self.items)
+
         if not apps.is_installed("wagtail.contrib.frontend_cache"):
             return
 
@@ -43,6 +50,37 @@ class BatchRedirectCreator(BatchCreator):
         batch.purge()
 
 
+def invalidate_redirect_cache(**kwargs):
+    if redirect_cache.enabled:
+        # Discard this process's redirects straight away, and those of all
+        # other processes once the change is visible to them
+        redirect_cache.clear()
+        transaction.on_commit(redirect_cache.invalidate)
+
+
+def add_redirects_to_filter(redirects):
+    if not redirect_filter.enabled:
+        return
+
+    old_paths_by_site = defaultdict(list)
+    for redirect in redirects:
+        old_paths_by_site[redirect.site_id].append(redirect.old_path)
+
+    def update_filters():
+        for site_id, old_paths in old_paths_by_site.items():
+            redirect_filter.add(site_id, old_paths)
+
+    # Add the paths straight away so they can be found within this transaction,
+    # and again on commit in case the filters were rebuilt in the meantime
+    update_filters()
+    transaction.on_commit(update_filters)
+
+
+def update_redirect_filter_on_save(instance, **kwargs):
+    # Deleted redirects are left in the filter, as false positives are harmless
+    add_redirects_to_filter([instance])
+
+
 def autocreate_redirects_on_slug_change(
     instance_before: Page, instance: Page, **kwargs
 ):
@@ -103,6 +141,11 @@ def autocreate_redirects_on_page_move(
     create_redirects(page=instance, page_old=page_old, sites=sites)
 
 
+def autocreate_redirects_on_bulk_page_move(moves, **kwargs) -> None:
+    for move in moves:
+        autocreate_redirects_on_page_move(**move)
+
+
 def _page_urls_for_sites(
     page: Page, sites: tuple[Site], cache_target: Page
 ) -> set[tuple[Site, str, str]]:
@@ -0,0 +1,8 @@
+from django_tasks import task
+
+from .cache import redirect_filter
+
+
+@task()
+def rebuild_redirect_filter_task(site_id):
+    redirect_filter.rebuild(site_id)
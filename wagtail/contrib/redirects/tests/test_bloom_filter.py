@@ -0,0 +1,228 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from wagtail.contrib.redirects.cache import BloomFilter, redirect_filter
+from wagtail.contrib.redirects.middleware import get_redirect
+from wagtail.contrib.redirects.models import Redirect
+from wagtail.contrib.redirects.signal_handlers import BatchRedirectCreator
+from wagtail.coreutils import get_dummy_request
+from wagtail.models import Site
+
+
+class TestBloomFilter(TestCase):
+    def test_membership(self):
+        bloom_filter = BloomFilter(1000)
+        paths = [f"/old-path-{i}" for i in range(1000)]
+        for path in paths:
+            bloom_filter.add(path)
+
+        # No false negatives
+        self.assertTrue(all(path in bloom_filter for path in paths))
+
+        # Few false positives
+        false_positives = sum(f"/other-path-{i}" in bloom_filter for i in range(1000))
+        self.assertLess(false_positives, 50)
+        self.assertLess(bloom_filter.get_estimated_error_rate(), 0.05)
+
+    def test_is_full(self):
+        bloom_filter = BloomFilter(2)
+        bloom_filter.add("/one")
+        bloom_filter.add("/two")
+        self.assertFalse(bloom_filter.is_full)
+        bloom_filter.add("/three")
+        self.assertTrue(bloom_filter.is_full)
+
+    def test_adding_again_is_not_counted(self):
+        bloom_filter = BloomFilter(2)
+        bloom_filter.add("/one")
+        bloom_filter.add("/one")
+        bloom_filter.add("/two")
+        self.assertEqual(bloom_filter.count, 2)
+        self.assertFalse(bloom_filter.is_full)
+
+    def test_to_dict(self):
+        bloom_filter = BloomFilter(10, error_rate=0.001)
+        bloom_filter.add("/one")
+        copy = BloomFilter.from_dict(bloom_filter.to_dict())
+        self.assertIn("/one", copy)
+        self.assertNotIn("/two", copy)
+        self.assertEqual(copy.count, 1)
+        self.assertEqual(copy.num_hashes, bloom_filter.num_hashes)
+
+
+@override_settings(
+    WAGTAILREDIRECTS_BLOOM_FILTER_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRedirectFilter(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        self.redirect = Redirect.objects.create(
+            old_path="/redirectme", redirect_link="/to"
+        )
+
+    def get_redirect(self, path):
+        request = get_dummy_request(path=path, site=self.site)
+        return get_redirect(request, Redirect.normalise_path(path))
+
+    def build_filters(self):
+        # Missing filters are rebuilt by a task, run once the request's transaction
+        # is committed
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect_filter.get_filters([self.site.pk, None])
+
+    def test_missing_filter_is_rebuilt_by_task(self):
+        with mock.patch.object(redirect_filter, "rebuild") as rebuild:
+            # The request falls back to the database rather than waiting for the
+            # filter to be rebuilt
+            with self.captureOnCommitCallbacks() as callbacks:
+                self.assertEqual(self.get_redirect("/redirectme"), self.redirect)
+                self.assertEqual(self.get_redirect("/redirectme"), self.redirect)
+            rebuild.assert_not_called()
+
+        # A single rebuild is scheduled for each filter
+        self.assertEqual(len(callbacks), 2)
+        with self.captureOnCommitCallbacks(execute=True):
+            for callback in callbacks:
+                callback()
+        self.assertIn("/redirectme", redirect_filter.get_filters([None])[None])
+
+    def test_miss_does_not_query_redirects(self):
+        self.build_filters()
+        request = get_dummy_request(path="/does-not-exist", site=self.site)
+        Site.find_for_request(request)
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_redirect(request, "/does-not-exist"))
+            self.assertIsNone(get_redirect(request, "/does-not-exist-either"))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_redirect(request, "/redirectme"), self.redirect)
+
+    def test_filter_is_only_fetched_when_its_version_changes(self):
+        self.build_filters()
+        filter_key = redirect_filter._get_cache_key(None)
+
+        # Simulate another process, which doesn't have a copy of the filter yet
+        redirect_filter._filters.clear()
+        with mock.patch.object(cache, "get", wraps=cache.get) as cache_get:
+            for path in ["/does-not-exist", "/does-not-exist-either"]:
+                self.assertNotIn(path, redirect_filter.get_filters([None])[None])
+        self.assertEqual(cache_get.call_args_list.count(mock.call(filter_key)), 1)
+
+        # A redirect saved by another process changes the version
+        redirect_filter.add(None, ["/does-not-exist"])
+        redirect_filter._filters.clear()
+        with mock.patch.object(cache, "get", wraps=cache.get) as cache_get:
+            self.assertIn("/does-not-exist", redirect_filter.get_filters([None])[None])
+        self.assertEqual(cache_get.call_args_list.count(mock.call(filter_key)), 1)
+
+    def test_saved_redirects_are_added(self):
+        self.build_filters()
+        self.assertIsNone(self.get_redirect("/redirectme-too"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect = Redirect.objects.create(
+                old_path="/redirectme-too", redirect_link="/to", site=self.site
+            )
+        with mock.patch.object(redirect_filter, "rebuild") as rebuild:
+            self.assertEqual(self.get_redirect("/redirectme-too"), redirect)
+        rebuild.assert_not_called()
+
+        # The redirect is only counted once, though it is added again on commit
+        self.assertEqual(
+            redirect_filter.get_filters([self.site.pk])[self.site.pk].count, 1
+        )
+
+    def test_bulk_created_redirects_are_added(self):
+        self.build_filters()
+        self.assertIsNone(self.get_redirect("/redirectme-too"))
+
+        batch = BatchRedirectCreator(max_size=10)
+        batch.add(old_path="/redirectme-too", redirect_link="/to")
+        with self.captureOnCommitCallbacks(execute=True):
+            batch.process()
+        self.assertEqual(self.get_redirect("/redirectme-too").link, "/to")
+
+    def test_concurrent_update_marks_filter_stale(self):
+        self.build_filters()
+        self.assertIsNone(self.get_redirect("/redirectme-too"))
+
+        # Simulate another process holding the lock while the redirect is saved
+        lock_key = redirect_filter._get_cache_key(None, ":lock")
+        cache.add(lock_key, True)
+        with self.captureOnCommitCallbacks(execute=True):
+            Redirect.objects.create(old_path="/redirectme-too", redirect_link="/to")
+
+        # Lookups fall back to the database until the filter can be rebuilt
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertEqual(redirect_filter.get_filters([None]), {None: None})
+            self.assertEqual(self.get_redirect("/redirectme-too").link, "/to")
+
+        # Run the scheduled rebuild once the lock is released
+        cache.delete(lock_key)
+        with self.captureOnCommitCallbacks(execute=True):
+            for callback in callbacks:
+                callback()
+        self.assertIn("/redirectme-too", redirect_filter.get_filters([None])[None])
+
+    def test_full_filter_is_rebuilt(self):
+        self.build_filters()
+        bloom_filter = redirect_filter.get_filters([None])[None]
+        self.assertEqual(bloom_filter.capacity, 1000)
+
+        redirect_filter.add(None, [f"/path-{i}" for i in range(1100)])
+        self.build_filters()
+        bloom_filter = redirect_filter.get_filters([None])[None]
+        self.assertEqual(bloom_filter.count, 1)
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRedirectsBloomFilterCommand(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        cache.clear()
+        self.site = Site.objects.get(is_default_site=True)
+        Redirect.objects.create(old_path="/redirectme", redirect_link="/to")
+
+    def call_command(self, *args):
+        stdout = StringIO()
+        call_command("redirects_bloom_filter", *args, stdout=stdout)
+        return stdout.getvalue()
+
+    def test_all_sites(self):
+        output = self.call_command()
+        self.assertIn(f"Site {self.site.pk}: 0/1000 redirects", output)
+        self.assertIn("All sites: 1/1000 redirects", output)
+
+    def test_check(self):
+        output = self.call_command("--site", "all", "--check", "/redirectme/")
+        self.assertNotIn("Site", output)
+        self.assertIn("/redirectme: may be present", output)
+
+        output = self.call_command("--site", "all", "--check", "/does-not-exist")
+        self.assertIn("/does-not-exist: not present", output)
+
+    def test_rebuild(self):
+        self.call_command("--site", "all")
+        Redirect.objects.bulk_create(
+            [Redirect(old_path="/redirectme-too", redirect_link="/to")]
+        )
+        output = self.call_command("--site", "all", "--check", "/redirectme-too")
+        self.assertIn("/redirectme-too: not present", output)
+
+        output = self.call_command(
+            "--site", "all", "--rebuild", "--check", "/redirectme-too"
+        )
+        self.assertIn("All sites: 2/1000 redirects", output)
+        self.assertIn("/redirectme-too: may be present", output)
@@ -1,7 +1,9 @@
 from io import BytesIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.auth.models import Permission
+from django.core.cache import cache
 from django.test import TestCase, override_settings
 from django.urls import reverse
 from openpyxl.reader.excel import load_workbook
@@ -9,6 +11,10 @@ from openpyxl.reader.excel import load_workbook
 from wagtail.admin.admin_url_finder import AdminURLFinder
 from wagtail.contrib.frontend_cache.tests import PURGED_URLS
 from wagtail.contrib.redirects import models
+from wagtail.contrib.redirects.cache import redirect_cache, redirect_filter
+from wagtail.contrib.redirects.middleware import get_redirect
+from wagtail.contrib.redirects.signal_handlers import BatchRedirectCreator
+from wagtail.coreutils import get_dummy_request
 from wagtail.log_actions import registry as log_registry
 from wagtail.models import Page, Site
 from wagtail.test.routablepage.models import RoutablePageTest
@@ -597,6 +603,102 @@ class TestRedirects(TestCase):
         self.assertIs(redirect.is_permanent, True)
 
 
+@override_settings(
+    WAGTAILREDIRECTS_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRedirectsWithCache(TestRedirects):
+    # This inherits from TestRedirects so contains all the same test cases,
+    # run against the cached redirect lookup
+
+    def setUp(self):
+        cache.clear()
+        redirect_cache.clear()
+        self.addCleanup(redirect_cache.clear)
+
+    def get_redirect(self, path, site=None):
+        request = get_dummy_request(path=path, site=site)
+        return get_redirect(request, models.Redirect.normalise_path(path))
+
+    def test_redirect_miss_does_not_query_database(self):
+        models.Redirect.objects.create(old_path="/redirectme", redirect_link="/to")
+        request = get_dummy_request(path="/does-not-exist/")
+        Site.find_for_request(request)
+        # Load the redirects into the cache
+        self.assertIsNone(get_redirect(request, "/does-not-exist"))
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(get_redirect(request, "/does-not-exist-either"))
+            self.assertIsNone(get_redirect(request, "/redirectme?foo=bar"))
+
+        with self.assertNumQueries(1):
+            self.assertEqual(get_redirect(request, "/redirectme").link, "/to")
+
+    def test_save_and_delete_update_cache(self):
+        self.assertIsNone(self.get_redirect("/redirectme"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect = models.Redirect.objects.create(
+                old_path="/redirectme", redirect_link="/to"
+            )
+        self.assertEqual(self.get_redirect("/redirectme"), redirect)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect.old_path = "/redirectme-too"
+            redirect.save()
+        self.assertIsNone(self.get_redirect("/redirectme"))
+        self.assertEqual(self.get_redirect("/redirectme-too"), redirect)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            redirect.delete()
+        self.assertIsNone(self.get_redirect("/redirectme-too"))
+
+    def test_bulk_created_redirects_update_cache(self):
+        self.assertIsNone(self.get_redirect("/redirectme"))
+
+        batch = BatchRedirectCreator(max_size=10)
+        batch.add(old_path="/redirectme", redirect_link="/to")
+        with self.captureOnCommitCallbacks(execute=True):
+            batch.process()
+        self.assertEqual(self.get_redirect("/redirectme").link, "/to")
+
+    def test_other_process_changes_invalidate_cache(self):
+        self.assertIsNone(self.get_redirect("/redirectme"))
+
+        # Simulate a change made in another process by bumping the version
+        # without clearing this process's cached redirects
+        with mock.patch.object(redirect_cache, "clear"):
+            redirect_cache.invalidate()
+            models.Redirect.objects.bulk_create(
+                [models.Redirect(old_path="/redirectme", redirect_link="/to")]
+            )
+        self.assertEqual(self.get_redirect("/redirectme").link, "/to")
+
+    def test_paths_with_same_hash(self):
+        redirect = models.Redirect.objects.create(
+            old_path="/redirectme", redirect_link="/to"
+        )
+        models.Redirect.objects.create(old_path="/redirectme-too", redirect_link="/to")
+
+        with mock.patch("wagtail.contrib.redirects.cache.hash_path", return_value=1):
+            self.assertEqual(self.get_redirect("/redirectme"), redirect)
+            self.assertIsNone(self.get_redirect("/does-not-exist"))
+
+
+@override_settings(
+    WAGTAILREDIRECTS_BLOOM_FILTER_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRedirectsWithBloomFilter(TestRedirects):
+    # This inherits from TestRedirects so contains all the same test cases,
+    # run with redirect lookups being skipped for paths missing from the filter
+
+    def setUp(self):
+        cache.clear()
+        for site_id in [None, *Site.objects.values_list("pk", flat=True)]:
+            redirect_filter.rebuild(site_id)
+
+
 @override_settings(
     CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 )
@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from django.test import TestCase, override_settings
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.contrib.frontend_cache.tests import PURGED_URLS
 from wagtail.contrib.redirects.models import Redirect
 from wagtail.coreutils import get_dummy_request
@@ -209,6 +210,24 @@ class TestAutocreateRedirects(WagtailTestUtils, TestCase):
             },
         )
 
+    def test_redirects_created_on_bulk_move(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            BulkMovePageAction([self.event_index], self.other_page).execute()
+
+        redirects = Redirect.objects.all()
+        self.assertEqual(
+            {r.old_path for r in redirects},
+            {
+                "/events",
+                "/events/christmas",
+                "/events/final-event",
+                "/events/saint-patrick/pointless-suffix",
+            },
+        )
+        self.assertIn(self.event_index.id, {r.redirect_page_id for r in redirects})
+        for r in redirects:
+            self.assertTrue(r.automatically_created)
+
     def test_no_redirects_created_when_pages_are_moved_to_a_different_site(self):
         with self.captureOnCommitCallbacks(execute=True):
             # Add a new home page
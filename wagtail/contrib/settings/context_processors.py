@@ -1,4 +1,8 @@
-from wagtail.contrib.settings.models import BaseGenericSetting, BaseSiteSetting
+from wagtail.contrib.settings.models import (
+    BaseGenericSetting,
+    BaseSiteSetting,
+    settings_cache,
+)
 from wagtail.models import Site
 
 from .registry import registry
@@ -11,20 +15,65 @@ class SettingProxy(dict):
 
     def __init__(self, request_or_site):
         self.request_or_site = request_or_site
+        self.prefetched = None
 
     def __missing__(self, app_label):
-        self[app_label] = value = SettingModuleProxy(self.request_or_site, app_label)
+        if self.prefetched is None:
+            self.prefetched = self.prefetch_settings()
+        self[app_label] = value = SettingModuleProxy(
+            self.request_or_site, app_label, prefetched=self.prefetched
+        )
         return value
 
+    def prefetch_settings(self):
+        """
+        When settings are cached, fetch all registered settings for the site from
+        the cache at once, rather than one at a time as they are used. Returns a
+        dict of the settings found, keyed by model.
+        """
+        if not settings_cache.enabled or self.request_or_site is None:
+            return {}
+
+        if isinstance(self.request_or_site, Site):
+            request = None
+            site = self.request_or_site
+        else:
+            request = self.request_or_site
+            site = Site.find_for_request(request)
+
+        keys = []
+        for Model in registry:
+            if request is not None and hasattr(request, Model.get_cache_attr_name()):
+                continue
+            if issubclass(Model, BaseSiteSetting):
+                if site is not None:
+                    keys.append((Model, site.pk))
+            else:
+                keys.append((Model, None))
+        if not keys:
+            return {}
+
+        prefetched = {}
+        found = settings_cache.get_many(keys, settings_cache.get_version())
+        for (Model, site_id), instance in found.items():
+            if request is not None:
+                # Share the instance with for_request() and load()
+                if site_id is not None:
+                    instance._request = request
+                setattr(request, Model.get_cache_attr_name(), instance)
+            prefetched[Model] = instance
+        return prefetched
+
 
 class SettingModuleProxy(dict):
     """
     Get a specific setting instance using proxy['modelname']
     """
 
-    def __init__(self, request_or_site, app_label):
+    def __init__(self, request_or_site, app_label, prefetched=None):
         self.app_label = app_label
         self.request_or_site = request_or_site
+        self.prefetched = prefetched or {}
 
     def __getitem__(self, model_name):
         """Get a setting instance for a model"""
@@ -49,6 +98,9 @@ class SettingModuleProxy(dict):
                 f"Could not find model matching `{self.app_label}.{model_name}`."
             )
 
+        if Model in self.prefetched:
+            return self.prefetched[Model]
+
         if issubclass(Model, BaseGenericSetting):
             return Model.load(request_or_site=self.request_or_site)
         elif issubclass(Model, BaseSiteSetting):
@@ -1,4 +1,11 @@
-from django.db import models
+import copy
+import threading
+import uuid
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models, transaction
 from django.utils.functional import cached_property
 from django.utils.translation import gettext as _
 
@@ -16,6 +23,118 @@ __all__ = [
 ]
 
 
+class SettingsCache:
+    """
+    A cache of setting instances shared between requests, used by
+    ``BaseSiteSetting.for_site`` and ``BaseGenericSetting.load`` when the
+    ``WAGTAILSETTINGS_CACHE_ENABLED`` setting is ``True``.
+
+    Instances are stored in Django's cache, and in a per-process LRU so that they
+    don't need to be fetched and unpickled on every request. Both are keyed by a
+    version held in Django's cache, which is bumped whenever a setting is saved or
+    deleted, invalidating the cached settings of every process. Each lookup
+    returns a copy of the cached instance, so that it can be modified without
+    affecting other requests.
+    """
+
+    version_cache_key = "wagtail_settings_cache_version"
+    cache_key_prefix = "wagtail_settings"
+    timeout = 3600
+    maxsize = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAILSETTINGS_CACHE_ENABLED", False)
+
+    def get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def _get_key(self, model, site_id, version):
+        return (version, model._meta.label_lower, site_id)
+
+    def _get_cache_key(self, key):
+        return "{}:{}:{}:{}".format(self.cache_key_prefix, *key)
+
+    def _copy(self, instance):
+        instance = copy.copy(instance)
+        instance._page_url_cache = {}
+        return instance
+
+    def get_many(self, keys, version):
+        """
+        Return a dict of cached setting instances for the given list of
+        ``(model, site_id)`` pairs, where ``site_id`` is ``None`` for generic
+        settings. Settings that are not in the cache are omitted. Settings missing
+        from this process's cache are fetched from Django's cache at once.
+        """
+        found = {}
+        missing = {}
+        with self._lock:
+            for model, site_id in keys:
+                key = self._get_key(model, site_id, version)
+                instance = self._entries.get(key)
+                if instance is None:
+                    missing[self._get_cache_key(key)] = (key, model, site_id)
+                else:
+                    self._entries.move_to_end(key)
+                    found[(model, site_id)] = self._copy(instance)
+
+        if missing:
+            for cache_key, instance in cache.get_many(list(missing)).items():
+                key, model, site_id = missing[cache_key]
+                self._set_local(key, instance)
+                found[(model, site_id)] = self._copy(instance)
+
+        return found
+
+    def get(self, model, site_id, version):
+        return self.get_many([(model, site_id)], version).get((model, site_id))
+
+    def set(self, model, site_id, instance, version):
+        key = self._get_key(model, site_id, version)
+        instance = self._copy(instance)
+        cache.set(self._get_cache_key(key), instance, self.timeout)
+        self._set_local(key, instance)
+
+    def _set_local(self, key, instance):
+        with self._lock:
+            self._entries[key] = instance
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self):
+        """
+        Discard the cached settings of all processes, by bumping the version.
+        """
+        cache.set(self.version_cache_key, uuid.uuid4().hex, None)
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+settings_cache = SettingsCache()
+
+
+def invalidate_settings_cache(**kwargs):
+    if settings_cache.enabled:
+        # Invalidate straight away so the change is seen within this transaction,
+        # and again on commit, as other processes may have cached the old settings
+        # under the new version in the meantime
+        settings_cache.invalidate()
+        transaction.on_commit(settings_cache.invalidate)
+
+
 class AbstractSetting(models.Model):
     """
     The abstract base model for settings. Subclasses must be registered using
@@ -154,8 +273,21 @@ class BaseSiteSetting(AbstractSetting):
         """
         if site is None:
             raise cls.DoesNotExist("%s does not exist for site None." % cls)
+
+        if settings_cache.enabled:
+            version = settings_cache.get_version()
+            instance = settings_cache.get(cls, site.pk, version)
+            if instance is not None:
+                return instance
+
         queryset = cls.base_queryset()
         instance, created = queryset.get_or_create(site=site)
+
+        if settings_cache.enabled:
+            if created:
+                # Creating the instance invalidated the cache
+                version = settings_cache.get_version()
+            settings_cache.set(cls, site.pk, instance, version)
         return instance
 
     def __str__(self):
@@ -183,10 +315,23 @@ class BaseGenericSetting(AbstractSetting):
         use sequential IDs (e.g. Postgres).
         """
 
-        first_obj = cls.base_queryset().first()
-        if first_obj is None:
-            return cls.objects.create()
-        return first_obj
+        if settings_cache.enabled:
+            version = settings_cache.get_version()
+            obj = settings_cache.get(cls, None, version)
+            if obj is not None:
+                return obj
+
+        obj = cls.base_queryset().first()
+        created = obj is None
+        if created:
+            obj = cls.objects.create()
+
+        if settings_cache.enabled:
+            if created:
+                # Creating the instance invalidated the cache
+                version = settings_cache.get_version()
+            settings_cache.set(cls, None, obj, version)
+        return obj
 
     @classmethod
     def load(cls, request_or_site=None):
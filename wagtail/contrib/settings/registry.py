@@ -1,5 +1,6 @@
 from django.apps import apps
 from django.contrib.auth.models import Permission
+from django.db.models.signals import post_delete, post_save
 from django.urls import reverse
 from django.utils.text import capfirst
 
@@ -61,7 +62,11 @@ class Registry(list):
         self._model_icons = {}
 
     def register(self, model, icon="cog", **kwargs):
-        from .models import BaseGenericSetting, BaseSiteSetting
+        from .models import (
+            BaseGenericSetting,
+            BaseSiteSetting,
+            invalidate_settings_cache,
+        )
 
         """
         Register a model as a setting, adding it to the wagtail admin menu
@@ -74,6 +79,10 @@ class Registry(list):
             return model
         self.append(model)
 
+        # Discard cached settings whenever they change
+        post_save.connect(invalidate_settings_cache, sender=model)
+        post_delete.connect(invalidate_settings_cache, sender=model)
+
         # Register a new menu item in the settings menu
         @hooks.register("register_settings_menu_item")
         def menu_hook():
@@ -1,7 +1,8 @@
 from django.test import TestCase, override_settings
 
+from wagtail.contrib.settings.models import settings_cache
 from wagtail.models import Site
-from wagtail.test.testapp.models import ImportantPagesGenericSetting
+from wagtail.test.testapp.models import ImportantPagesGenericSetting, TestGenericSetting
 
 from .base import GenericSettingsTestMixin
 
@@ -121,3 +122,44 @@ class GenericSettingModelTestCase(GenericSettingsTestMixin, TestCase):
             str(ImportantPagesGenericSetting.load()),
             "important pages settings",
         )
+
+
+@override_settings(
+    ALLOWED_HOSTS=["localhost", "other"],
+    WAGTAILSETTINGS_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class GenericSettingCacheTestCase(GenericSettingsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        settings_cache.invalidate()
+
+    def tearDown(self):
+        settings_cache.clear()
+
+    def test_load_is_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(TestGenericSetting.load(), self.default_settings)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(TestGenericSetting.load(), self.default_settings)
+            self.assertEqual(
+                TestGenericSetting.load(request_or_site=self.get_request()).title,
+                "Default GenericSettings title",
+            )
+
+    def test_load_creates_and_caches_settings(self):
+        TestGenericSetting.objects.all().delete()
+
+        settings = TestGenericSetting.load()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(TestGenericSetting.load(), settings)
+
+    def test_invalidated_on_save(self):
+        TestGenericSetting.load()
+
+        self.default_settings.title = "New title"
+        self.default_settings.save()
+
+        self.assertEqual(TestGenericSetting.load().title, "New title")
@@ -2,6 +2,7 @@ import pickle
 
 from django.test import RequestFactory, TestCase, override_settings
 
+from wagtail.contrib.settings.models import settings_cache
 from wagtail.models import Site
 from wagtail.test.testapp.models import ImportantPagesSiteSetting, TestSiteSetting
 
@@ -223,3 +224,95 @@ class SettingModelTestCase(SiteSettingsTestMixin, TestCase):
                 self.assertEqual(settings.get_page_url("test_attribute"), "")
                 # when called indirectly via shortcut
                 self.assertEqual(settings.page_url.test_attribute, "")
+
+
+@override_settings(
+    ALLOWED_HOSTS=["localhost", "other"],
+    WAGTAILSETTINGS_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class SiteSettingCacheTestCase(SiteSettingsTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        settings_cache.invalidate()
+
+    def tearDown(self):
+        settings_cache.clear()
+
+    def test_for_site_is_cached(self):
+        with self.assertNumQueries(2):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site), self.default_settings
+            )
+            self.assertEqual(
+                TestSiteSetting.for_site(self.other_site), self.other_settings
+            )
+
+        with self.assertNumQueries(0):
+            settings = TestSiteSetting.for_site(self.default_site)
+            self.assertEqual(settings, self.default_settings)
+            self.assertEqual(settings.title, "Site title")
+            self.assertEqual(
+                TestSiteSetting.for_site(self.other_site).title, "Other title"
+            )
+
+        # Settings are shared with other processes through Django's cache
+        settings_cache.clear()
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site).title, "Site title"
+            )
+
+    def test_for_site_returns_copies(self):
+        settings = TestSiteSetting.for_site(self.default_site)
+        settings.title = "Changed"
+
+        self.assertEqual(
+            TestSiteSetting.for_site(self.default_site).title, "Site title"
+        )
+
+    def test_for_request_is_cached(self):
+        TestSiteSetting.for_request(self.get_request())
+
+        request = self.get_request()
+        Site.find_for_request(request)
+        with self.assertNumQueries(0):
+            settings = TestSiteSetting.for_request(request)
+        self.assertEqual(settings, self.default_settings)
+        self.assertIs(settings._request, request)
+
+    def test_invalidated_on_save(self):
+        TestSiteSetting.for_site(self.default_site)
+
+        self.default_settings.title = "New title"
+        self.default_settings.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site).title, "New title"
+            )
+
+    def test_invalidated_on_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.default_settings.title = "New title"
+            self.default_settings.save()
+            version = settings_cache.get_version()
+            # Cached by another process before the change is committed
+            settings_cache.set(
+                TestSiteSetting, self.default_site.pk, self.other_settings, version
+            )
+
+        self.assertNotEqual(settings_cache.get_version(), version)
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                TestSiteSetting.for_site(self.default_site).title, "New title"
+            )
+
+    def test_invalidated_on_delete(self):
+        TestSiteSetting.for_site(self.default_site)
+
+        self.default_settings.delete()
+
+        settings = TestSiteSetting.for_site(self.default_site)
+        self.assertNotEqual(settings.pk, self.default_settings.pk)
+        self.assertEqual(settings.title, "")
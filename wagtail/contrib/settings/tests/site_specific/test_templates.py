@@ -1,9 +1,14 @@
+from unittest import mock
+
+from django.core.cache import cache
 from django.template import Context, RequestContext, Template, engines
 from django.test import TestCase
 from django.test.utils import override_settings
 
+from wagtail.contrib.settings.models import settings_cache
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Site
+from wagtail.test.testapp.models import TestGenericSetting
 from wagtail.test.utils import WagtailTestUtils
 
 from .base import SiteSettingsTestMixin
@@ -315,3 +320,67 @@ class TestSiteSettingsJinja(TemplateTestCase):
         template = '{{ settings("tests.testsitesetting").title }}'
         with self.assertRaises(RuntimeError):
             self.render(template, context, request_context=False)
+
+
+@override_settings(
+    WAGTAILSETTINGS_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestContextProcessorWithCache(TemplateTestCase):
+    template = (
+        "{{ settings.tests.TestSiteSetting.title }} "
+        "{{ settings.tests.TestGenericSetting.title }}"
+    )
+
+    def setUp(self):
+        super().setUp()
+        TestGenericSetting.objects.create(title="Generic title")
+        settings_cache.invalidate()
+
+    def tearDown(self):
+        settings_cache.clear()
+
+    def test_settings_are_fetched_at_once(self):
+        # Populate the cache
+        self.render(self.get_request(), self.template)
+
+        # Simulate another process, with settings only in Django's cache
+        settings_cache.clear()
+        request = self.get_request()
+        Site.find_for_request(request)
+
+        with (
+            self.assertNumQueries(0),
+            mock.patch(
+                "wagtail.contrib.settings.models.cache.get_many",
+                wraps=cache.get_many,
+            ) as get_many,
+        ):
+            self.assertEqual(
+                self.render(request, self.template), "Site title Generic title"
+            )
+
+        get_many.assert_called_once()
+
+    def test_settings_for_other_site(self):
+        self.render(self.get_request(), self.template)
+
+        request = self.get_request(site=self.other_site)
+        self.assertEqual(
+            self.render(request, self.template), "Other title Generic title"
+        )
+        self.assertEqual(
+            self.render(request, self.template), "Other title Generic title"
+        )
+
+    def test_get_settings_with_default_site(self):
+        template = Template(
+            "{% load wagtailsettings_tags %}"
+            "{% get_settings use_default_site=True %}"
+            "{{ settings.tests.TestSiteSetting.title }}"
+        )
+        self.assertEqual(template.render(Context()), "Site title")
+
+        with self.assertNumQueries(1):
+            # Only the default site is fetched from the database
+            self.assertEqual(template.render(Context()), "Site title")
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from wagtail.contrib.sitemaps.snapshots import SitemapSnapshot
+from wagtail.models import Site
+
+
+class Command(BaseCommand):
+    help = "Writes the sitemap files of each site to storage, to be served by the sitemap snapshot views"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--site",
+            help="Only generate the sitemap of the site with this id",
+            type=str,
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="Number of pages to load from the database at a time (default: %(default)s)",
+        )
+
+    def handle(self, *args, **options):
+        sites = Site.objects.select_related("root_page").order_by("pk")
+        if options["site"]:
+            try:
+                sites = [sites.get(id=options["site"])]
+            except (Site.DoesNotExist, ValueError) as e:
+                raise CommandError(f"Site '{options['site']}' does not exist") from e
+
+        for site in sites:
+            shards = SitemapSnapshot(site, chunk_size=options["chunk_size"]).generate()
+            num_urls = sum(shard["urls"] for shard in shards)
+            self.stdout.write(
+                f"{site}: wrote {num_urls} URL(s) to {len(shards)} sitemap file(s)"
+            )
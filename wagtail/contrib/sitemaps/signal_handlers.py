@@ -0,0 +1,29 @@
+from django.conf import settings
+
+from wagtail.signals import page_published, page_slug_changed, page_unpublished
+
+
+def _update_sitemap_snapshots(page, include_descendants=False):
+    from .tasks import update_sitemap_snapshots_task
+
+    if getattr(settings, "WAGTAILSITEMAPS_SNAPSHOT_AUTO_UPDATE", False):
+        update_sitemap_snapshots_task.enqueue([page.path], include_descendants)
+
+
+def page_published_signal_handler(instance, **kwargs):
+    _update_sitemap_snapshots(instance)
+
+
+def page_unpublished_signal_handler(instance, **kwargs):
+    _update_sitemap_snapshots(instance)
+
+
+def page_slug_changed_signal_handler(instance, **kwargs):
+    # The URLs of all descendants have changed too
+    _update_sitemap_snapshots(instance, include_descendants=True)
+
+
+def register_signal_handlers():
+    page_published.connect(page_published_signal_handler)
+    page_unpublished.connect(page_unpublished_signal_handler)
+    page_slug_changed.connect(page_slug_changed_signal_handler)
@@ -7,8 +7,9 @@ from django.contrib.sitemaps import Sitemap as DjangoSitemap
 
 
 class Sitemap(DjangoSitemap):
-    def __init__(self, request=None):
+    def __init__(self, request=None, site=None):
         self.request = request
+        self.site = site
 
     def location(self, obj):
         return obj.get_full_url(self.request)
@@ -21,6 +22,9 @@ class Sitemap(DjangoSitemap):
     def get_wagtail_site(self):
         from wagtail.models import Site
 
+        if self.site is not None:
+            return self.site
+
         site = Site.find_for_request(self.request)
         if site is None:
             return Site.objects.select_related("root_page").get(is_default_site=True)
@@ -37,12 +41,29 @@ class Sitemap(DjangoSitemap):
             .specific()
         )
 
+    def _get_url_info_items(self, item, url_resolver):
+        from wagtail.models import Page
+
+        if type(item).get_sitemap_urls is Page.get_sitemap_urls:
+            # Compute the URLs of pages that don't customise their sitemap
+            # entries together, rather than reversing the URL of each page
+            return [
+                {
+                    "location": url_resolver.get_full_url(item),
+                    "lastmod": self.lastmod(item),
+                }
+            ]
+        return item.get_sitemap_urls(self.request)
+
     def _urls(self, page, protocol, domain):
+        from wagtail.url_routing import PageURLResolver
+
         urls = []
         last_mods = set()
+        url_resolver = PageURLResolver(self.request)
 
         for item in self.paginator.page(page).object_list.iterator():
-            url_info_items = item.get_sitemap_urls(self.request)
+            url_info_items = self._get_url_info_items(item, url_resolver)
 
             for url_info in url_info_items:
                 urls.append(url_info)
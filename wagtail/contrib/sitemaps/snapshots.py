@@ -0,0 +1,380 @@
+import bisect
+import datetime
+import gzip
+import json
+import tempfile
+import time
+from contextlib import contextmanager
+from xml.sax.saxutils import escape, quoteattr
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import InvalidStorageError, default_storage, storages
+from django.urls import NoReverseMatch, reverse
+from django.utils import dateformat, timezone
+from django.utils.module_loading import import_string
+
+from wagtail.url_routing import PageURLResolver
+
+from .sitemap_generator import Sitemap
+
+SITEMAP_NAMESPACES = (
+    'xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" '
+    'xmlns:xhtml="http://www.w3.org/1999/xhtml"'
+)
+
+
+def get_sitemap_storage():
+    """
+    Obtain the storage object for sitemap snapshot files.
+    Returns custom storage (if defined), or the default storage.
+    """
+    storage = getattr(settings, "WAGTAILSITEMAPS_STORAGE", default_storage)
+    if isinstance(storage, str):
+        try:
+            # First see if the string is a storage alias
+            storage = storages[storage]
+        except InvalidStorageError:
+            # Otherwise treat the string as a dotted path
+            try:
+                module = import_string(storage)
+                storage = module()
+            except ImportError as e:
+                raise ImproperlyConfigured(
+                    "WAGTAILSITEMAPS_STORAGE must be either a valid storage alias or dotted module path."
+                ) from e
+
+    return storage
+
+
+def _format_lastmod(value, format_string):
+    if isinstance(value, datetime.datetime) and timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return dateformat.format(value, format_string)
+
+
+def _get_latest_lastmod(current_lastmod, new_lastmod):
+    # Dates and naive datetimes are compared as UTC datetimes
+    if not isinstance(new_lastmod, datetime.datetime):
+        new_lastmod = datetime.datetime.combine(new_lastmod, datetime.time.min)
+    if timezone.is_naive(new_lastmod):
+        new_lastmod = timezone.make_aware(new_lastmod, datetime.timezone.utc)
+    return new_lastmod if current_lastmod is None else max(current_lastmod, new_lastmod)
+
+
+class _ShardWriter:
+    """
+    Writes the URL entries of a sitemap file to a gzipped temporary file as they
+    are added, following the format of Django's ``sitemap.xml`` template.
+    """
+
+    def __init__(self, start_path):
+        self.start_path = start_path
+        self.count = 0
+        self.lastmod = None
+        self.file = tempfile.TemporaryFile()
+        self.gzip_file = gzip.GzipFile(fileobj=self.file, mode="wb", mtime=0)
+        self.write(
+            f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset {SITEMAP_NAMESPACES}>\n'
+        )
+
+    def write(self, text):
+        self.gzip_file.write(text.encode())
+
+    def add(self, url_info):
+        parts = ["<url><loc>", escape(url_info["location"]), "</loc>"]
+        lastmod = url_info.get("lastmod")
+        if lastmod:
+            parts += ["<lastmod>", _format_lastmod(lastmod, "Y-m-d"), "</lastmod>"]
+            self.lastmod = _get_latest_lastmod(self.lastmod, lastmod)
+        if url_info.get("changefreq"):
+            parts += [
+                "<changefreq>",
+                escape(str(url_info["changefreq"])),
+                "</changefreq>",
+            ]
+        if url_info.get("priority"):
+            parts += ["<priority>", escape(str(url_info["priority"])), "</priority>"]
+        for alternate in url_info.get("alternates", ()):
+            parts.append(
+                '<xhtml:link rel="alternate" hreflang=%s href=%s/>'
+                % (quoteattr(alternate["lang_code"]), quoteattr(alternate["location"]))
+            )
+        parts.append("</url>\n")
+        self.write("".join(parts))
+        self.count += 1
+
+    def close(self):
+        """
+        Finish the sitemap file and return the temporary file containing it.
+        """
+        self.write("</urlset>\n")
+        self.gzip_file.close()
+        self.file.seek(0)
+        return self.file
+
+
+class SitemapSnapshot:
+    """
+    Pre-rendered sitemap files for a site, kept in storage so that they can be
+    served without querying and rendering the whole page tree on each request.
+
+    The sitemap is split into gzipped shard files of up to ``limit`` URLs, each
+    covering a range of tree paths, along with an index file that lists the shards
+    and a manifest recording the range and file of each shard. ``generate()``
+    streams the pages of the site in tree path order to write all of the files, and
+    ``update()`` rewrites only the shards covering the given tree paths.
+
+    Files are never overwritten: each change writes new files under names that
+    include the new version number of the snapshot, along with a new manifest that
+    refers to them. The views find the files through the latest manifest, which is
+    also held in Django's cache, so requests never see a missing or partly written
+    file. Files that are no longer referred to by the latest two manifests are
+    deleted. Changes to the snapshot of a site are made one at a time, while holding
+    a lock in Django's cache.
+    """
+
+    sitemap_class = Sitemap
+    shard_url_name = "wagtailsitemaps_snapshot"
+    cache_key_prefix = "wagtail_sitemaps_snapshot"
+    # The number of seconds after which the lock is released, should the process
+    # holding it fail to release it
+    lock_timeout = 600
+
+    def __init__(self, site, storage=None, chunk_size=2000, limit=None):
+        self.site = site
+        self.storage = storage or get_sitemap_storage()
+        self.chunk_size = chunk_size
+        self.sitemap = self.sitemap_class(site=site)
+        self.limit = limit or self.sitemap.limit
+
+    def get_file_path(self, name):
+        return f"sitemaps/{self.site.pk}/{name}"
+
+    def get_index_name(self, version):
+        return f"sitemap-{version}.xml"
+
+    def get_shard_name(self, index, version):
+        return f"sitemap-{index + 1}-{version}.xml.gz"
+
+    def get_manifest_name(self, version):
+        # Zero-padded, so that the latest manifest sorts last
+        return f"manifest-{version:010d}.json"
+
+    def get_shard_url(self, index, name):
+        try:
+            path = reverse(self.shard_url_name, kwargs={"shard": index + 1})
+        except NoReverseMatch:
+            # The snapshot views are not in use, so point to the stored files
+            return self.storage.url(self.get_file_path(name))
+        return self.site.root_url + path
+
+    def _get_cache_key(self, suffix=""):
+        return f"{self.cache_key_prefix}:{self.site.pk}{suffix}"
+
+    @contextmanager
+    def _lock(self):
+        lock_key = self._get_cache_key(":lock")
+        while not cache.add(lock_key, True, self.lock_timeout):
+            time.sleep(0.1)
+        try:
+            yield
+        finally:
+            cache.delete(lock_key)
+
+    def _list_files(self):
+        try:
+            return self.storage.listdir(self.get_file_path(""))[1]
+        except FileNotFoundError:
+            return []
+
+    def load_manifest(self):
+        """
+        Return the manifest of the latest version of the stored snapshot, or
+        ``None`` if the snapshot has not been generated.
+        """
+        manifest = cache.get(self._get_cache_key())
+        if manifest is not None:
+            return manifest
+
+        manifest_names = sorted(
+            name
+            for name in self._list_files()
+            if name.startswith("manifest-") and name.endswith(".json")
+        )
+        if not manifest_names:
+            return None
+
+        with self.storage.open(self.get_file_path(manifest_names[-1]), "rb") as f:
+            manifest = json.load(f)
+        cache.set(self._get_cache_key(), manifest, None)
+        return manifest
+
+    def _save_file(self, name, content):
+        # The name includes the version, so this never replaces a file being served
+        return self.storage.save(self.get_file_path(name), content).rsplit("/", 1)[-1]
+
+    def _iter_url_info(self, start_path="", end_path=None):
+        # Stream the pages in tree path order, fetching them in chunks with keyset
+        # pagination so that large sites are never loaded at once
+        queryset = self.sitemap.items()
+        if start_path:
+            queryset = queryset.filter(path__gte=start_path)
+        if end_path:
+            queryset = queryset.filter(path__lt=end_path)
+
+        url_resolver = PageURLResolver()
+        last_path = None
+        while True:
+            chunk = queryset
+            if last_path is not None:
+                chunk = chunk.filter(path__gt=last_path)
+            pages = list(chunk[: self.chunk_size])
+
+            for page in pages:
+                yield page, self.sitemap._get_url_info_items(page, url_resolver)
+
+            if len(pages) < self.chunk_size:
+                break
+            last_path = pages[-1].path
+
+    def _save_shard(self, index, writer, version):
+        with writer.close() as f:
+            name = self.get_shard_name(index, version)
+            name = self._save_file(name, File(f, name=name))
+        return {
+            "start_path": writer.start_path,
+            "urls": writer.count,
+            "lastmod": writer.lastmod.isoformat() if writer.lastmod else None,
+            "file": name,
+        }
+
+    def _save_index(self, shards, version):
+        parts = [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        ]
+        for index, shard in enumerate(shards):
+            parts += [
+                "<sitemap><loc>",
+                escape(self.get_shard_url(index, shard["file"])),
+                "</loc>",
+            ]
+            if shard["lastmod"]:
+                lastmod = datetime.datetime.fromisoformat(shard["lastmod"])
+                parts += ["<lastmod>", _format_lastmod(lastmod, "c"), "</lastmod>"]
+            parts.append("</sitemap>\n")
+        parts.append("</sitemapindex>\n")
+        return self._save_file(
+            self.get_index_name(version), ContentFile("".join(parts).encode())
+        )
+
+    def _save_manifest(self, shards, version, old_manifest):
+        manifest = {
+            "version": version,
+            "index": self._save_index(shards, version),
+            "shards": shards,
+        }
+        self._save_file(
+            self.get_manifest_name(version),
+            ContentFile(json.dumps(manifest).encode()),
+        )
+        # Switch the views over to the new files
+        cache.set(self._get_cache_key(), manifest, None)
+
+        # Delete the files of older versions, keeping those of the previous version
+        # for requests that may still be serving them
+        keep = set()
+        for kept_manifest in [manifest, old_manifest]:
+            if kept_manifest is not None:
+                keep.add(self.get_manifest_name(kept_manifest["version"]))
+                keep.add(kept_manifest["index"])
+                keep.update(shard["file"] for shard in kept_manifest["shards"])
+        for name in self._list_files():
+            if name not in keep:
+                self.storage.delete(self.get_file_path(name))
+
+    def generate(self):
+        """
+        Write all of the sitemap files of the site, and return the list of shards
+        as recorded in the manifest.
+        """
+        with self._lock():
+            # Read the manifest from storage, in case the cached one is out of date
+            cache.delete(self._get_cache_key())
+            return self._generate(self.load_manifest())
+
+    def _generate(self, old_manifest):
+        version = old_manifest["version"] + 1 if old_manifest is not None else 1
+
+        shards = []
+        writer = _ShardWriter(start_path="")
+        for page, url_info_items in self._iter_url_info():
+            # Start a new shard when this page's URLs would not fit, keeping all the
+            # URLs of a page in the same shard
+            if writer.count and writer.count + len(url_info_items) > self.limit:
+                shards.append(self._save_shard(len(shards), writer, version))
+                writer = _ShardWriter(start_path=page.path)
+            for url_info in url_info_items:
+                writer.add(url_info)
+        shards.append(self._save_shard(len(shards), writer, version))
+
+        self._save_manifest(shards, version, old_manifest)
+        return shards
+
+    def update(self, paths, include_descendants=False):
+        """
+        Rewrite the shards that contain the pages with the given tree paths (and
+        their descendants, if ``include_descendants`` is true). Return ``False`` if
+        the snapshot has not been generated, in which case nothing is written.
+        """
+        with self._lock():
+            cache.delete(self._get_cache_key())
+            manifest = self.load_manifest()
+            if manifest is None:
+                return False
+
+            self._update(manifest, paths, include_descendants)
+            return True
+
+    def _update(self, manifest, paths, include_descendants):
+        version = manifest["version"] + 1
+        shards = list(manifest["shards"])
+        start_paths = [shard["start_path"] for shard in shards]
+
+        affected = set()
+        for path in paths:
+            affected.add(bisect.bisect_right(start_paths, path) - 1)
+            if include_descendants:
+                affected.update(
+                    index
+                    for index, start_path in enumerate(start_paths)
+                    if start_path.startswith(path)
+                )
+
+        new_files = []
+        for index in sorted(affected):
+            end_path = start_paths[index + 1] if index + 1 < len(shards) else None
+            writer = _ShardWriter(start_path=start_paths[index])
+            for _page, url_info_items in self._iter_url_info(
+                start_paths[index], end_path
+            ):
+                for url_info in url_info_items:
+                    writer.add(url_info)
+
+            if writer.count > self.limit:
+                # The shard has outgrown the limit, which changes the ranges of the
+                # shards after it, so write the whole snapshot again
+                writer.close().close()
+                for name in new_files:
+                    self.storage.delete(self.get_file_path(name))
+                self._generate(manifest)
+                return
+
+            shards[index] = self._save_shard(index, writer, version)
+            new_files.append(shards[index]["file"])
+
+        self._save_manifest(shards, version, manifest)
@@ -0,0 +1,26 @@
+from django_tasks import task
+
+from wagtail.models import Site
+
+from .snapshots import SitemapSnapshot
+
+
+@task()
+def generate_sitemap_snapshot_task(site_id):
+    site = Site.objects.select_related("root_page").filter(pk=site_id).first()
+    if site is not None:
+        SitemapSnapshot(site).generate()
+
+
+@task()
+def update_sitemap_snapshots_task(paths, include_descendants=False):
+    """
+    Update the shards containing the pages with the given tree paths, in the
+    sitemap snapshots of every site that they belong to.
+    """
+    for site in Site.objects.select_related("root_page"):
+        site_paths = [path for path in paths if path.startswith(site.root_page.path)]
+        if site_paths:
+            SitemapSnapshot(site).update(
+                site_paths, include_descendants=include_descendants
+            )
@@ -1,8 +1,14 @@
 import datetime
+import gzip
+from io import StringIO
+from unittest import mock
 
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.contrib.sites.shortcuts import get_current_site
+from django.core.cache import cache
+from django.core.files.storage import InMemoryStorage
+from django.core.management import call_command
 from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
@@ -10,6 +16,7 @@ from wagtail.models import Page, PageViewRestriction, Site
 from wagtail.test.testapp.models import EventIndex, SimplePage
 
 from .sitemap_generator import Sitemap
+from .snapshots import SitemapSnapshot
 
 
 class TestSitemapGenerator(TestCase):
@@ -106,7 +113,7 @@ class TestSitemapGenerator(TestCase):
         req_protocol = request.scheme
 
         sitemap = Sitemap()
-        with self.assertNumQueries(17):
+        with self.assertNumQueries(15):
             urls = [
                 url["location"]
                 for url in sitemap.get_urls(1, django_site, req_protocol)
@@ -139,7 +146,7 @@ class TestSitemapGenerator(TestCase):
         req_protocol = request.scheme
 
         sitemap = Sitemap()
-        with self.assertNumQueries(19):
+        with self.assertNumQueries(17):
             urls = [
                 url["location"]
                 for url in sitemap.get_urls(1, django_site, req_protocol)
@@ -259,6 +266,274 @@ class TestSitemapGenerator(TestCase):
         self.assertNotIn(self.child_page.page_ptr.specific, pages)
 
 
+class TestSitemapSnapshot(TestCase):
+    def setUp(self):
+        self.storage = InMemoryStorage()
+        storage_settings = override_settings(WAGTAILSITEMAPS_STORAGE=self.storage)
+        storage_settings.enable()
+        self.addCleanup(storage_settings.disable)
+
+        self.site = Site.objects.select_related("root_page").get(is_default_site=True)
+        self.home_page = self.site.root_page
+        for index in range(5):
+            self.home_page.add_child(
+                instance=SimplePage(
+                    title=f"Page {index}",
+                    slug=f"page-{index}",
+                    content="hello",
+                    live=True,
+                    last_published_at=datetime.datetime(
+                        2017, 1, index + 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+                    ),
+                )
+            )
+        self.home_page.add_child(
+            instance=SimplePage(
+                title="Unpublished", slug="unpublished", content="hello", live=False
+            )
+        )
+
+    def read_file(self, name):
+        # Find the file of the latest version of the snapshot
+        manifest = SitemapSnapshot(self.site).load_manifest()
+        if name == "sitemap.xml":
+            name = manifest["index"]
+        else:
+            name = manifest["shards"][int(name.split("-")[1].split(".")[0]) - 1]["file"]
+
+        with self.storage.open(f"sitemaps/{self.site.pk}/{name}", "rb") as f:
+            content = f.read()
+        if name.endswith(".gz"):
+            content = gzip.decompress(content)
+        return content.decode()
+
+    def get_locations(self, name):
+        content = self.read_file(name)
+        return [part.split("</loc>")[0] for part in content.split("<loc>")[1:]]
+
+    def test_generate(self):
+        shards = SitemapSnapshot(self.site).generate()
+
+        self.assertEqual(len(shards), 1)
+        self.assertEqual(shards[0]["urls"], 6)
+        self.assertEqual(
+            self.get_locations("sitemap-1.xml.gz"),
+            ["http://localhost/"]
+            + [f"http://localhost/page-{index}/" for index in range(5)],
+        )
+        self.assertIn(
+            "<lastmod>2017-01-05</lastmod>", self.read_file("sitemap-1.xml.gz")
+        )
+
+        self.assertEqual(
+            self.get_locations("sitemap.xml"),
+            ["http://localhost/sitemap-snapshot-1.xml"],
+        )
+        self.assertIn("<lastmod>2017-01-05T", self.read_file("sitemap.xml"))
+
+    def test_generate_shards(self):
+        shards = SitemapSnapshot(self.site, chunk_size=2, limit=4).generate()
+
+        self.assertEqual([shard["urls"] for shard in shards], [4, 2])
+        self.assertEqual(shards[0]["start_path"], "")
+        self.assertEqual(
+            self.get_locations("sitemap-2.xml.gz"),
+            ["http://localhost/page-3/", "http://localhost/page-4/"],
+        )
+        self.assertEqual(
+            self.get_locations("sitemap.xml"),
+            [
+                "http://localhost/sitemap-snapshot-1.xml",
+                "http://localhost/sitemap-snapshot-2.xml",
+            ],
+        )
+
+        # The files of the previous version are kept, for requests that may still be
+        # serving them, and older versions are removed
+        SitemapSnapshot(self.site).generate()
+        self.assertTrue(
+            self.storage.exists(f"sitemaps/{self.site.pk}/sitemap-2-1.xml.gz")
+        )
+        SitemapSnapshot(self.site).generate()
+        self.assertEqual(
+            sorted(self.storage.listdir(f"sitemaps/{self.site.pk}")[1]),
+            [
+                "manifest-0000000002.json",
+                "manifest-0000000003.json",
+                "sitemap-1-2.xml.gz",
+                "sitemap-1-3.xml.gz",
+                "sitemap-2.xml",
+                "sitemap-3.xml",
+            ],
+        )
+
+    def test_update(self):
+        SitemapSnapshot(self.site, limit=4).generate()
+
+        page = Page.objects.get(slug="page-4")
+        page.title = "Changed"
+        page.last_published_at = datetime.datetime(
+            2018, 1, 1, 12, 0, 0, tzinfo=datetime.timezone.utc
+        )
+        page.save()
+
+        snapshot = SitemapSnapshot(self.site, limit=4)
+        with mock.patch.object(
+            snapshot, "_save_shard", wraps=snapshot._save_shard
+        ) as save_shard:
+            self.assertTrue(snapshot.update([page.path]))
+
+        # Only the shard containing the page is written again
+        save_shard.assert_called_once()
+        self.assertEqual(save_shard.call_args.args[0], 1)
+        self.assertIn(
+            "<lastmod>2018-01-01</lastmod>", self.read_file("sitemap-2.xml.gz")
+        )
+        self.assertIn("<lastmod>2018-01-01T", self.read_file("sitemap.xml"))
+
+    def test_update_writes_new_files(self):
+        SitemapSnapshot(self.site).generate()
+        old_manifest = SitemapSnapshot(self.site).load_manifest()
+
+        page = Page.objects.get(slug="page-4")
+        page.slug = "changed"
+        page.save()
+        SitemapSnapshot(self.site).update([page.path])
+
+        # The files being served are never replaced
+        manifest = SitemapSnapshot(self.site).load_manifest()
+        self.assertEqual(manifest["version"], 2)
+        self.assertNotEqual(manifest["index"], old_manifest["index"])
+        self.assertNotEqual(
+            manifest["shards"][0]["file"], old_manifest["shards"][0]["file"]
+        )
+        with self.storage.open(
+            f"sitemaps/{self.site.pk}/{old_manifest['shards'][0]['file']}"
+        ) as f:
+            self.assertIn(b"/page-4/", gzip.decompress(f.read()))
+        self.assertIn(
+            "http://localhost/changed/", self.get_locations("sitemap-1.xml.gz")
+        )
+
+    def test_manifest_is_read_from_storage(self):
+        SitemapSnapshot(self.site).generate()
+        manifest = SitemapSnapshot(self.site).load_manifest()
+
+        cache.delete(f"wagtail_sitemaps_snapshot:{self.site.pk}")
+        self.assertEqual(SitemapSnapshot(self.site).load_manifest(), manifest)
+
+    def test_update_waits_for_lock(self):
+        SitemapSnapshot(self.site).generate()
+
+        # Simulate another process updating the snapshot, finishing while this
+        # update waits for it
+        lock_key = f"wagtail_sitemaps_snapshot:{self.site.pk}:lock"
+        cache.add(lock_key, True)
+
+        def finish_other_update(seconds):
+            self.assertFalse(save_manifest.called)
+            cache.delete(lock_key)
+
+        snapshot = SitemapSnapshot(self.site)
+        with (
+            mock.patch(
+                "wagtail.contrib.sitemaps.snapshots.time.sleep",
+                side_effect=finish_other_update,
+            ) as sleep,
+            mock.patch.object(
+                snapshot, "_save_manifest", wraps=snapshot._save_manifest
+            ) as save_manifest,
+        ):
+            self.assertTrue(snapshot.update([self.home_page.path]))
+
+        sleep.assert_called_once()
+        save_manifest.assert_called_once()
+        self.assertFalse(cache.get(lock_key))
+
+    def test_update_when_shard_outgrows_limit(self):
+        SitemapSnapshot(self.site, limit=4).generate()
+        new_page = self.home_page.add_child(
+            instance=SimplePage(title="New", slug="new", content="hello", live=True)
+        )
+        for index in range(3):
+            new_page.add_child(
+                instance=SimplePage(
+                    title=f"Child {index}",
+                    slug=f"child-{index}",
+                    content="-",
+                    live=True,
+                )
+            )
+
+        SitemapSnapshot(self.site, limit=4).update([new_page.path], True)
+
+        manifest = SitemapSnapshot(self.site).load_manifest()
+        self.assertEqual([shard["urls"] for shard in manifest["shards"]], [4, 4, 2])
+
+    def test_update_without_snapshot(self):
+        self.assertFalse(SitemapSnapshot(self.site).update([self.home_page.path]))
+        self.assertFalse(self.storage.listdir("")[1])
+
+    @override_settings(WAGTAILSITEMAPS_SNAPSHOT_AUTO_UPDATE=True)
+    def test_update_on_publish(self):
+        SitemapSnapshot(self.site).generate()
+
+        page = self.home_page.add_child(
+            instance=SimplePage(title="New", slug="new", content="hello", live=False)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            page.save_revision().publish()
+        self.assertIn("http://localhost/new/", self.get_locations("sitemap-1.xml.gz"))
+
+        page.refresh_from_db()
+        with self.captureOnCommitCallbacks(execute=True):
+            page.unpublish()
+        self.assertNotIn(
+            "http://localhost/new/", self.get_locations("sitemap-1.xml.gz")
+        )
+
+    def test_snapshot_views(self):
+        response = self.client.get("/sitemap-snapshot.xml")
+        self.assertEqual(response.status_code, 404)
+
+        SitemapSnapshot(self.site).generate()
+
+        response = self.client.get("/sitemap-snapshot.xml")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/xml")
+        self.assertIn(
+            b"http://localhost/sitemap-snapshot-1.xml",
+            b"".join(response.streaming_content),
+        )
+
+        response = self.client.get("/sitemap-snapshot-1.xml")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIn(
+            b"<loc>http://localhost/page-0/</loc>", b"".join(response.streaming_content)
+        )
+
+        response = self.client.get(
+            "/sitemap-snapshot-1.xml", headers={"accept-encoding": "gzip"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn(
+            b"<loc>http://localhost/page-0/</loc>",
+            gzip.decompress(b"".join(response.streaming_content)),
+        )
+
+        response = self.client.get("/sitemap-snapshot-2.xml")
+        self.assertEqual(response.status_code, 404)
+
+    def test_generate_sitemap_snapshots_command(self):
+        stdout = StringIO()
+        call_command("generate_sitemap_snapshots", stdout=stdout)
+
+        self.assertIn("wrote 6 URL(s) to 1 sitemap file(s)", stdout.getvalue())
+        self.assertEqual(len(self.get_locations("sitemap-1.xml.gz")), 6)
+
+
 class TestIndexView(TestCase):
     def test_index_view(self):
         response = self.client.get("/sitemap-index.xml")
@@ -1,8 +1,14 @@
+import gzip
 import inspect
 
 from django.contrib.sitemaps import views as sitemap_views
+from django.http import FileResponse, Http404, StreamingHttpResponse
+from django.utils.cache import patch_vary_headers
+
+from wagtail.models import Site
 
 from .sitemap_generator import Sitemap
+from .snapshots import SitemapSnapshot
 
 
 def index(request, sitemaps, **kwargs):
@@ -26,3 +32,61 @@ def prepare_sitemaps(request, sitemaps):
         else:
             initialised_sitemaps[name] = sitemap_cls
     return initialised_sitemaps
+
+
+def _open_snapshot_file(request, get_name):
+    site = Site.find_for_request(request)
+    if site is None:
+        raise Http404("No site matches this request")
+
+    snapshot = SitemapSnapshot(site)
+    manifest = snapshot.load_manifest()
+    if manifest is None:
+        raise Http404("The sitemap snapshot has not been generated")
+
+    name = get_name(manifest)
+    if name is None:
+        raise Http404("No such sitemap file")
+    try:
+        return snapshot.storage.open(snapshot.get_file_path(name), "rb")
+    except FileNotFoundError:
+        raise Http404("The sitemap snapshot has not been generated") from None
+
+
+def _iter_decompressed(f):
+    with f, gzip.GzipFile(fileobj=f, mode="rb") as gzip_file:
+        yield from iter(lambda: gzip_file.read(8192), b"")
+
+
+@sitemap_views.x_robots_tag
+def snapshot_index(request):
+    """
+    Serve the stored sitemap index of the current site, as written by the
+    ``generate_sitemap_snapshots`` management command.
+    """
+    f = _open_snapshot_file(request, lambda manifest: manifest["index"])
+    return FileResponse(f, content_type="application/xml")
+
+
+@sitemap_views.x_robots_tag
+def snapshot_sitemap(request, shard):
+    """
+    Serve a stored sitemap file of the current site, compressed if the client
+    accepts gzip encoding.
+    """
+
+    def get_shard_file(manifest):
+        if 1 <= shard <= len(manifest["shards"]):
+            return manifest["shards"][shard - 1]["file"]
+
+    f = _open_snapshot_file(request, get_shard_file)
+
+    if "gzip" in request.headers.get("Accept-Encoding", ""):
+        response = FileResponse(f, content_type="application/xml")
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = StreamingHttpResponse(
+            _iter_decompressed(f), content_type="application/xml"
+        )
+    patch_vary_headers(response, ("Accept-Encoding",))
+    return response
@@ -1,10 +1,21 @@
+import threading
+import time
+import types
+from collections import namedtuple
 from contextlib import ContextDecorator
+from functools import wraps
 from operator import itemgetter
 
+from django.conf import settings
+
 from wagtail.utils.apps import get_app_submodules
 
 _hooks = {}
 
+# Hook functions for each hook name, sorted by their order. Entries are discarded
+# whenever a hook is registered or unregistered under that name.
+_sorted_hooks = {}
+
 
 def register(hook_name, fn=None, order=0):
     """
@@ -33,6 +44,12 @@ def register(hook_name, fn=None, order=0):
     if hook_name not in _hooks:
         _hooks[hook_name] = []
     _hooks[hook_name].append((fn, order))
+    _clear_sorted_hooks(hook_name)
+
+
+def _clear_sorted_hooks(hook_name):
+    _sorted_hooks.pop((hook_name, False), None)
+    _sorted_hooks.pop((hook_name, True), None)
 
 
 class TemporaryHook(ContextDecorator):
@@ -45,10 +62,12 @@ class TemporaryHook(ContextDecorator):
             if hook_name not in _hooks:
                 _hooks[hook_name] = []
             _hooks[hook_name].append((fn, self.order))
+            _clear_sorted_hooks(hook_name)
 
     def __exit__(self, exc_type, exc_value, traceback):
         for hook_name, fn in self.hooks:
             _hooks[hook_name].remove((fn, self.order))
+            _clear_sorted_hooks(hook_name)
 
 
 def register_temporarily(hook_name_or_hooks, fn=None, *, order=0):
@@ -107,9 +126,66 @@ def search_for_hooks():
         _searched_for_hooks = True
 
 
+HookTiming = namedtuple("HookTiming", ["calls", "total_time", "max_time"])
+
+_timings_lock = threading.Lock()
+_timings = {}
+
+
+def _record_timing(hook_name, fn, duration):
+    key = (hook_name, f"{fn.__module__}.{fn.__qualname__}")
+    with _timings_lock:
+        calls, total_time, max_time = _timings.get(key, (0, 0.0, 0.0))
+        _timings[key] = HookTiming(
+            calls + 1, total_time + duration, max(max_time, duration)
+        )
+
+
+def _timed(hook_name, fn):
+    if not isinstance(fn, (types.FunctionType, types.MethodType)):
+        # Leave classes and other callables (such as bulk actions) untouched, as
+        # they may be used for more than being called
+        return fn
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _record_timing(hook_name, fn, time.perf_counter() - start)
+
+    return wrapper
+
+
+def get_hook_timings():
+    """
+    Return the time spent in each hook function while ``WAGTAIL_HOOK_TIMING_ENABLED``
+    is ``True``, as a dict mapping ``(hook_name, function_path)`` to a ``HookTiming``
+    of the number of calls, and the total and longest time taken in seconds.
+    """
+    with _timings_lock:
+        return dict(_timings)
+
+
+def reset_hook_timings():
+    with _timings_lock:
+        _timings.clear()
+
+
 def get_hooks(hook_name):
     """Return the hooks function sorted by their order."""
     search_for_hooks()
-    hooks = _hooks.get(hook_name, [])
-    hooks = sorted(hooks, key=itemgetter(1))
-    return [hook[0] for hook in hooks]
+    timing_enabled = bool(getattr(settings, "WAGTAIL_HOOK_TIMING_ENABLED", False))
+    key = (hook_name, timing_enabled)
+    try:
+        hooks = _sorted_hooks[key]
+    except KeyError:
+        hooks = sorted(_hooks.get(hook_name, []), key=itemgetter(1))
+        if timing_enabled:
+            hooks = tuple(_timed(hook_name, fn) for fn, order in hooks)
+        else:
+            hooks = tuple(fn for fn, order in hooks)
+        _sorted_hooks[key] = hooks
+    # Return a list, so that callers may modify it
+    return list(hooks)
@@ -1,7 +1,15 @@
+import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import groupby, repeat
 
-from django.core.management.base import BaseCommand
-from django.db import transaction
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+from django.utils import timezone
 
 from wagtail.images import get_image_model
 
@@ -19,6 +27,44 @@ def progress_bar(current, total, bar_length=50):
     return (f"Progress: [{arrow}{padding}] {int(fraction * 100)}%", ending)
 
 
+def update_image_renditions(rendition_ids, purge_only=False):
+    """
+    Deletes the renditions with the given ids, which must all belong to the same
+    image, and (unless ``purge_only`` is ``True``) creates them again, so that the
+    original image is only loaded and decoded once. Returns the number of
+    renditions processed, or ``None`` if they could not be processed.
+    """
+    Rendition = get_image_model().get_rendition_model()
+
+    try:
+        renditions = list(
+            Rendition.objects.filter(id__in=rendition_ids).select_related("image")
+        )
+        if not renditions:
+            return 0
+
+        image = renditions[0].image
+        filters = list(dict.fromkeys(rendition.filter for rendition in renditions))
+
+        with transaction.atomic():
+            # Delete the existing renditions
+            for rendition in renditions:
+                rendition.delete()
+
+            if not purge_only:
+                # Create new ones
+                image.create_renditions(*filters)
+    except:  # noqa:E722
+        logger.exception("Error operating on renditions %r", rendition_ids)
+        return None
+
+    return len(renditions)
+
+
+def init_worker():
+    django.setup()
+
+
 class Command(BaseCommand):
     """Command to create missing image renditions with the option to remove (purge) any existing ones."""
 
@@ -36,21 +82,76 @@ class Command(BaseCommand):
             default=50,
             help="Operate in x size chunks (default: %(default)s)",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes to operate on images in parallel (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            help=(
+                "Path to a file for recording progress, so that an interrupted "
+                "run can be resumed by running the command again"
+            ),
+        )
+        parser.add_argument(
+            "--collection",
+            type=int,
+            help="Only operate on renditions of images in the collection with this id",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only operate on renditions of images uploaded on or after this date (YYYY-MM-DD)",
+        )
+        parser.add_argument(
+            "--filter-spec",
+            action="append",
+            dest="filter_specs",
+            help="Only operate on renditions with this filter spec, such as 'fill-100x100'. Can be used multiple times",
+        )
 
     def handle(self, *args, **options):
         Rendition = get_image_model().get_rendition_model()
 
+        self.checkpoint_path = options["checkpoint"]
+        checkpoint = self.load_checkpoint()
+
         renditions = Rendition.objects.all()
+        if options["collection"] is not None:
+            renditions = renditions.filter(image__collection_id=options["collection"])
+        if options["since"] is not None:
+            renditions = renditions.filter(
+                image__created_at__gte=self.parse_since(options["since"])
+            )
+        if options["filter_specs"]:
+            renditions = renditions.filter(filter_spec__in=options["filter_specs"])
+        if checkpoint is not None:
+            renditions = renditions.filter(image_id__gt=checkpoint["last_image_id"])
 
         purge_only = options["purge_only"]
 
         if not renditions.exists():
             self.stdout.write(self.style.WARNING("No image renditions found."))
+            self.remove_checkpoint()
             return
 
-        rendition_ids = list(renditions.values_list("id", flat=True))
+        # Pre-calculate the ids of the renditions to change, grouped by image,
+        # so that renditions created along the way are left alone
+        rendition_ids = list(
+            renditions.order_by("image_id", "id")
+            .values_list("image_id", "id")
+            .iterator(chunk_size=options["chunk_size"])
+        )
         num_renditions = len(rendition_ids)
-
+        image_ids = []
+        groups = []
+        for image_id, group in groupby(rendition_ids, key=lambda row: row[0]):
+            image_ids.append(image_id)
+            groups.append([rendition_id for _, rendition_id in group])
+
+        if checkpoint is not None:
+            self.stdout.write(self.style.HTTP_INFO("Resuming from checkpoint"))
         if purge_only:
             self.stdout.write(
                 self.style.HTTP_INFO(f"Purging {num_renditions} rendition(s)")
@@ -60,41 +161,73 @@ class Command(BaseCommand):
                 self.style.HTTP_INFO(f"Regenerating {num_renditions} rendition(s)")
             )
 
-        progress_bar_current = 1
-        for rendition in (
-            # Pre-calculate the ids of the renditions to change,
-            # otherwise `.iterator` never ends.
-            renditions.filter(id__in=rendition_ids)
-            .select_related("image")
-            .iterator(chunk_size=options["chunk_size"])
-        ):
-            try:
-                with transaction.atomic():
-                    rendition_filter = rendition.filter
-                    rendition_image = rendition.image
-
-                    # Delete the existing rendition
-                    rendition.delete()
-
-                    _progress_bar = progress_bar(progress_bar_current, num_renditions)
-                    self.stdout.write(_progress_bar[0], ending=_progress_bar[1])
-                    progress_bar_current = progress_bar_current + 1
-
-                    if not purge_only:
-                        # Create a new one
-                        rendition_image.get_rendition(rendition_filter)
-            except:  # noqa:E722
-                logger.exception("Error operating on rendition %d", rendition.id)
-                self.stderr.write(
-                    self.style.ERROR(f"Failed to operate on rendition {rendition.id}")
-                )
-                num_renditions -= 1
-
-        if num_renditions:
+        executor = None
+        if options["workers"] > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=options["workers"], initializer=init_worker
+            )
+            # Worker processes must not share this process's database connections
+            connections.close_all()
+            results = executor.map(update_image_renditions, groups, repeat(purge_only))
+        else:
+            results = (update_image_renditions(group, purge_only) for group in groups)
+
+        progress_bar_current = 0
+        processed = 0
+        try:
+            # Results are returned in order, so everything up to the last image
+            # received has been processed
+            for image_id, group, result in zip(image_ids, groups, results):
+                progress_bar_current += len(group)
+                _progress_bar = progress_bar(progress_bar_current, num_renditions)
+                self.stdout.write(_progress_bar[0], ending=_progress_bar[1])
+
+                if result is None:
+                    self.stderr.write(
+                        self.style.ERROR(
+                            f"Failed to operate on renditions of image {image_id}"
+                        )
+                    )
+                else:
+                    processed += result
+
+                self.save_checkpoint({"last_image_id": image_id})
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        self.remove_checkpoint()
+
+        if processed:
             self.stdout.write(
-                self.style.SUCCESS(
-                    f"Successfully processed {num_renditions} rendition(s)"
-                )
+                self.style.SUCCESS(f"Successfully processed {processed} rendition(s)")
             )
         else:
             self.stdout.write(self.style.WARNING("Could not process any renditions."))
+
+    def parse_since(self, value):
+        try:
+            since = datetime.fromisoformat(value)
+        except ValueError:
+            raise CommandError(
+                f"Invalid date: '{value}'. Use the YYYY-MM-DD format."
+            ) from None
+        if settings.USE_TZ and timezone.is_naive(since):
+            since = timezone.make_aware(since)
+        return since
+
+    def load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            return json.load(f)
+
+    def save_checkpoint(self, checkpoint):
+        if not self.checkpoint_path:
+            return
+        with open(self.checkpoint_path, "w") as f:
+            json.dump(checkpoint, f)
+
+    def remove_checkpoint(self):
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
@@ -23,7 +23,7 @@ from django.core.cache.backends.base import BaseCache
 from django.core.exceptions import ImproperlyConfigured
 from django.core.files import File
 from django.core.files.storage import InvalidStorageError, default_storage, storages
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.forms.utils import flatatt
 from django.urls import reverse
@@ -32,6 +32,7 @@ from django.utils.module_loading import import_string
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 from taggit.managers import TaggableManager
+from willow.plugins.pillow import PillowImage
 
 from wagtail import hooks
 from wagtail.coreutils import string_to_ascii
@@ -46,6 +47,7 @@ from wagtail.images.image_operations import (
     TransformOperation,
 )
 from wagtail.images.rect import Rect
+from wagtail.images.tasks import generate_rendition_file_task
 from wagtail.images.utils import to_svg_safe_spec
 from wagtail.models import CollectionMember, ReferenceIndex
 from wagtail.search import index
@@ -549,14 +551,19 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         try:
             rendition = self.find_existing_rendition(filter)
         except Rendition.DoesNotExist:
-            rendition = self.create_rendition(filter)
+            if getattr(settings, "WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED", False):
+                rendition = self.create_placeholder_rendition(filter)
+            else:
+                rendition = self.create_rendition(filter)
             # Reuse this rendition if requested again from this object
             self._add_to_prefetched_renditions(rendition)
 
-        cache_key = Rendition.construct_cache_key(
-            self, filter.get_cache_key(self), filter.spec
-        )
-        Rendition.cache_backend.set(cache_key, rendition)
+        # Placeholders are not cached, so that the generated file is picked up
+        if not rendition.is_placeholder:
+            cache_key = Rendition.construct_cache_key(
+                self, filter.get_cache_key(self), filter.spec
+            )
+            Rendition.cache_backend.set(cache_key, rendition)
 
         return rendition
 
@@ -600,6 +607,64 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         )
         return rendition
 
+    def create_placeholder_rendition(self, filter: Filter) -> AbstractRendition:
+        """
+        Creates and returns a placeholder ``Rendition`` instance for the supplied
+        ``filter`` without generating its image file, and enqueues a task to
+        generate it. Until the file has been generated, the rendition's ``url``
+        points to the image serve view, which will generate the file itself if
+        it is requested first.
+
+        This method is used instead of ``create_rendition()`` when the
+        ``WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED`` setting is ``True``.
+
+        Note: If using custom image models, an instance of the custom rendition
+        model will be returned.
+        """
+        # The dimensions are estimated from those of the original image, and
+        # will be corrected when the file is generated
+        width, height = filter.get_transform(self).size
+
+        # Because of unique constraints applied to the model, we use
+        # get_or_create() to guard against race conditions
+        rendition, created = self.renditions.get_or_create(
+            filter_spec=filter.spec,
+            focal_point_key=filter.get_cache_key(self),
+            defaults={"file": "", "width": round(width), "height": round(height)},
+        )
+        if created:
+            generate_rendition_file_task.enqueue(
+                rendition._meta.app_label, rendition._meta.model_name, str(rendition.pk)
+            )
+        return rendition
+
+    def complete_placeholder_rendition(
+        self, rendition: AbstractRendition
+    ) -> AbstractRendition:
+        """
+        Generates the image file for a placeholder ``Rendition`` created by
+        ``create_placeholder_rendition()``, and returns the updated rendition.
+        If the file is being generated by another process, this waits for it
+        to finish (on databases that support row locking).
+        """
+        Rendition = self.get_rendition_model()
+        filter = Filter(spec=rendition.filter_spec)
+
+        with transaction.atomic():
+            try:
+                rendition = self.renditions.select_for_update().get(pk=rendition.pk)
+            except Rendition.DoesNotExist:
+                # The placeholder has since been deleted (for example, because
+                # the image file has changed)
+                return self.create_rendition(filter)
+
+            if rendition.is_placeholder:
+                rendition.file = self.generate_rendition_file(filter)
+                rendition.save(update_fields=["file", "width", "height"])
+
+        rendition.image = self
+        return rendition
+
     def get_renditions(self, *filters: Filter | str) -> dict[str, AbstractRendition]:
         """
         Returns a ``dict`` of ``Rendition`` instances with image files reflecting
@@ -626,7 +691,14 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         # Create any renditions not found in prefetched values, cache or database
         not_found = [f for f in filters if f not in renditions]
-        for filter, rendition in self.create_renditions(*not_found).items():
+        if getattr(settings, "WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED", False):
+            created = {
+                filter: self.create_placeholder_rendition(filter)
+                for filter in not_found
+            }
+        else:
+            created = self.create_renditions(*not_found)
+        for filter, rendition in created.items():
             self._add_to_prefetched_renditions(rendition)
             renditions[filter] = rendition
 
@@ -636,8 +708,10 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
                 self, filter.get_cache_key(self), filter.spec
             ): rendition
             for filter, rendition in renditions.items()
-            # prevent writing of cached data back to the cache
+            # prevent writing of cached data back to the cache, and don't cache
+            # placeholders so that the generated file is picked up
             if not getattr(rendition, "_from_cache", False)
+            and not rendition.is_placeholder
         }
         if cache_additions:
             Rendition.cache_backend.set_many(cache_additions)
@@ -730,6 +804,9 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         This method is usually called by ``Image.get_renditions()``, after first
         checking that a suitable rendition does not already exist.
 
+        Renditions are generated in parallel threads, from a single decoded copy of
+        the image where possible (see ``get_decoded_image()``).
+
         Note: If using custom image models, an instance of the custom rendition
         model will be returned.
         """
@@ -752,14 +829,20 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         with self.open_file() as file:
             original_image_bytes = file.read()
 
+        # Decode the image once, to be shared by all renditions where possible
+        decoded_image = self.get_decoded_image(filters, original_image_bytes)
+
         to_create = []
 
-        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.get_rendition_worker_count(len(filters))
+        ) as executor:
             for future in concurrent.futures.as_completed(
                 executor.submit(
                     self.generate_rendition_instance,
                     filter,
                     BytesIO(original_image_bytes),
+                    decoded_image=decoded_image,
                 )
                 for filter in filters
             ):
@@ -804,8 +887,57 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
 
         return return_value
 
+    def get_rendition_worker_count(self, rendition_count: int) -> int:
+        """
+        Returns the number of threads to use for generating ``rendition_count``
+        renditions at once in ``create_renditions()``. This is taken from the
+        ``WAGTAILIMAGES_RENDITION_WORKERS`` setting if set, and the number of CPUs
+        otherwise.
+        """
+        max_workers = getattr(settings, "WAGTAILIMAGES_RENDITION_WORKERS", None)
+        if not max_workers:
+            max_workers = os.cpu_count() or 1
+        return max(min(max_workers, rendition_count), 1)
+
+    def get_decoded_image(
+        self, filters: Iterable[Filter], original_image_bytes: bytes
+    ) -> DecodedImage | None:
+        """
+        Decodes and auto-orients the supplied image data, for use by all of the
+        renditions created by ``create_renditions()``. Returns ``None`` if the
+        image should instead be decoded separately for each rendition - which is
+        the case for SVGs, for formats that Willow has to open with Wand because
+        the installed Pillow doesn't support them (such as HEIC and AVIF when
+        ``pillow-heif`` isn't installed), or if rendition generation has been
+        customised by overriding ``generate_rendition_instance()``,
+        ``generate_rendition_file()`` or ``Filter.run()``.
+        """
+        if (
+            type(self).generate_rendition_instance
+            is not AbstractImage.generate_rendition_instance
+            or type(self).generate_rendition_file
+            is not AbstractImage.generate_rendition_file
+            or any(type(filter).run is not Filter.run for filter in filters)
+        ):
+            return None
+
+        willow_image = willow.Image.open(BytesIO(original_image_bytes))
+        original_format = willow_image.format_name
+        if original_format == "svg":
+            return None
+
+        willow_image = willow_image.auto_orient()
+        if not isinstance(willow_image, PillowImage):
+            return None
+
+        return DecodedImage(self, willow_image, original_format, filters)
+
     def generate_rendition_instance(
-        self, filter: Filter, source: BytesIO
+        self,
+        filter: Filter,
+        source: BytesIO,
+        *,
+        decoded_image: DecodedImage | None = None,
     ) -> AbstractRendition:
         """
         Use the supplied ``source`` image to create and return an
@@ -817,11 +949,19 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
             filter_spec=filter.spec,
             focal_point_key=filter.get_cache_key(self),
             file=self.generate_rendition_file(
-                filter, source=File(source, name=self.file.name)
+                filter,
+                source=File(source, name=self.file.name),
+                decoded_image=decoded_image,
             ),
         )
 
-    def generate_rendition_file(self, filter: Filter, *, source: File = None) -> File:
+    def generate_rendition_file(
+        self,
+        filter: Filter,
+        *,
+        source: File = None,
+        decoded_image: DecodedImage | None = None,
+    ) -> File:
         """
         Generates an in-memory image matching the supplied ``filter`` value
         and focal point value from this object, wraps it in a ``File`` object
@@ -832,6 +972,9 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         If the contents of ``self.file`` has already been read into memory, the
         ``source`` keyword can be used to provide a reference to the in-memory
         ``File``, bypassing the need to reload the image contents from storage.
+        If it has already been decoded, the ``decoded_image`` keyword can be
+        used to provide the ``DecodedImage``, bypassing the need to decode it
+        again.
 
         NOTE: The responsibility of generating the new image from the original
         falls to the supplied ``filter`` object. If you want to do anything
@@ -851,11 +994,11 @@ class AbstractImage(ImageFileMixin, CollectionMember, index.Indexed, models.Mode
         start_time = time.time()
 
         try:
-            generated_image = filter.run(
-                self,
-                SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE),
-                source=source,
-            )
+            output = SpooledTemporaryFile(max_size=settings.FILE_UPLOAD_MAX_MEMORY_SIZE)
+            if decoded_image is not None:
+                generated_image = decoded_image.run(filter, output)
+            else:
+                generated_image = filter.run(self, output, source=source)
 
             logger.debug(
                 "Generated '%s' rendition for image %d in %.1fms",
@@ -1058,110 +1201,120 @@ class Filter:
             # Fix orientation of image
             willow = willow.auto_orient()
 
-            # Transform the image
-            transform = self.get_transform(
-                image, (willow.image.width, willow.image.height)
-            )
-            willow = willow.crop(transform.get_rect().round())
-            willow = willow.resize(transform.size)
+            willow = self.transform_willow_image(image, willow)
+            return self.save_willow_image(image, willow, output, original_format)
+
+    def transform_willow_image(self, image: AbstractImage, willow):
+        """
+        Crops and resizes the (auto-oriented) ``willow`` image according to the
+        transform operations of this filter, and returns the result.
+        """
+        transform = self.get_transform(image, (willow.image.width, willow.image.height))
+        willow = willow.crop(transform.get_rect().round())
+        return willow.resize(transform.size)
+
+    def save_willow_image(
+        self, image: AbstractImage, willow, output: BytesIO, original_format: str
+    ):
+        """
+        Applies the filter operations of this filter to the (transformed) ``willow``
+        image, and saves it to ``output`` in the appropriate format.
+        """
+        # Apply filters
+        env = {
+            "original-format": original_format,
+        }
+        for operation in self.filter_operations:
+            willow = operation.run(willow, image, env) or willow
 
-            # Apply filters
-            env = {
-                "original-format": original_format,
+        # Find the output format to use
+        if "output-format" in env:
+            # Developer specified an output format
+            output_format = env["output-format"]
+        else:
+            # Convert avif, bmp and webp to png, and heic to jpg, by default
+            default_conversions = {
+                "avif": "png",
+                "bmp": "png",
+                "webp": "png",
+                "heic": "jpeg",
             }
-            for operation in self.filter_operations:
-                willow = operation.run(willow, image, env) or willow
 
-            # Find the output format to use
-            if "output-format" in env:
-                # Developer specified an output format
-                output_format = env["output-format"]
-            else:
-                # Convert avif, bmp and webp to png, and heic to jpg, by default
-                default_conversions = {
-                    "avif": "png",
-                    "bmp": "png",
-                    "webp": "png",
-                    "heic": "jpeg",
-                }
-
-                # Convert unanimated GIFs to PNG as well
-                if not willow.has_animation():
-                    default_conversions["gif"] = "png"
-
-                # Allow the user to override the conversions
-                conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
-                default_conversions.update(conversion)
-
-                # Get the converted output format falling back to the original
-                output_format = default_conversions.get(
-                    original_format, original_format
-                )
+            # Convert unanimated GIFs to PNG as well
+            if not willow.has_animation():
+                default_conversions["gif"] = "png"
 
-            if output_format == "jpeg":
-                # Allow changing of JPEG compression quality
-                if "jpeg-quality" in env:
-                    quality = env["jpeg-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
+            # Allow the user to override the conversions
+            conversion = getattr(settings, "WAGTAILIMAGES_FORMAT_CONVERSIONS", {})
+            default_conversions.update(conversion)
 
-                # If the image has an alpha channel, give it a white background
-                if willow.has_alpha():
-                    willow = willow.set_background_color_rgb((255, 255, 255))
+            # Get the converted output format falling back to the original
+            output_format = default_conversions.get(original_format, original_format)
 
-                return willow.save_as_jpeg(
-                    output, quality=quality, progressive=True, optimize=True
-                )
-            elif output_format == "png":
-                return willow.save_as_png(output, optimize=True)
-            elif output_format == "gif":
-                return willow.save_as_gif(output)
-            elif output_format == "webp":
-                # Allow changing of WebP compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_webp(output, lossless=True)
-                elif "webp-quality" in env:
-                    quality = env["webp-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+        if output_format == "jpeg":
+            # Allow changing of JPEG compression quality
+            if "jpeg-quality" in env:
+                quality = env["jpeg-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_JPEG_QUALITY", 85)
 
-                return willow.save_as_webp(output, quality=quality)
-            elif output_format == "avif":
-                # Allow changing of AVIF compression quality
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_avif(output, lossless=True)
-                elif "avif-quality" in env:
-                    quality = env["avif-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
-                return willow.save_as_avif(output, quality=quality)
-            elif output_format == "heic":
-                # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
-                # so there is little value in outputting it - for that reason, we make it work if someone
-                # explicitly requests it, but these settings are not documented.
-                if (
-                    "output-format-options" in env
-                    and "lossless" in env["output-format-options"]
-                ):
-                    return willow.save_as_heic(output, lossless=True)
-                elif "heic-quality" in env:
-                    quality = env["heic-quality"]
-                else:
-                    quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
-                return willow.save_as_heic(output, quality=quality)
-            elif output_format == "svg":
-                return willow.save_as_svg(output)
-            elif output_format == "ico":
-                return willow.save_as_ico(output)
-            raise UnknownOutputImageFormatError(
-                f"Unknown output image format '{output_format}'"
+            # If the image has an alpha channel, give it a white background
+            if willow.has_alpha():
+                willow = willow.set_background_color_rgb((255, 255, 255))
+
+            return willow.save_as_jpeg(
+                output, quality=quality, progressive=True, optimize=True
             )
+        elif output_format == "png":
+            return willow.save_as_png(output, optimize=True)
+        elif output_format == "gif":
+            return willow.save_as_gif(output)
+        elif output_format == "webp":
+            # Allow changing of WebP compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_webp(output, lossless=True)
+            elif "webp-quality" in env:
+                quality = env["webp-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_WEBP_QUALITY", 80)
+
+            return willow.save_as_webp(output, quality=quality)
+        elif output_format == "avif":
+            # Allow changing of AVIF compression quality
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_avif(output, lossless=True)
+            elif "avif-quality" in env:
+                quality = env["avif-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_AVIF_QUALITY", 80)
+            return willow.save_as_avif(output, quality=quality)
+        elif output_format == "heic":
+            # Allow changing of HEIC compression quality. Safari is the only browser that supports HEIC,
+            # so there is little value in outputting it - for that reason, we make it work if someone
+            # explicitly requests it, but these settings are not documented.
+            if (
+                "output-format-options" in env
+                and "lossless" in env["output-format-options"]
+            ):
+                return willow.save_as_heic(output, lossless=True)
+            elif "heic-quality" in env:
+                quality = env["heic-quality"]
+            else:
+                quality = getattr(settings, "WAGTAILIMAGES_HEIC_QUALITY", 80)
+            return willow.save_as_heic(output, quality=quality)
+        elif output_format == "svg":
+            return willow.save_as_svg(output)
+        elif output_format == "ico":
+            return willow.save_as_ico(output)
+        raise UnknownOutputImageFormatError(
+            f"Unknown output image format '{output_format}'"
+        )
 
     def get_cache_key(self, image):
         vary_parts = []
@@ -1188,6 +1341,86 @@ class Filter:
         return hash(self.spec)
 
 
+class DecodedImage:
+    """
+    An image that has been decoded and auto-oriented once, to generate several
+    renditions from it without decoding the original file for each of them.
+
+    Renditions that resize the whole image, without cropping it (such as the
+    ``width-{...}`` renditions of a ``srcset``), are derived from an intermediate
+    image resized to the largest of their sizes, rather than from the full-size image.
+
+    Renditions may be generated from multiple threads at once.
+    """
+
+    def __init__(
+        self,
+        image: AbstractImage,
+        willow_image,
+        original_format: str,
+        filters: Iterable[Filter],
+    ):
+        self.image = image
+        self.willow_image = willow_image
+        self.original_format = original_format
+
+        # Make sure the image data is loaded before it is shared between threads
+        willow_image.image.load()
+
+        size = (willow_image.image.width, willow_image.image.height)
+        full_rect = Rect(0, 0, *size)
+        self.transforms = {}
+        resize_only_sizes = []
+        for filter in filters:
+            transform = filter.get_transform(image, size)
+            self.transforms[filter] = transform
+            if (
+                transform.get_rect().round() == full_rect
+                and transform.size[0] < size[0]
+                and transform.size[1] < size[1]
+            ):
+                resize_only_sizes.append(tuple(transform.size))
+
+        self.intermediate = None
+        if len(resize_only_sizes) > 1:
+            self.intermediate = willow_image.resize(
+                max(resize_only_sizes, key=lambda size: size[0] * size[1])
+            )
+
+    def transform(self, filter: Filter):
+        """
+        Returns the image cropped and resized according to the transform
+        operations of the given filter.
+        """
+        transform = self.transforms[filter]
+        rect = transform.get_rect().round()
+
+        if self.intermediate is not None and rect == Rect(
+            0, 0, self.willow_image.image.width, self.willow_image.image.height
+        ):
+            intermediate_size = (
+                self.intermediate.image.width,
+                self.intermediate.image.height,
+            )
+            if tuple(transform.size) == intermediate_size:
+                return self.intermediate
+            if (
+                transform.size[0] <= intermediate_size[0]
+                and transform.size[1] <= intermediate_size[1]
+            ):
+                return self.intermediate.resize(transform.size)
+
+        return self.willow_image.crop(rect).resize(transform.size)
+
+    def run(self, filter: Filter, output: BytesIO):
+        """
+        Generates the rendition for the given filter, and saves it to ``output``.
+        """
+        return filter.save_willow_image(
+            self.image, self.transform(filter), output, self.original_format
+        )
+
+
 class ResponsiveImage:
     """
     A custom object used to represent a collection of renditions.
@@ -1329,8 +1562,23 @@ class AbstractRendition(ImageFileMixin, models.Model):
 
     wagtail_reference_index_ignore = True
 
+    @property
+    def is_placeholder(self):
+        """
+        Whether this is a placeholder created by
+        ``AbstractImage.create_placeholder_rendition()``, for which the image file
+        has not been generated yet.
+        """
+        return not self.file
+
     @property
     def url(self):
+        if self.is_placeholder:
+            from wagtail.images.views.serve import generate_image_url
+
+            # Serve the rendition through the image serve view, which generates
+            # the file if it hasn't been generated yet
+            return generate_image_url(self.image, self.filter_spec)
         return self.file.url
 
     @property
@@ -9,6 +9,10 @@ from .tasks import set_image_focal_point_task
 
 
 def post_delete_file_cleanup(instance, **kwargs):
+    if not instance.file:
+        # Placeholder renditions don't have a file to delete
+        return
+
     transaction.on_commit(
         lambda: delete_file_from_storage_task.enqueue(
             instance.file.storage.deconstruct(), instance.file.name
@@ -16,3 +16,17 @@ def set_image_focal_point_task(app_label, model_name, pk):
             "focal_point_height",
         ]
     )
+
+
+@task()
+def generate_rendition_file_task(app_label, model_name, pk):
+    model = apps.get_model(app_label, model_name)
+    try:
+        rendition = model.objects.select_related("image").get(pk=pk)
+    except model.DoesNotExist:
+        # The rendition has since been deleted (for example, because the image
+        # file has changed)
+        return
+
+    if rendition.is_placeholder:
+        rendition.image.complete_placeholder_rendition(rendition)
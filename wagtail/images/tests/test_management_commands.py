@@ -1,9 +1,17 @@
+import datetime
+import json
+import os
 import re
+import tempfile
 import warnings
 from io import StringIO
+from unittest import mock
 
 from django.core import management
 from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from wagtail.models import Collection
 
 from ..management.commands.wagtail_update_image_renditions import progress_bar
 from .utils import Image, get_test_image_file
@@ -138,3 +146,172 @@ class TestUpdateImageRenditions(TestCase):
         self.assertIn(
             f"Successfully processed {total_renditions} rendition(s)\n", output_string
         )
+
+
+class TestUpdateImageRenditionsOptions(TestCase):
+    REAESC = re.compile(r"\x1b[^m]*m")
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_collection = Collection.get_first_root_node()
+        cls.collection = cls.root_collection.add_child(name="Other")
+
+        cls.image = Image.objects.create(
+            title="Test image",
+            file=get_test_image_file(filename="test_image.png"),
+        )
+        cls.other_image = Image.objects.create(
+            title="Other image",
+            file=get_test_image_file(filename="other_image.png"),
+            collection=cls.collection,
+        )
+
+    def setUp(self):
+        self.image.get_renditions("width-400", "fill-100x100")
+        self.other_image.get_renditions("width-400", "fill-100x100")
+        self.original_rendition_ids = set(
+            Rendition.objects.values_list("id", flat=True)
+        )
+
+    def run_command(self, **options):
+        output = StringIO()
+        management.call_command(
+            "wagtail_update_image_renditions",
+            stdout=output,
+            stderr=StringIO(),
+            **options,
+        )
+        return self.REAESC.sub("", output.getvalue())
+
+    def get_regenerated(self):
+        return set(
+            Rendition.objects.exclude(id__in=self.original_rendition_ids).values_list(
+                "image_id", "filter_spec"
+            )
+        )
+
+    def test_decodes_each_image_once(self):
+        with mock.patch.object(
+            Image,
+            "get_decoded_image",
+            autospec=True,
+            side_effect=Image.get_decoded_image,
+        ) as get_decoded_image:
+            output = self.run_command()
+
+        self.assertIn("Successfully processed 4 rendition(s)", output)
+        self.assertEqual(get_decoded_image.call_count, 2)
+        self.assertEqual(
+            self.get_regenerated(),
+            {
+                (self.image.id, "width-400"),
+                (self.image.id, "fill-100x100"),
+                (self.other_image.id, "width-400"),
+                (self.other_image.id, "fill-100x100"),
+            },
+        )
+
+    def test_collection(self):
+        output = self.run_command(collection=self.collection.id)
+
+        self.assertIn("Successfully processed 2 rendition(s)", output)
+        self.assertEqual(
+            self.get_regenerated(),
+            {
+                (self.other_image.id, "width-400"),
+                (self.other_image.id, "fill-100x100"),
+            },
+        )
+
+    def test_since(self):
+        Image.objects.filter(id=self.image.id).update(
+            created_at=timezone.now() - datetime.timedelta(days=10)
+        )
+        since = (timezone.now() - datetime.timedelta(days=1)).date().isoformat()
+
+        output = self.run_command(since=since)
+
+        self.assertIn("Successfully processed 2 rendition(s)", output)
+        self.assertEqual(
+            {image_id for image_id, _ in self.get_regenerated()},
+            {self.other_image.id},
+        )
+
+    def test_invalid_since(self):
+        with self.assertRaises(management.CommandError):
+            self.run_command(since="last tuesday")
+
+    def test_filter_spec(self):
+        output = self.run_command(filter_specs=["fill-100x100"])
+
+        self.assertIn("Successfully processed 2 rendition(s)", output)
+        self.assertEqual(
+            self.get_regenerated(),
+            {
+                (self.image.id, "fill-100x100"),
+                (self.other_image.id, "fill-100x100"),
+            },
+        )
+
+    def test_checkpoint(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_path = os.path.join(tmpdir, "checkpoint.json")
+            # Simulate an interrupted run that got as far as the first image
+            with open(checkpoint_path, "w") as f:
+                json.dump({"last_image_id": self.image.id}, f)
+
+            output = self.run_command(checkpoint=checkpoint_path)
+
+            self.assertIn("Resuming from checkpoint", output)
+            self.assertIn("Successfully processed 2 rendition(s)", output)
+            self.assertEqual(
+                {image_id for image_id, _ in self.get_regenerated()},
+                {self.other_image.id},
+            )
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+    def test_workers(self):
+        class InlineExecutor:
+            def __init__(self, max_workers, initializer):
+                self.max_workers = max_workers
+
+            def map(self, fn, *iterables):
+                return map(fn, *iterables)
+
+            def shutdown(self):
+                pass
+
+        with mock.patch(
+            "wagtail.images.management.commands.wagtail_update_image_renditions.ProcessPoolExecutor",
+            InlineExecutor,
+        ):
+            output = self.run_command(workers=2)
+
+        self.assertIn("Successfully processed 4 rendition(s)", output)
+        self.assertEqual(len(self.get_regenerated()), 4)
+
+    def test_failure_leaves_renditions_in_place(self):
+        with (
+            mock.patch.object(
+                Image, "create_renditions", side_effect=OSError("Corrupt image")
+            ),
+            self.assertLogs(
+                "wagtail.images.management.commands.wagtail_update_image_renditions",
+                level="ERROR",
+            ),
+        ):
+            output = StringIO()
+            errors = StringIO()
+            management.call_command(
+                "wagtail_update_image_renditions", stdout=output, stderr=errors
+            )
+
+        self.assertIn(
+            f"Failed to operate on renditions of image {self.image.id}",
+            errors.getvalue(),
+        )
+        self.assertIn("Could not process any renditions.", output.getvalue())
+        self.assertEqual(
+            set(Rendition.objects.values_list("id", flat=True)),
+            self.original_rendition_ids,
+        )
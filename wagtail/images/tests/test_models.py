@@ -26,6 +26,8 @@ from wagtail.images.models import (
     get_rendition_storage,
 )
 from wagtail.images.rect import Rect
+from wagtail.images.tasks import generate_rendition_file_task
+from wagtail.images.views.serve import generate_image_url
 from wagtail.models import Collection, GroupCollectionPermission, Page, ReferenceIndex
 from wagtail.search.backends import get_search_backend
 from wagtail.test.dummy_external_storage import (
@@ -834,6 +836,154 @@ class TestRenditions(TestCase):
         # But, we should see equality on the keys
         self.assertEqual(third_result.keys(), result.keys())
 
+    def test_create_renditions_decodes_image_once(self):
+        filter_list = [
+            Filter(spec)
+            for spec in ("width-100", "width-200", "width-400", "fill-100x100")
+        ]
+
+        with mock.patch.object(
+            Filter,
+            "get_willow_image",
+            autospec=True,
+            side_effect=Filter.get_willow_image,
+        ) as get_willow_image:
+            result = self.image.create_renditions(*filter_list)
+
+        # The image is decoded once for all renditions, rather than by each filter
+        get_willow_image.assert_not_called()
+        self.assertEqual(
+            {
+                filter.spec: (rendition.width, rendition.height)
+                for filter, rendition in result.items()
+            },
+            {
+                "width-100": (100, 75),
+                "width-200": (200, 150),
+                "width-400": (400, 300),
+                "fill-100x100": (100, 100),
+            },
+        )
+        for rendition in result.values():
+            with rendition.get_willow_image() as willow_image:
+                self.assertEqual(
+                    willow_image.get_size(), (rendition.width, rendition.height)
+                )
+
+    def test_create_renditions_decodes_image_per_rendition_for_custom_filters(self):
+        class CustomFilter(Filter):
+            def run(self, image, output, source=None):
+                return super().run(image, output, source=source)
+
+        filter_list = [CustomFilter(spec) for spec in self.SPECS]
+
+        with mock.patch.object(
+            Filter,
+            "get_willow_image",
+            autospec=True,
+            side_effect=Filter.get_willow_image,
+        ) as get_willow_image:
+            result = self.image.create_renditions(*filter_list)
+
+        self.assertEqual(get_willow_image.call_count, len(self.SPECS))
+        self.assertEqual(len(result), len(self.SPECS))
+
+    def test_create_renditions_for_svg(self):
+        filter_list = [Filter(spec) for spec in ("width-50", "width-80")]
+
+        result = self.svg_image.create_renditions(*filter_list)
+
+        self.assertEqual(
+            {filter.spec: rendition.width for filter, rendition in result.items()},
+            {"width-50": 50, "width-80": 80},
+        )
+
+    def test_get_rendition_worker_count(self):
+        with mock.patch("os.cpu_count", return_value=4):
+            self.assertEqual(self.image.get_rendition_worker_count(8), 4)
+            self.assertEqual(self.image.get_rendition_worker_count(2), 2)
+
+        with override_settings(WAGTAILIMAGES_RENDITION_WORKERS=6):
+            self.assertEqual(self.image.get_rendition_worker_count(8), 6)
+            self.assertEqual(self.image.get_rendition_worker_count(3), 3)
+
+    @override_settings(WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED=True)
+    def test_get_rendition_async(self):
+        with mock.patch(
+            "wagtail.images.models.generate_rendition_file_task"
+        ) as mock_task:
+            rendition = self.image.get_rendition("width-400")
+
+        # A placeholder is returned, with its dimensions estimated from the image,
+        # and a task is enqueued to generate its file
+        self.assertTrue(rendition.is_placeholder)
+        self.assertEqual((rendition.width, rendition.height), (400, 300))
+        self.assertEqual(
+            rendition.url,
+            generate_image_url(self.image, "width-400"),
+        )
+        mock_task.enqueue.assert_called_once_with(
+            "wagtailimages", "rendition", str(rendition.pk)
+        )
+
+        # Placeholders are not cached, and are not created again
+        with mock.patch(
+            "wagtail.images.models.generate_rendition_file_task"
+        ) as mock_task:
+            self.assertEqual(self.image.get_rendition("width-400"), rendition)
+        mock_task.enqueue.assert_not_called()
+
+        generate_rendition_file_task.call(
+            "wagtailimages", "rendition", str(rendition.pk)
+        )
+
+        rendition = self.image.get_rendition("width-400")
+        self.assertFalse(rendition.is_placeholder)
+        self.assertEqual((rendition.width, rendition.height), (400, 300))
+        with rendition.get_willow_image() as willow_image:
+            self.assertEqual(willow_image.get_size(), (400, 300))
+
+    @override_settings(WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED=True)
+    def test_get_renditions_async(self):
+        with mock.patch(
+            "wagtail.images.models.generate_rendition_file_task"
+        ) as mock_task:
+            renditions = self.image.get_renditions(*self.SPECS)
+
+        self.assertEqual(list(renditions), list(self.SPECS))
+        self.assertTrue(
+            all(rendition.is_placeholder for rendition in renditions.values())
+        )
+        self.assertEqual(mock_task.enqueue.call_count, len(self.SPECS))
+
+    @override_settings(WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED=True)
+    def test_complete_placeholder_rendition(self):
+        with mock.patch("wagtail.images.models.generate_rendition_file_task"):
+            placeholder = self.image.get_rendition("fill-100x100")
+
+        rendition = self.image.complete_placeholder_rendition(placeholder)
+
+        self.assertEqual(rendition.pk, placeholder.pk)
+        self.assertFalse(rendition.is_placeholder)
+        self.assertEqual(rendition.url, rendition.file.url)
+
+        # Completing the placeholder again leaves the generated file in place
+        self.assertEqual(
+            self.image.complete_placeholder_rendition(placeholder).file.name,
+            rendition.file.name,
+        )
+
+    @override_settings(WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED=True)
+    def test_complete_deleted_placeholder_rendition(self):
+        with mock.patch("wagtail.images.models.generate_rendition_file_task"):
+            placeholder = self.image.get_rendition("fill-100x100")
+        Rendition.objects.filter(pk=placeholder.pk).delete()
+
+        rendition = self.image.complete_placeholder_rendition(placeholder)
+
+        self.assertNotEqual(rendition.pk, placeholder.pk)
+        self.assertFalse(rendition.is_placeholder)
+
     def test_alt_attribute(self):
         rendition = self.image.get_rendition("width-400")
         self.assertEqual(rendition.alt, "Test image")
@@ -1551,6 +1701,29 @@ class TestRenditionOrientation(TestCase):
         # Check actual image dimensions and orientation
         self.assert_orientation_landscape_image_is_correct(rendition)
 
+    def test_create_renditions_with_orientation(self):
+        with open("wagtail/images/tests/image_files/landscape_3.jpg", "rb") as f:
+            image = Image.objects.create(title="Test image", file=File(f))
+
+        renditions = image.create_renditions(
+            Filter("original"), Filter("width-300"), Filter("width-200")
+        )
+
+        self.assertEqual(
+            {
+                filter.spec: (rendition.width, rendition.height)
+                for filter, rendition in renditions.items()
+            },
+            {
+                "original": (600, 450),
+                "width-300": (300, 225),
+                "width-200": (200, 150),
+            },
+        )
+        self.assert_orientation_landscape_image_is_correct(
+            renditions[Filter("original")]
+        )
+
     # tests below here have a specified width x height in portrait but
     # an orientation specified of landscape, so the original shows a height > width
     # but the rendition is corrected to height < width.
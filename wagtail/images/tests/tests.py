@@ -1,6 +1,7 @@
 import os
 import unittest
 from io import BytesIO
+from unittest import mock
 
 import willow
 from django import forms, template
@@ -407,6 +408,25 @@ class TestFrontendServeView(TestCase):
         image = willow.Image.open(b"".join(response.streaming_content))
         self.assertIsInstance(image, AvifImageFile)
 
+    @override_settings(WAGTAILIMAGES_ASYNC_RENDITIONS_ENABLED=True)
+    def test_get_placeholder_rendition(self):
+        with mock.patch("wagtail.images.models.generate_rendition_file_task"):
+            placeholder = self.image.get_rendition("fill-800x600")
+        self.assertTrue(placeholder.is_placeholder)
+
+        # The placeholder's URL points to this view, which generates the file
+        response = self.client.get(placeholder.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "image/png")
+        image = willow.Image.open(b"".join(response.streaming_content))
+        self.assertIsInstance(image, PNGImageFile)
+
+        rendition = self.image.renditions.get(filter_spec="fill-800x600")
+        self.assertEqual(rendition.pk, placeholder.pk)
+        self.assertFalse(rendition.is_placeholder)
+
     def test_get_with_extra_component(self):
         """
         Test that a filename can be optionally added to the end of the URL.
@@ -47,6 +47,9 @@ class ServeView(View):
         # Get/generate the rendition
         try:
             rendition = image.get_rendition(filter_spec)
+            if rendition.is_placeholder:
+                # Generate the file now, rather than waiting for the task
+                rendition = image.complete_placeholder_rendition(rendition)
         except SourceImageIOError:
             return HttpResponse(
                 "Source image file not found", content_type="text/plain", status=410
@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.models import Page
+from wagtail.signal_handlers import batch_reference_index_updates
 
 
 class Command(BaseCommand):
@@ -8,6 +10,15 @@ class Command(BaseCommand):
         # Positional arguments
         parser.add_argument("from_id", type=int)
         parser.add_argument("to_id", type=int)
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help=(
+                "Move the pages with a single database update for each batch of "
+                "pages, sending a post_bulk_page_move signal instead of the "
+                "pre_page_move and post_page_move signals for each page"
+            ),
+        )
 
     def handle(self, *args, **options):
         # Get pages
@@ -25,7 +36,11 @@ class Command(BaseCommand):
             + to_page.title
             + '"'
         )
-        for page in pages:
-            page.move(to_page, pos="last-child")
+        with batch_reference_index_updates():
+            if options["bulk"]:
+                BulkMovePageAction(pages, to_page).execute()
+            else:
+                for page in pages:
+                    page.move(to_page, pos="last-child")
 
         self.stdout.write("Done")
@@ -1,10 +1,15 @@
+import time
+
 from django.conf import settings
 from django.core.management.base import BaseCommand
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import Exists, OuterRef, Q
 from django.db.models.deletion import ProtectedError
 from django.utils import timezone
 
-from wagtail.models import Revision, WorkflowState
+from wagtail.models import Comment, Revision, WorkflowState
+
+DEFAULT_BATCH_SIZE = 1000
 
 
 class Command(BaseCommand):
@@ -26,14 +31,35 @@ class Command(BaseCommand):
             action="store_true",
             help="Only delete revisions of non-page models",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of revisions to delete at once (default: %(default)s)",
+        )
+        parser.add_argument(
+            "--max-runtime",
+            type=int,
+            help=(
+                "Stop deleting revisions after this number of seconds. "
+                "Run the command again to continue"
+            ),
+        )
 
     def handle(self, *args, **options):
         days = options.get("days")
         pages = options.get("pages")
         non_pages = options.get("non_pages")
+        self.verbosity = options["verbosity"]
+        self.timed_out = False
 
         revisions_deleted, protected_error_count = purge_revisions(
-            days=days, pages=pages, non_pages=non_pages
+            days=days,
+            pages=pages,
+            non_pages=non_pages,
+            batch_size=options["batch_size"],
+            max_runtime=options["max_runtime"],
+            on_batch_deleted=self.write_progress,
         )
 
         if revisions_deleted:
@@ -51,8 +77,80 @@ class Command(BaseCommand):
         else:
             self.stdout.write("No revisions deleted")
 
+        if self.timed_out:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Stopped after reaching the maximum runtime. "
+                    "Run the command again to delete the remaining revisions."
+                )
+            )
+
+    def write_progress(self, revisions_deleted, protected_error_count, timed_out):
+        self.timed_out = timed_out
+        if self.verbosity > 1:
+            self.stdout.write(
+                "Deleted %d revisions so far (%d protected)"
+                % (revisions_deleted, protected_error_count)
+            )
+
+
+def delete_revisions(revision_ids):
+    """
+    Delete the revisions with the given ids, returning the number deleted and the
+    number that could not be deleted because of protected relations.
+    """
+    deleted_revisions_count = 0
+    protected_error_count = 0
+    remaining_ids = set(revision_ids)
+
+    # Revisions with comments are deleted one at a time, so that Revision.delete()
+    # can move their comments onto the next revision. As that revision may be in
+    # this batch too, repeat until none of the remaining revisions have comments.
+    while remaining_ids:
+        ids_with_comments = set(
+            Comment.objects.filter(revision_created_id__in=remaining_ids).values_list(
+                "revision_created_id", flat=True
+            )
+        )
+        if not ids_with_comments:
+            break
+        for revision in Revision.objects.filter(pk__in=ids_with_comments).order_by(
+            "created_at", "id"
+        ):
+            try:
+                revision.delete()
+                deleted_revisions_count += 1
+            except ProtectedError:
+                protected_error_count += 1
+            remaining_ids.discard(revision.pk)
+
+    if not remaining_ids:
+        return deleted_revisions_count, protected_error_count
+
+    try:
+        with transaction.atomic():
+            _, deleted_by_model = Revision.objects.filter(pk__in=remaining_ids).delete()
+        deleted_revisions_count += deleted_by_model.get(Revision._meta.label, 0)
+    except ProtectedError:
+        # Find out which revisions are protected by deleting them one at a time
+        for revision in Revision.objects.filter(pk__in=remaining_ids):
+            try:
+                revision.delete()
+                deleted_revisions_count += 1
+            except ProtectedError:
+                protected_error_count += 1
+
+    return deleted_revisions_count, protected_error_count
 
-def purge_revisions(days=None, pages=True, non_pages=True):
+
+def purge_revisions(
+    days=None,
+    pages=True,
+    non_pages=True,
+    batch_size=DEFAULT_BATCH_SIZE,
+    max_runtime=None,
+    on_batch_deleted=None,
+):
     if pages == non_pages:
         # If both are True or both are False, purge revisions of pages and non-pages
         objects = Revision.objects.all()
@@ -78,16 +176,41 @@ def purge_revisions(days=None, pages=True, non_pages=True):
         # only include revisions which were created before the cut off date
         purgeable_revisions = purgeable_revisions.filter(created_at__lt=purgeable_until)
 
+    # don't delete the latest revision, i.e. only include revisions of an object
+    # that have a newer revision (in the same order as Revision.is_latest_revision)
+    newer_revisions = Revision.objects.filter(
+        base_content_type_id=OuterRef("base_content_type_id"),
+        object_id=OuterRef("object_id"),
+    ).filter(
+        Q(created_at__gt=OuterRef("created_at"))
+        | Q(created_at=OuterRef("created_at"), id__gt=OuterRef("id"))
+    )
+    purgeable_revisions = purgeable_revisions.filter(Exists(newer_revisions))
+
     deleted_revisions_count = 0
     protected_error_count = 0
+    start_time = time.monotonic()
+    last_id = None
 
-    for revision in purgeable_revisions.iterator():
-        # don't delete the latest revision
-        if not revision.is_latest_revision():
-            try:
-                revision.delete()
-                deleted_revisions_count += 1
-            except ProtectedError:
-                protected_error_count += 1
+    while True:
+        batch = purgeable_revisions.order_by("pk")
+        if last_id is not None:
+            batch = batch.filter(pk__gt=last_id)
+        revision_ids = list(batch.values_list("pk", flat=True)[:batch_size])
+        if not revision_ids:
+            break
+        last_id = revision_ids[-1]
+
+        deleted, protected = delete_revisions(revision_ids)
+        deleted_revisions_count += deleted
+        protected_error_count += protected
+
+        timed_out = (
+            max_runtime is not None and time.monotonic() - start_time >= max_runtime
+        )
+        if on_batch_deleted is not None:
+            on_batch_deleted(deleted_revisions_count, protected_error_count, timed_out)
+        if timed_out:
+            break
 
     return deleted_revisions_count, protected_error_count
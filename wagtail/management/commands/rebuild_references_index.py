@@ -1,12 +1,62 @@
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import django
 from django.apps import apps
 from django.core.management.base import BaseCommand
-from django.db import transaction
-
-from wagtail.models import ReferenceIndex
-from wagtail.signal_handlers import disable_reference_index_auto_update
+from django.db import connections, transaction
 
 DEFAULT_CHUNK_SIZE = 1000
 
+# Models are imported within the functions below rather than at the top of this
+# module, since worker processes started with spawn or forkserver import it (to
+# unpickle index_pk_range) before django.setup() has been called
+
+
+def get_chunk_queryset(model):
+    """
+    Returns a queryset for fetching instances of the given model to be indexed,
+    with child relations prefetched so that references on them can be extracted
+    without a query per instance.
+    """
+    from modelcluster.models import ClusterableModel, get_all_child_relations
+
+    queryset = model.objects.all()
+    if issubclass(model, ClusterableModel):
+        queryset = queryset.prefetch_related(
+            *(
+                child_relation.get_accessor_name()
+                for child_relation in get_all_child_relations(model)
+            )
+        )
+    return queryset
+
+
+def index_pk_range(model_label, pk_range):
+    """
+    Creates ReferenceIndex records for instances of the given model with primary
+    keys between the (inclusive) bounds of ``pk_range``. Returns the number of
+    instances indexed.
+    """
+    from wagtail.models import ReferenceIndex
+
+    model = apps.get_model(model_label)
+    first_pk, last_pk = pk_range
+    chunk = list(
+        get_chunk_queryset(model)
+        .filter(pk__gte=first_pk, pk__lte=last_pk)
+        .order_by("pk")
+    )
+    with transaction.atomic():
+        ReferenceIndex.bulk_create_for_objects(chunk)
+    return len(chunk)
+
+
+def init_worker():
+    django.setup()
+
 
 class Command(BaseCommand):
     def write(self, *args, **kwargs):
@@ -27,40 +77,147 @@ class Command(BaseCommand):
             type=int,
             help="Set number of records to be fetched at once for inserting into the index",
         )
+        parser.add_argument(
+            "--workers",
+            action="store",
+            dest="workers",
+            default=1,
+            type=int,
+            help="Number of processes to index chunks of records in parallel",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            action="store",
+            dest="checkpoint",
+            help=(
+                "Path to a file for recording progress, so that an interrupted "
+                "rebuild can be resumed by running the command again"
+            ),
+        )
 
     def handle(self, **options):
         self.verbosity = options["verbosity"]
+        self.chunk_size = options["chunk_size"]
+        self.workers = options["workers"]
+        self.checkpoint_path = options["checkpoint"]
+        self.checkpoint = self.load_checkpoint()
+
+        if self.checkpoint is not None:
+            self.write("Resuming reference index rebuild from checkpoint")
+        else:
+            self.write("Rebuilding reference index")
+
+        if self.workers > 1 or self.checkpoint_path:
+            # Each chunk is committed separately, so that it is visible to other
+            # processes and isn't lost if the rebuild is interrupted
+            object_count = self.rebuild()
+        else:
+            with transaction.atomic():
+                object_count = self.rebuild()
+
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
 
-        chunk_size = options.get("chunk_size")
-        object_count = 0
+        self.write("Indexed %d objects" % object_count)
+        self.print_newline()
+
+    def rebuild(self):
+        from wagtail.models import ReferenceIndex
+        from wagtail.signal_handlers import disable_reference_index_auto_update
 
-        self.write("Rebuilding reference index")
+        object_count = 0
 
-        with transaction.atomic():
+        if self.checkpoint is None:
             with disable_reference_index_auto_update():
                 # Use `_raw_delete` to avoid loading instances into memory
                 all_references = ReferenceIndex.objects.all()
                 all_references._raw_delete(using=all_references.db)
+            self.checkpoint = {"completed_models": [], "last_pks": {}}
+            self.save_checkpoint()
+
+        executor = None
+        if self.workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=init_worker
+            )
 
+        try:
             for model in apps.get_models():
                 if not ReferenceIndex.is_indexed(model):
                     continue
 
-                self.write(str(model))
+                object_count += self.index_model(model, executor)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return object_count
+
+    def index_model(self, model, executor):
+        model_label = model._meta.label
+        if model_label in self.checkpoint["completed_models"]:
+            self.write(f"{model}: already indexed")
+            return 0
+
+        queryset = model.objects.order_by("pk")
+        last_pk = self.checkpoint["last_pks"].get(model_label)
+        if last_pk is not None:
+            queryset = queryset.filter(pk__gt=last_pk)
+        total = queryset.count()
+
+        self.write(f"{model}: {total} objects")
+
+        pk_ranges = list(self.get_pk_ranges(queryset))
+        if executor is not None:
+            # Worker processes (which may be forked from this one as chunks are
+            # submitted) must not share this process's database connections
+            connections.close_all()
+            results = executor.map(index_pk_range, repeat(model_label), pk_ranges)
+        else:
+            results = (index_pk_range(model_label, pk_range) for pk_range in pk_ranges)
+
+        # Results are returned in order, so everything up to the last range
+        # received has been indexed
+        indexed = 0
+        for pk_range, count in self.print_iter_progress(zip(pk_ranges, results)):
+            indexed += count
+            self.checkpoint["last_pks"][model_label] = str(pk_range[1])
+            self.save_checkpoint()
 
-                # Add items (chunk_size at a time)
-                for chunk in self.print_iter_progress(
-                    self.queryset_chunks(model.objects.all().order_by("pk"), chunk_size)
-                ):
-                    for instance in chunk:
-                        ReferenceIndex.create_or_update_for_object(instance)
-
-                    object_count += len(chunk)
+        self.print_newline()
 
-                self.print_newline()
+        self.checkpoint["completed_models"].append(model_label)
+        self.checkpoint["last_pks"].pop(model_label, None)
+        self.save_checkpoint()
+        return indexed
 
-        self.write("Indexed %d objects" % object_count)
-        self.print_newline()
+    def get_pk_ranges(self, queryset):
+        """
+        Yield (first_pk, last_pk) tuples covering ``chunk_size`` records at a time,
+        using keyset pagination rather than offsets.
+        """
+        pks = []
+        for pk in queryset.values_list("pk", flat=True).iterator(
+            chunk_size=self.chunk_size
+        ):
+            pks.append(pk)
+            if len(pks) == self.chunk_size:
+                yield (pks[0], pks[-1])
+                pks = []
+        if pks:
+            yield (pks[0], pks[-1])
+
+    def load_checkpoint(self):
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path) as f:
+            return json.load(f)
+
+    def save_checkpoint(self):
+        if not self.checkpoint_path:
+            return
+        with open(self.checkpoint_path, "w") as f:
+            json.dump(self.checkpoint, f)
 
     def print_newline(self):
         self.write("")
@@ -87,20 +244,3 @@ class Command(BaseCommand):
                 self.write(" ", ending="")
 
             self.stdout.flush()
-
-    # Atomic so the count of models doesn't change as it is iterated
-    @transaction.atomic
-    def queryset_chunks(self, qs, chunk_size=DEFAULT_CHUNK_SIZE):
-        """
-        Yield a queryset in chunks of at most ``chunk_size``. The chunk yielded
-        will be a list, not a queryset. Iterating over the chunks is done in a
-        transaction so that the order and count of items in the queryset
-        remains stable.
-        """
-        i = 0
-        while True:
-            items = list(qs[i * chunk_size :][:chunk_size])
-            if not items:
-                break
-            yield items
-            i += 1
@@ -1,5 +1,5 @@
 from django.contrib.contenttypes.fields import GenericRelation
-from django.db import models
+from django.db import connections, models, router
 from modelcluster.fields import ParentalKey, ParentalManyToManyField
 from modelcluster.models import ClusterableModel
 
@@ -111,3 +111,63 @@ def _copy(source, exclude_fields=None, update_attrs=None):
         child_object_map = {}
 
     return target, child_object_map
+
+
+def _bulk_insert(model, objs, batch_size=None):
+    """
+    Inserts new instances of the given model, which may use multi-table inheritance,
+    with one query per table for each batch rather than the queries for each instance
+    that save() would perform. As with bulk_create(), save() is not called and no
+    signals are sent. Primary keys are set on the instances.
+    """
+    if not objs:
+        return
+
+    using = router.db_for_write(model)
+    connection = connections[using]
+    concrete_model = model._meta.concrete_model
+
+    for obj in objs:
+        obj._prepare_related_fields_for_save(operation_name="bulk_insert")
+
+    # Insert into the tables of the parent models first, so that the parent links
+    # of the following tables can be set from their primary keys
+    for table_model in [
+        *reversed(concrete_model._meta.get_parent_list()),
+        concrete_model,
+    ]:
+        meta = table_model._meta
+        for obj in objs:
+            for parent, field in meta.parents.items():
+                if field:
+                    setattr(obj, field.attname, getattr(obj, parent._meta.pk.attname))
+
+        fields = [
+            field
+            for field in meta.local_concrete_fields
+            if not getattr(field, "generated", False) and field is not meta.auto_field
+        ]
+        returning_fields = meta.db_returning_fields
+        if (
+            returning_fields
+            and not connection.features.can_return_rows_from_bulk_insert
+        ):
+            # Only the value for a single row can be returned
+            max_batch_size = 1
+        else:
+            max_batch_size = max(connection.ops.bulk_batch_size(fields, objs), 1)
+        table_batch_size = min(batch_size or max_batch_size, max_batch_size)
+
+        manager = table_model._base_manager.using(using)
+        for start in range(0, len(objs), table_batch_size):
+            batch = objs[start : start + table_batch_size]
+            results = manager._insert(
+                batch, fields=fields, returning_fields=returning_fields, using=using
+            )
+            for obj, result in zip(batch, results or []):
+                for value, field in zip(result, returning_fields):
+                    setattr(obj, field.attname, value)
+
+    for obj in objs:
+        obj._state.adding = False
+        obj._state.db = using
@@ -10,6 +10,7 @@ from django.contrib.auth.models import Group, Permission
 from django.contrib.contenttypes.fields import GenericRelation
 from django.contrib.contenttypes.models import ContentType
 from django.core import checks
+from django.core.cache import cache
 from django.core.exceptions import (
     FieldDoesNotExist,
     ValidationError,
@@ -58,7 +59,7 @@ from wagtail.signals import (
     page_slug_changed,
     pre_validate_delete,
 )
-from wagtail.url_routing import RouteResult
+from wagtail.url_routing import RouteResult, route_cache
 from wagtail.utils.timestamps import ensure_utc
 
 from .audit_log import BaseLogEntry, BaseLogEntryManager, LogEntryQuerySet
@@ -503,11 +504,14 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
                     path_components = [
                         component for component in path.split("/") if component
                     ]
-                    request._wagtail_route_for_request = (
-                        site.root_page.localized.specific.route(
-                            request, path_components
+                    if route_cache.enabled:
+                        request._wagtail_route_for_request = Page._route_cached(
+                            request, site, path_components
+                        )
+                    else:
+                        request._wagtail_route_for_request = Page._route_from_root(
+                            request, site.root_page.localized, path_components
                         )
-                    )
                 else:
                     request._wagtail_route_for_request = None
             except Http404:
@@ -516,6 +520,117 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
 
         return request._wagtail_route_for_request
 
+    @staticmethod
+    def _route_from_root(request, root_page, path_components):
+        if getattr(settings, "WAGTAIL_ROUTE_BY_URL_PATH", False):
+            return Page.route_by_url_path(request, root_page, path_components)
+        else:
+            return root_page.specific.route(request, path_components)
+
+    @staticmethod
+    def _route_cached(request, site, path_components):
+        """
+        Route the request through the process-local route cache. Only routes that
+        resolve to the live page at exactly the requested path (with no extra
+        ``args`` or ``kwargs``), through pages that all use the default
+        ``Page.route()``, are cached, as anything else may depend on custom
+        ``route()`` logic.
+        """
+        key = (site.pk, translation.get_language(), tuple(path_components))
+        version = route_cache.get_version()
+
+        if entry := route_cache.get(key, version):
+            page_id, content_type_id, url_path = entry
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is not None:
+                page = model._default_manager.filter(
+                    pk=page_id, url_path=url_path, live=True
+                ).first()
+                if page is not None:
+                    return RouteResult(page)
+            route_cache.discard(key)
+
+        root_page = site.root_page.localized
+        result = Page._route_from_root(request, root_page, path_components)
+        if (
+            isinstance(result, RouteResult)
+            and not result.args
+            and not result.kwargs
+            and result.page.url_path
+            == root_page.url_path + "".join(f"{c}/" for c in path_components)
+            and Page._uses_default_routing(result.page, root_page)
+        ):
+            route_cache.set(key, version, result.page)
+        return result
+
+    @staticmethod
+    def _uses_default_routing(page, root_page):
+        """
+        Whether the given page, and each of its ancestors down from ``root_page``,
+        use the default ``Page.route()``, so that routing to the page doesn't depend
+        on anything but the path (such as the user or headers of the request).
+        """
+        content_type_ids = (
+            page.get_ancestors(inclusive=True)
+            .filter(depth__gte=root_page.depth)
+            .values_list("content_type", flat=True)
+        )
+        for content_type_id in content_type_ids:
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            if model is None or model.route is not Page.route:
+                return False
+        return True
+
+    @staticmethod
+    def route_by_url_path(
+        request: HttpRequest, root_page: Page, path_components: list[str]
+    ) -> RouteResult:
+        """
+        Equivalent to ``root_page.specific.route(request, path_components)``, but
+        fetches every page along the path in a single query on ``url_path``,
+        rather than one query per path component.
+
+        Routing is handed over to the page's own ``route()`` method at the first
+        page along the path whose class overrides it (for example, pages using
+        ``RoutablePageMixin``), so that custom routing behaves as before.
+        Raises ``Http404`` if no page matches.
+        """
+        url_paths = [root_page.url_path]
+        for component in path_components:
+            url_paths.append(url_paths[-1] + component + "/")
+
+        pages_by_url_path = {
+            page.url_path: page
+            for page in Page.objects.filter(
+                path__startswith=root_page.path,
+                depth__gt=root_page.depth,
+                depth__lte=root_page.depth + len(path_components),
+                url_path__in=url_paths[1:],
+            )
+        }
+
+        page = root_page
+        for depth, url_path in enumerate(url_paths):
+            if depth:
+                parent = page
+                try:
+                    page = pages_by_url_path[url_path]
+                except KeyError as e:
+                    raise Http404 from e
+                # Cache the parent page to avoid another db query in get_parent(),
+                # using a deferred specific instance as route() would have done
+                page._cached_parent_obj = parent.specific_deferred
+
+            specific_class = page.specific_class
+            if specific_class is not None and specific_class.route is not Page.route:
+                return page.specific.route(request, path_components[depth:])
+
+        # request is for the deepest page along the path
+        if page.live:
+            return RouteResult(page.specific)
+        else:
+            raise Http404
+
     @staticmethod
     def find_for_request(request: HttpRequest, path: str) -> Page | None:
         """
@@ -1672,11 +1787,13 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
         exclude_fields=None,
         log_action="wagtail.copy",
         reset_translation_key=True,
+        bulk=False,
     ):
         """
         Copies a given page
 
         :param log_action: flag for logging the action. Pass None to skip logging. Can be passed an action string. Defaults to ``'wagtail.copy'``.
+        :param bulk: When copying recursively, insert the descendants of the page in bulk. This is much faster for large trees, but ``save()`` is not called on the copied descendants and no ``pre_save`` or ``post_save`` signals are sent for them.
         """
         return CopyPageAction(
             self,
@@ -1690,6 +1807,7 @@ class Page(AbstractPage, index.Indexed, ClusterableModel, metaclass=PageBase):
             process_child_object=process_child_object,
             log_action=log_action,
             reset_translation_key=reset_translation_key,
+            bulk=bulk,
         ).execute(skip_permission_checks=True)
 
     copy.alters_data = True
@@ -2410,10 +2528,82 @@ class PageViewRestriction(BaseViewRestriction):
 
     passed_view_restrictions_session_key = "passed_page_view_restrictions"
 
+    restrictions_cache_key = "wagtail_page_view_restrictions"
+
     class Meta:
         verbose_name = _("page view restriction")
         verbose_name_plural = _("page view restrictions")
 
+    @classmethod
+    def get_cached_restrictions(cls):
+        """
+        Return a list of ``(id, restriction_type, group_ids)`` tuples for all page view
+        restrictions, which is cached until a restriction is changed.
+        """
+        result = cache.get(cls.restrictions_cache_key)
+
+        if result is None:
+            group_ids = {}
+            for restriction_id, group_id in cls.groups.through.objects.values_list(
+                "pageviewrestriction_id", "group_id"
+            ):
+                group_ids.setdefault(restriction_id, []).append(group_id)
+
+            result = [
+                (restriction_id, restriction_type, group_ids.get(restriction_id, []))
+                for restriction_id, restriction_type in cls.objects.values_list(
+                    "id", "restriction_type"
+                )
+            ]
+            cache.set(cls.restrictions_cache_key, result, 3600)
+
+        return result
+
+    @classmethod
+    def clear_cached_restrictions(cls):
+        cache.delete(cls.restrictions_cache_key)
+
+    @classmethod
+    def get_rejected_restriction_ids(cls, request):
+        """
+        Return the ids of the page view restrictions that would not accept the given
+        request, following the same rules as ``accept_request`` but without loading
+        the restrictions from the database.
+        """
+        passed_restrictions = None
+        user_group_ids = None
+        rejected_ids = []
+
+        for (
+            restriction_id,
+            restriction_type,
+            group_ids,
+        ) in cls.get_cached_restrictions():
+            if restriction_type == BaseViewRestriction.PASSWORD:
+                if passed_restrictions is None:
+                    passed_restrictions = set(
+                        request.session.get(
+                            cls.passed_view_restrictions_session_key, []
+                        )
+                    )
+                if restriction_id not in passed_restrictions:
+                    rejected_ids.append(restriction_id)
+
+            elif restriction_type == BaseViewRestriction.LOGIN:
+                if not request.user.is_authenticated:
+                    rejected_ids.append(restriction_id)
+
+            elif restriction_type == BaseViewRestriction.GROUPS:
+                if not request.user.is_superuser:
+                    if user_group_ids is None:
+                        user_group_ids = set(
+                            request.user.groups.values_list("id", flat=True)
+                        )
+                    if user_group_ids.isdisjoint(group_ids):
+                        rejected_ids.append(restriction_id)
+
+        return rejected_ids
+
     def save(self, user=None, **kwargs):
         """
         Custom save handler to include logging.
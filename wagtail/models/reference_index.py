@@ -449,6 +449,59 @@ class ReferenceIndex(models.Model):
             uuid.UUID("bdc70d8b-e7a2-4c2a-bf43-2a3e3fcbbe86"), content_path
         )
 
+    @classmethod
+    def _get_content_types_for_object(cls, object):
+        """
+        Returns the ContentType records for the model of the given object and all of
+        its ancestor classes, ordered from most to least specific.
+        """
+        return [
+            ContentType.objects.get_for_model(model_or_object, for_concrete_model=False)
+            for model_or_object in ([object] + object._meta.get_parent_list())
+        ]
+
+    @classmethod
+    def bulk_create_for_objects(cls, objects):
+        """
+        Creates ReferenceIndex records for all of the given objects with a single
+        insert, without looking for existing records to update or delete.
+
+        This is intended for populating the index from scratch (as done by the
+        ``rebuild_references_index`` management command). Records that already
+        exist are skipped, on databases that support ignoring conflicts.
+
+        Args:
+            objects (list[Model]): The model instances to create ReferenceIndex records for
+
+        Returns:
+            The number of references found on the objects
+        """
+        references = []
+        for object in objects:
+            content_types = cls._get_content_types_for_object(object)
+            references.extend(
+                cls(
+                    content_type=content_types[0],
+                    base_content_type=content_types[-1],
+                    object_id=object.pk,
+                    to_content_type_id=to_content_type_id,
+                    to_object_id=to_object_id,
+                    model_path=model_path,
+                    content_path=content_path,
+                    content_path_hash=cls._get_content_path_hash(content_path),
+                )
+                for to_content_type_id, to_object_id, model_path, content_path in set(
+                    cls._extract_references_from_object(object)
+                )
+            )
+
+        bulk_create_kwargs = {}
+        if connection.features.supports_ignore_conflicts:
+            bulk_create_kwargs["ignore_conflicts"] = True
+
+        cls.objects.bulk_create(references, **bulk_create_kwargs)
+        return len(references)
+
     @classmethod
     def create_or_update_for_object(cls, object):
         """
@@ -462,57 +515,90 @@ class ReferenceIndex(models.Model):
         Args:
             object (Model): The model instance to create/update ReferenceIndex records for
         """
+        cls.create_or_update_for_objects([object])
+
+    @classmethod
+    def create_or_update_for_objects(cls, objects):
+        """
+        Creates or updates ReferenceIndex records for all of the given objects.
+
+        This is equivalent to calling ``create_or_update_for_object`` on each object,
+        but finds the existing records for all objects with a single query, and
+        inserts and deletes records with a single query each.
+
+        Note: This method must be called within a `django.db.transaction.atomic()` block.
+
+        Args:
+            objects (list[Model]): The model instances to create/update ReferenceIndex records for
+        """
         # For the purpose of this method, a "reference record" is a tuple of
         # (to_content_type_id, to_object_id, model_path, content_path) - the properties that
         # uniquely define a reference
 
-        # Extract new references and construct a set of reference records
-        references = set(cls._extract_references_from_object(object))
+        # Map (base_content_type_id, object_id) keys to a tuple of the object, the content
+        # types for its model and all of its ancestor classes (ordered from most to least
+        # specific), and the set of reference records extracted from it
+        indexed_objects = {}
+        for object in objects:
+            content_types = cls._get_content_types_for_object(object)
+            indexed_objects[(content_types[-1].id, str(object.pk))] = (
+                object,
+                content_types,
+                set(cls._extract_references_from_object(object)),
+            )
 
-        # Find content types for this model and all of its ancestor classes,
-        # ordered from most to least specific
-        content_types = [
-            ContentType.objects.get_for_model(model_or_object, for_concrete_model=False)
-            for model_or_object in ([object] + object._meta.get_parent_list())
-        ]
-        content_type = content_types[0]
-        base_content_type = content_types[-1]
-        known_content_type_ids = [ct.id for ct in content_types]
+        if not indexed_objects:
+            return
 
-        # Find existing references in the database so we know what to add/delete.
-        # Construct a dict mapping reference records to the (content_type_id, id) pair that the
-        # existing database entry is found under
-        existing_references = {
-            (to_content_type_id, to_object_id, model_path, content_path): (
-                content_type_id,
-                id,
+        object_ids_by_base_content_type = {}
+        for base_content_type_id, object_id in indexed_objects:
+            object_ids_by_base_content_type.setdefault(base_content_type_id, []).append(
+                object_id
             )
-            for id, content_type_id, to_content_type_id, to_object_id, model_path, content_path in cls.objects.filter(
-                base_content_type=base_content_type, object_id=object.pk
-            ).values_list(
-                "id",
-                "content_type_id",
-                "to_content_type",
-                "to_object_id",
-                "model_path",
-                "content_path",
+        existing_filter = models.Q()
+        for base_content_type_id, object_ids in object_ids_by_base_content_type.items():
+            existing_filter |= models.Q(
+                base_content_type_id=base_content_type_id, object_id__in=object_ids
             )
-        }
 
-        # Construct the set of reference records that have been found on the object but are not
-        # already present in the database
-        new_references = references - set(existing_references.keys())
+        # Find existing references in the database so we know what to add/delete.
+        # Construct a dict mapping each object's key to a dict of reference records to the
+        # (content_type_id, id) pair that the existing database entry is found under
+        existing_references = {key: {} for key in indexed_objects}
+        for (
+            id,
+            content_type_id,
+            base_content_type_id,
+            object_id,
+            to_content_type_id,
+            to_object_id,
+            model_path,
+            content_path,
+        ) in cls.objects.filter(existing_filter).values_list(
+            "id",
+            "content_type_id",
+            "base_content_type_id",
+            "object_id",
+            "to_content_type",
+            "to_object_id",
+            "model_path",
+            "content_path",
+        ):
+            existing_references[(base_content_type_id, object_id)][
+                (to_content_type_id, to_object_id, model_path, content_path)
+            ] = (content_type_id, id)
 
-        bulk_create_kwargs = {}
-        if connection.features.supports_ignore_conflicts:
-            bulk_create_kwargs["ignore_conflicts"] = True
+        new_records = []
+        deleted_reference_ids = []
+        for key, (object, content_types, references) in indexed_objects.items():
+            object_existing_references = existing_references[key]
 
-        # Create database records for those reference records
-        cls.objects.bulk_create(
-            [
+            # Create database records for the reference records that have been found on the
+            # object but are not already present in the database
+            new_records.extend(
                 cls(
-                    content_type=content_type,
-                    base_content_type=base_content_type,
+                    content_type=content_types[0],
+                    base_content_type=content_types[-1],
                     object_id=object.pk,
                     to_content_type_id=to_content_type_id,
                     to_object_id=to_object_id,
@@ -520,31 +606,41 @@ class ReferenceIndex(models.Model):
                     content_path=content_path,
                     content_path_hash=cls._get_content_path_hash(content_path),
                 )
-                for to_content_type_id, to_object_id, model_path, content_path in new_references
-            ],
-            **bulk_create_kwargs,
-        )
+                for to_content_type_id, to_object_id, model_path, content_path in (
+                    references - set(object_existing_references.keys())
+                )
+            )
 
-        # Delete removed references
-        deleted_reference_ids = []
-        # Look at the reference record and the supporting content_type / id for each existing
-        # reference in the database
-        for reference_data, (content_type_id, id) in existing_references.items():
-            if reference_data in references:
-                # Do not delete this reference, as it is still present in the new set
-                continue
-
-            if content_type_id not in known_content_type_ids:
-                # The content type for the existing record does not match the current model or any
-                # superclass. We can infer that the existing record is for a more specific subclass
-                # than the one we're currently indexing - e.g. we are indexing <Page id=123> while
-                # the existing reference was recorded against <BlogPage id=123>. In this case, do
-                # not treat the missing reference as a deletion - it likely still exists, but on a
-                # relation which can only be seen on the more specific model.
-                continue
-
-            # If we reach here, this is a legitimate deletion - add it to the list of IDs to delete
-            deleted_reference_ids.append(id)
+            # Find removed references, by looking at the reference record and the supporting
+            # content_type / id for each existing reference in the database
+            known_content_type_ids = [ct.id for ct in content_types]
+            for reference_data, (
+                content_type_id,
+                id,
+            ) in object_existing_references.items():
+                if reference_data in references:
+                    # Do not delete this reference, as it is still present in the new set
+                    continue
+
+                if content_type_id not in known_content_type_ids:
+                    # The content type for the existing record does not match the current model
+                    # or any superclass. We can infer that the existing record is for a more
+                    # specific subclass than the one we're currently indexing - e.g. we are
+                    # indexing <Page id=123> while the existing reference was recorded against
+                    # <BlogPage id=123>. In this case, do not treat the missing reference as a
+                    # deletion - it likely still exists, but on a relation which can only be
+                    # seen on the more specific model.
+                    continue
+
+                # If we reach here, this is a legitimate deletion - add it to the list of IDs
+                # to delete
+                deleted_reference_ids.append(id)
+
+        bulk_create_kwargs = {}
+        if connection.features.supports_ignore_conflicts:
+            bulk_create_kwargs["ignore_conflicts"] = True
+
+        cls.objects.bulk_create(new_records, **bulk_create_kwargs)
 
         # Perform the deletion
         cls.objects.filter(id__in=deleted_reference_ids).delete()
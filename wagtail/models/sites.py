@@ -1,4 +1,7 @@
-from collections import namedtuple
+import copy
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
 
 from django.apps import apps
 from django.conf import settings
@@ -62,6 +65,94 @@ def get_site_for_hostname(hostname, port):
     raise Site.DoesNotExist()
 
 
+class SiteCache:
+    """
+    A process-local cache of the site matched by each hostname and port, used by
+    ``Site.find_for_request`` when the ``WAGTAIL_SITE_CACHE_ENABLED`` setting is
+    ``True``, so that finding the site for a request doesn't need a database query.
+
+    Entries are stamped with a version held in Django's cache, so that changes to
+    sites or their root pages made in any process invalidate the entries of every
+    process. Each lookup returns a copy of the cached site, so that it can be
+    modified without affecting other requests.
+    """
+
+    version_cache_key = "wagtail_site_cache_version"
+    # Hostnames are taken from requests, so limit the number of entries held
+    maxsize = 1000
+
+    # Stored for hostnames that do not match any site
+    NO_SITE = object()
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._version = None
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAIL_SITE_CACHE_ENABLED", False)
+
+    def get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def get_site_for_hostname(self, hostname, port):
+        """
+        Return the site for the given hostname and port, as ``get_site_for_hostname``
+        does, from the cache where possible.
+        """
+        key = (hostname, port)
+        version = self.get_version()
+
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+            site = self._entries.get(key)
+            if site is not None:
+                self._entries.move_to_end(key)
+
+        if site is None:
+            try:
+                site = get_site_for_hostname(hostname, port)
+            except Site.DoesNotExist:
+                site = self.NO_SITE
+
+            with self._lock:
+                # Don't store the site if it has changed since the lookup began
+                if version == self._version:
+                    self._entries[key] = site
+                    while len(self._entries) > self.maxsize:
+                        self._entries.popitem(last=False)
+
+        if site is self.NO_SITE:
+            raise Site.DoesNotExist()
+
+        site_copy = copy.copy(site)
+        site_copy.root_page = copy.copy(site.root_page)
+        return site_copy
+
+    def invalidate(self):
+        """
+        Discard the cached sites of all processes, by bumping the version.
+        """
+        cache.set(self.version_cache_key, uuid.uuid4().hex, None)
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+site_cache = SiteCache()
+
+
 class SiteManager(models.Manager):
     def get_queryset(self):
         return super().get_queryset().order_by(Lower("hostname"))
@@ -166,7 +257,10 @@ class Site(models.Model):
         port = request.get_port()
         site = None
         try:
-            site = get_site_for_hostname(hostname, port)
+            if site_cache.enabled:
+                site = site_cache.get_site_for_hostname(hostname, port)
+            else:
+                site = get_site_for_hostname(hostname, port)
         except Site.DoesNotExist:
             pass
             # copy old SiteMiddleware behaviour
@@ -269,6 +363,9 @@ class Site(models.Model):
     @staticmethod
     def clear_site_root_paths_cache():
         cache.delete(SITE_ROOT_PATHS_CACHE_KEY, version=SITE_ROOT_PATHS_CACHE_VERSION)
+        # The cache of sites by hostname holds their root pages, so discard it too
+        if site_cache.enabled:
+            site_cache.invalidate()
 
 
 class GroupSitePermissionManager(models.Manager):
@@ -2,16 +2,18 @@ import posixpath
 import warnings
 from collections import defaultdict
 from collections.abc import Iterable
+from itertools import islice
 from typing import Any
 
 from django.apps import apps
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import CharField, Prefetch, Q
+from django.db.models import CharField, Model, Prefetch, Q
 from django.db.models.expressions import Exists, OuterRef
 from django.db.models.functions import Cast, Length, Substr
 from django.db.models.query import ModelIterable
 from treebeard.mp_tree import MP_NodeQuerySet
 
+from wagtail.blocks import StreamValue
 from wagtail.models.i18n import Locale
 from wagtail.models.sites import Site
 from wagtail.search.queryset import SearchableQuerySetMixin
@@ -317,7 +319,88 @@ class SpecificQuerySetMixin:
         return clone
 
 
-class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet):
+def prefetch_stream_blocks(objects, *field_names):
+    """
+    Converts the blocks of the named StreamFields on all of the given model instances
+    at once, so that the blocks of each type are resolved with a single call to the
+    block's ``bulk_to_python()`` method - meaning one database query per model for
+    chooser blocks - rather than separately for each instance.
+
+    Instances that do not have a field, or where it has been deferred, are skipped.
+    """
+    stream_values = []
+    for obj in objects:
+        if not isinstance(obj, Model):
+            continue
+        for field_name in field_names:
+            # Look in __dict__ to avoid fetching deferred fields from the database
+            value = obj.__dict__.get(field_name)
+            if isinstance(value, StreamValue):
+                stream_values.append(value)
+    StreamValue.bulk_prefetch_blocks(stream_values)
+
+
+class StreamBlockPrefetchQuerySetMixin:
+    def __init__(self, *args, **kwargs):
+        """Set custom instance attributes"""
+        super().__init__(*args, **kwargs)
+        self._prefetch_stream_block_fields = ()
+        self._stream_blocks_prefetched = False
+
+    def _clone(self):
+        """Ensure clones inherit custom attribute values."""
+        clone = super()._clone()
+        clone._prefetch_stream_block_fields = self._prefetch_stream_block_fields
+        return clone
+
+    def prefetch_stream_blocks(self, *field_names):
+        """
+        Performance optimisation for listings that render StreamField content.
+        When the queryset is evaluated, the blocks of the named StreamFields are
+        converted for all results at once, so that chooser blocks (such as
+        ``ImageChooserBlock`` and ``PageChooserBlock``) make one query per block
+        type across all results, rather than one query per result.
+
+        Results that do not have the field (for example, pages of other types in a
+        specific queryset) are skipped. Pass ``None`` to clear the list of fields.
+        """
+        clone = self._chain()
+        if field_names == (None,):
+            clone._prefetch_stream_block_fields = ()
+        else:
+            clone._prefetch_stream_block_fields = (
+                self._prefetch_stream_block_fields + field_names
+            )
+        return clone
+
+    def _fetch_all(self):
+        super()._fetch_all()
+        if self._prefetch_stream_block_fields and not self._stream_blocks_prefetched:
+            prefetch_stream_blocks(
+                self._result_cache, *self._prefetch_stream_block_fields
+            )
+            self._stream_blocks_prefetched = True
+
+    def _iterator(self, use_chunked_fetch, chunk_size):
+        iterable = super()._iterator(use_chunked_fetch, chunk_size)
+        if not self._prefetch_stream_block_fields:
+            yield from iterable
+            return
+
+        # Prefetch blocks for each chunk of results, in the same way as Django
+        # handles prefetch_related() for iterator()
+        iterator = iter(iterable)
+        while results := list(islice(iterator, chunk_size or 2000)):
+            prefetch_stream_blocks(results, *self._prefetch_stream_block_fields)
+            yield from results
+
+
+class PageQuerySet(
+    SearchableQuerySetMixin,
+    SpecificQuerySetMixin,
+    StreamBlockPrefetchQuerySetMixin,
+    TreeQuerySet,
+):
     def live_q(self):
         return Q(live=True)
 
@@ -411,6 +494,25 @@ class PageQuerySet(SearchableQuerySetMixin, SpecificQuerySetMixin, TreeQuerySet)
         # do not match any page if no private section exists.
         return q if q else Q(pk__in=[])
 
+    def view_restricted_q(self, restriction_ids):
+        """
+        Return a single expression matching the pages within the sections protected
+        by the page view restrictions with the given ids, however many there are.
+        """
+        from wagtail.models import PageViewRestriction
+
+        if not restriction_ids:
+            return Q(pk__in=[])
+
+        return Q(
+            Exists(
+                PageViewRestriction.objects.filter(
+                    pk__in=restriction_ids,
+                    page__path=Substr(OuterRef("path"), 1, Length("page__path")),
+                )
+            )
+        )
+
     def public(self):
         """
         Filters the QuerySet to only contain pages that are not in a private
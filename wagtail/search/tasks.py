@@ -1 +1,54 @@
+import logging
+from collections import defaultdict
+
+from django.apps import apps
+from django_tasks import task
+from modelsearch import index
+from modelsearch.backends import get_search_backends_with_name
 from modelsearch.tasks import *  # noqa: F403
+
+logger = logging.getLogger("wagtail.search")
+
+
+@task()
+def insert_or_update_objects_task(app_label, model_name, *pks):
+    """
+    Update the search index for the instances of the given model with the given
+    primary keys, adding the instances of each indexed model to the search backends
+    in bulk.
+    """
+    model = apps.get_model(app_label, model_name)
+    queryset = model._default_manager.filter(pk__in=pks)
+    if hasattr(queryset, "specific"):
+        # Find the specific model of each page without fetching its specific fields
+        queryset = queryset.specific(defer=True)
+
+    pks_by_model = defaultdict(list)
+    for obj in queryset:
+        pks_by_model[type(obj)].append(obj.pk)
+
+    for indexed_model, model_pks in pks_by_model.items():
+        if not index.class_is_indexed(indexed_model) or not getattr(
+            indexed_model, "search_auto_update", True
+        ):
+            continue
+
+        objs = list(indexed_model.get_indexed_objects().filter(pk__in=model_pks))
+        if not objs:
+            continue
+
+        for backend_name, backend in get_search_backends_with_name(
+            with_auto_update=True
+        ):
+            try:
+                backend.add_bulk(indexed_model, objs)
+            except Exception:
+                logger.exception(
+                    "Exception raised while adding %d %s objects into the '%s' search backend",
+                    len(objs),
+                    indexed_model._meta.label,
+                    backend_name,
+                )
+                # As with insert_or_update_object, only catch the exception if the backend requires this
+                if not backend.catch_indexing_errors:
+                    raise
@@ -5,6 +5,7 @@ from asgiref.local import Local
 from django.core.cache import cache
 from django.db import transaction
 from django.db.models.signals import (
+    m2m_changed,
     post_delete,
     post_migrate,
     post_save,
@@ -12,7 +13,15 @@ from django.db.models.signals import (
     pre_migrate,
 )
 
-from wagtail.models import Locale, Page, ReferenceIndex, Site
+from wagtail.models import Locale, Page, PageViewRestriction, ReferenceIndex, Site
+from wagtail.signals import (
+    page_published,
+    page_slug_changed,
+    page_unpublished,
+    post_bulk_page_move,
+    post_page_move,
+)
+from wagtail.url_routing import route_cache
 
 from .tasks import update_reference_index_task
 
@@ -39,6 +48,17 @@ def post_delete_page_log_deletion(sender, instance, **kwargs):
     logger.info('Page deleted: "%s" id=%d', instance.title, instance.id)
 
 
+# Invalidate cached page routes in all processes whenever the page tree or sites change.
+# The tree version is bumped even if the route cache is disabled, as it is also used
+# for the ETags of page listings in the API.
+def invalidate_route_cache(**kwargs):
+    route_cache.invalidate()
+
+
+def clear_page_view_restrictions_cache(**kwargs):
+    PageViewRestriction.clear_cached_restrictions()
+
+
 def reset_locales_display_names_cache(sender, instance, **kwargs):
     cache.delete("wagtail_locales_display_name")
 
@@ -63,6 +83,40 @@ def disable_reference_index_auto_update():
         del reference_index_auto_update_disabled.value
 
 
+reference_index_update_batch = Local()
+
+
+@contextmanager
+def batch_reference_index_updates():
+    """
+    A context manager that can be used to coalesce the reference index updates for
+    objects saved within it, so that they are indexed by a single task for each model
+    (enqueued on exit) rather than a task for each save. If the block raises an
+    exception, no updates are enqueued, as its changes are expected to be rolled back.
+
+    For example:
+
+    with batch_reference_index_updates():
+        for my_instance in my_instances:
+            my_instance.save()  # Reference index will be updated for all instances at once
+    """
+    if getattr(reference_index_update_batch, "value", None) is not None:
+        # Already batching; the outermost block will enqueue the updates
+        yield
+        return
+
+    # Map (app_label, model_name) to a dict of primary keys, used as an ordered set
+    pks_by_model = {}
+    try:
+        reference_index_update_batch.value = pks_by_model
+        yield
+    finally:
+        del reference_index_update_batch.value
+
+    for (app_label, model_name), pks in pks_by_model.items():
+        update_reference_index_task.enqueue(app_label, model_name, *pks)
+
+
 def update_reference_index_on_save(instance, **kwargs):
     # Don't populate reference index while loading fixtures as referenced objects may not be populated yet
     if kwargs.get("raw", False):
@@ -71,6 +125,12 @@ def update_reference_index_on_save(instance, **kwargs):
     if getattr(reference_index_auto_update_disabled, "value", False):
         return
 
+    pks_by_model = getattr(reference_index_update_batch, "value", None)
+    if pks_by_model is not None:
+        model_key = (instance._meta.app_label, instance._meta.model_name)
+        pks_by_model.setdefault(model_key, {})[str(instance.pk)] = None
+        return
+
     update_reference_index_task.enqueue(
         instance._meta.app_label, instance._meta.model_name, str(instance.pk)
     )
@@ -111,6 +171,22 @@ def register_signal_handlers():
     pre_delete.connect(pre_delete_page_unpublish, sender=Page)
     post_delete.connect(post_delete_page_log_deletion, sender=Page)
 
+    post_save.connect(invalidate_route_cache, sender=Site)
+    post_delete.connect(invalidate_route_cache, sender=Site)
+    post_delete.connect(invalidate_route_cache, sender=Page)
+    page_published.connect(invalidate_route_cache)
+    page_unpublished.connect(invalidate_route_cache)
+    page_slug_changed.connect(invalidate_route_cache)
+    post_page_move.connect(invalidate_route_cache)
+    post_bulk_page_move.connect(invalidate_route_cache)
+
+    post_save.connect(clear_page_view_restrictions_cache, sender=PageViewRestriction)
+    post_delete.connect(clear_page_view_restrictions_cache, sender=PageViewRestriction)
+    m2m_changed.connect(
+        clear_page_view_restrictions_cache,
+        sender=PageViewRestriction.groups.through,
+    )
+
     post_save.connect(reset_locales_display_names_cache, sender=Locale)
     post_delete.connect(reset_locales_display_names_cache, sender=Locale)
 
@@ -26,6 +26,9 @@ pre_page_move = Signal()
 # provides args: instance, parent_page_before, parent_page_after, url_path_before, url_path_after
 post_page_move = Signal()
 
+# provides args: moves (a list of dicts with the arguments of post_page_move for each moved page)
+post_bulk_page_move = Signal()
+
 
 # Workflow signals
 
@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from django.apps import apps
 from django.db import transaction
 from django.utils.module_loading import import_string
@@ -8,29 +10,39 @@ from wagtail.models import ReferenceIndex
 
 
 @task()
-def update_reference_index_task(app_label, model_name, pk):
+def update_reference_index_task(app_label, model_name, *pks):
+    """
+    Update the reference index for the instances of the given model with the given
+    primary keys. Instances of child models are indexed through their parent instance.
+    """
     model = apps.get_model(app_label, model_name)
-    instance = model.objects.get(pk=pk)
-
-    # If the model is a child model, find the parent instance and index that instead
-    while True:
-        parental_keys = list(
-            filter(
-                lambda field: isinstance(field, ParentalKey),
-                instance._meta.get_fields(),
+
+    # Group the instances (or their parent instances) to be indexed by model, so that
+    # each model's instances can be indexed together
+    instances_by_model = defaultdict(dict)
+    for instance in model.objects.filter(pk__in=pks):
+        # If the model is a child model, find the parent instance and index that instead
+        while True:
+            parental_keys = list(
+                filter(
+                    lambda field: isinstance(field, ParentalKey),
+                    instance._meta.get_fields(),
+                )
             )
-        )
-        if not parental_keys:
-            break
+            if not parental_keys:
+                break
+
+            instance = getattr(instance, parental_keys[0].name)
+            if instance is None:
+                # parent is null, so there is no valid object to record references against
+                break
 
-        instance = getattr(instance, parental_keys[0].name)
-        if instance is None:
-            # parent is null, so there is no valid object to record references against
-            return
+        if instance is not None and ReferenceIndex.is_indexed(instance._meta.model):
+            instances_by_model[instance._meta.model][instance.pk] = instance
 
-    if ReferenceIndex.is_indexed(instance._meta.model):
+    for instances in instances_by_model.values():
         with transaction.atomic():
-            ReferenceIndex.create_or_update_for_object(instance)
+            ReferenceIndex.create_or_update_for_objects(list(instances.values()))
 
 
 @task()
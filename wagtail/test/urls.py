@@ -43,6 +43,12 @@ urlpatterns = [
             "sitemap_url_name": "sitemap",
         },
     ),
+    path("sitemap-snapshot.xml", sitemaps_views.snapshot_index),
+    path(
+        "sitemap-snapshot-<int:shard>.xml",
+        sitemaps_views.snapshot_sitemap,
+        name="wagtailsitemaps_snapshot",
+    ),
     path("sitemap-<str:section>.xml", sitemaps_views.sitemap, name="sitemap"),
     path("testapp/", include(testapp_urls)),
     path("fallback/", lambda request: HttpResponse("ok"), name="fallback"),
@@ -107,11 +107,8 @@ class WagtailTestUtils:
     def register_hook(self, hook_name, fn, order=0):
         from wagtail import hooks
 
-        hooks.register(hook_name, fn, order)
-        try:
+        with hooks.register_temporarily(hook_name, fn, order=order):
             yield
-        finally:
-            hooks._hooks[hook_name].remove((fn, order))
 
     def _tag_is_equal(self, tag1, tag2):
         if not hasattr(tag1, "name") or not hasattr(tag2, "name"):
@@ -2,7 +2,7 @@ from unittest import mock
 
 from django.contrib.sessions.middleware import SessionMiddleware
 from django.http import HttpResponse
-from django.test import RequestFactory, TestCase
+from django.test import RequestFactory, TestCase, override_settings
 
 from wagtail import hooks
 from wagtail.models import Page, PageViewRestriction
@@ -25,6 +25,7 @@ class TestLoginView(WagtailTestUtils, TestCase):
     @classmethod
     def tearDownClass(cls):
         del hooks._hooks["test_hook_name"]
+        hooks._clear_sorted_hooks("test_hook_name")
 
     def test_before_hook(self):
         def before_hook():
@@ -43,6 +44,91 @@ class TestLoginView(WagtailTestUtils, TestCase):
             self.assertEqual(hook_fns, [test_hook, after_hook])
 
 
+class TestGetHooks(TestCase):
+    def tearDown(self):
+        hooks._hooks.pop("test_get_hooks", None)
+        hooks._clear_sorted_hooks("test_get_hooks")
+
+    def test_hooks_are_sorted_once(self):
+        def first_hook():
+            pass
+
+        def second_hook():
+            pass
+
+        hooks.register("test_get_hooks", second_hook, order=1)
+        hooks.register("test_get_hooks", first_hook)
+
+        with mock.patch("wagtail.hooks.sorted", create=True, wraps=sorted) as sort:
+            self.assertEqual(
+                hooks.get_hooks("test_get_hooks"), [first_hook, second_hook]
+            )
+            self.assertEqual(
+                hooks.get_hooks("test_get_hooks"), [first_hook, second_hook]
+            )
+        sort.assert_called_once()
+
+    def test_register_clears_sorted_hooks(self):
+        def first_hook():
+            pass
+
+        def second_hook():
+            pass
+
+        hooks.register("test_get_hooks", second_hook)
+        self.assertEqual(hooks.get_hooks("test_get_hooks"), [second_hook])
+
+        hooks.register("test_get_hooks", first_hook, order=-1)
+        self.assertEqual(hooks.get_hooks("test_get_hooks"), [first_hook, second_hook])
+
+    def test_register_temporarily_clears_sorted_hooks(self):
+        def temporary_hook():
+            pass
+
+        self.assertEqual(hooks.get_hooks("test_get_hooks"), [])
+
+        with hooks.register_temporarily("test_get_hooks", temporary_hook):
+            self.assertEqual(hooks.get_hooks("test_get_hooks"), [temporary_hook])
+
+        self.assertEqual(hooks.get_hooks("test_get_hooks"), [])
+
+    def test_returned_list_can_be_modified(self):
+        def hook():
+            pass
+
+        hooks.register("test_get_hooks", hook)
+        hooks.get_hooks("test_get_hooks").append(None)
+
+        self.assertEqual(hooks.get_hooks("test_get_hooks"), [hook])
+
+    @override_settings(WAGTAIL_HOOK_TIMING_ENABLED=True)
+    def test_hook_timings(self):
+        def hook(value):
+            return value * 2
+
+        class HookClass:
+            pass
+
+        hooks.register("test_get_hooks", hook)
+        hooks.register("test_get_hooks", HookClass)
+        hooks.reset_hook_timings()
+
+        timed_hook, hook_class = hooks.get_hooks("test_get_hooks")
+        self.assertEqual(timed_hook(2), 4)
+        self.assertEqual(timed_hook(3), 6)
+        # Classes are returned as they are
+        self.assertIs(hook_class, HookClass)
+
+        timing = hooks.get_hook_timings()[
+            ("test_get_hooks", f"{__name__}.{hook.__qualname__}")
+        ]
+        self.assertEqual(timing.calls, 2)
+        self.assertGreaterEqual(timing.total_time, timing.max_time)
+
+        hooks.reset_hook_timings()
+        self.assertEqual(hooks.get_hook_timings(), {})
+
+
 class TestServeHooks(WagtailTestUtils, TestCase):
     fixtures = ["test.json"]
 
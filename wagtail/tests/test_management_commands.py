@@ -13,6 +13,7 @@ from django.utils import timezone
 from wagtail.embeds.models import Embed
 from wagtail.models import (
     Collection,
+    Comment,
     Page,
     PageLogEntry,
     Revision,
@@ -20,7 +21,15 @@ from wagtail.models import (
     Workflow,
     WorkflowTask,
 )
-from wagtail.signals import page_published, page_unpublished, published, unpublished
+from wagtail.signals import (
+    page_published,
+    page_unpublished,
+    post_bulk_page_move,
+    post_page_move,
+    pre_page_move,
+    published,
+    unpublished,
+)
 from wagtail.test.testapp.models import (
     DraftStateModel,
     EventPage,
@@ -151,8 +160,10 @@ class TestFixTreeCommand(TestCase):
 class TestMovePagesCommand(TestCase):
     fixtures = ["test.json"]
 
-    def run_command(self, from_, to):
-        management.call_command("move_pages", str(from_), str(to), stdout=StringIO())
+    def run_command(self, from_, to, **options):
+        management.call_command(
+            "move_pages", str(from_), str(to), stdout=StringIO(), **options
+        )
 
     def test_move_pages(self):
         # Get pages
@@ -167,6 +178,55 @@ class TestMovePagesCommand(TestCase):
         for page_id in page_ids:
             self.assertEqual(Page.objects.get(id=page_id).get_parent(), about_us)
 
+    def test_move_pages_sends_page_move_signals(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        page_ids = set(events_index.get_children().values_list("id", flat=True))
+
+        pre_page_move_handler = mock.MagicMock()
+        post_page_move_handler = mock.MagicMock()
+        pre_page_move.connect(pre_page_move_handler)
+        post_page_move.connect(post_page_move_handler)
+        self.addCleanup(pre_page_move.disconnect, pre_page_move_handler)
+        self.addCleanup(post_page_move.disconnect, post_page_move_handler)
+
+        self.run_command(events_index.id, about_us.id)
+
+        for handler in [pre_page_move_handler, post_page_move_handler]:
+            self.assertEqual(
+                {call.kwargs["instance"].id for call in handler.call_args_list},
+                page_ids,
+            )
+
+    def test_move_pages_batches_reference_index_updates(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        page_ids = {
+            str(pk) for pk in events_index.get_children().values_list("id", flat=True)
+        }
+
+        with mock.patch("wagtail.signal_handlers.update_reference_index_task") as task:
+            self.run_command(events_index.id, about_us.id)
+
+        # The moved pages are indexed by a single task, rather than one for each page
+        task.enqueue.assert_called_once()
+        self.assertEqual(set(task.enqueue.call_args.args[2:]), page_ids)
+
+    def test_bulk_move_pages(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        page_ids = events_index.get_children().values_list("id", flat=True)
+
+        post_bulk_page_move_handler = mock.MagicMock()
+        post_bulk_page_move.connect(post_bulk_page_move_handler)
+        self.addCleanup(post_bulk_page_move.disconnect, post_bulk_page_move_handler)
+
+        self.run_command(events_index.id, about_us.id, bulk=True)
+
+        for page_id in page_ids:
+            self.assertEqual(Page.objects.get(id=page_id).get_parent(), about_us)
+        post_bulk_page_move_handler.assert_called_once()
+
 
 class TestSetUrlPathsCommand(TestCase):
     fixtures = ["test.json"]
@@ -736,6 +796,54 @@ class TestPurgeRevisionsCommandForPages(TestCase):
         # Any other revisions are deleted
         self.assertRevisionNotExists(revision_purged)
 
+    def test_purge_revisions_in_batches(self):
+        revisions = [self.object.save_revision() for _ in range(5)]
+
+        self.run_command(batch_size=2, verbosity=2)
+
+        for revision in revisions[:-1]:
+            self.assertRevisionNotExists(revision)
+        self.assertRevisionExists(revisions[-1])
+
+    def test_purge_revisions_max_runtime(self):
+        revisions = [self.object.save_revision() for _ in range(5)]
+
+        self.run_command(batch_size=2, max_runtime=0)
+
+        # Only the first batch is deleted
+        self.assertRevisionNotExists(revisions[0])
+        self.assertRevisionNotExists(revisions[1])
+        self.assertRevisionExists(revisions[2])
+        self.assertRevisionExists(revisions[3])
+        self.assertRevisionExists(revisions[4])
+
+    def test_purge_revisions_keeps_comments(self):
+        if not isinstance(self.object, Page):
+            self.skipTest("Comments can only be added to pages")
+
+        user = get_user_model().objects.create_user(
+            username="commenter", password="password"
+        )
+        revision_1 = self.object.save_revision()
+        comment = Comment.objects.create(
+            page=self.object,
+            user=user,
+            text="Hello",
+            contentpath="content",
+            revision_created=revision_1,
+        )
+        revision_2 = self.object.save_revision()
+        revision_3 = self.object.save_revision()
+
+        self.run_command()
+
+        self.assertRevisionNotExists(revision_1)
+        self.assertRevisionNotExists(revision_2)
+        # The comment is moved to the next revision that isn't deleted
+        comment.refresh_from_db()
+        self.assertRevisionExists(comment.revision_created)
+        self.assertIn(comment.revision_created_id, [revision_1.id, revision_3.id])
+
 
 class TestPurgeRevisionsCommandForSnippets(TestPurgeRevisionsCommandForPages):
     def get_object(self):
@@ -1,7 +1,7 @@
 import datetime
 import json
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from asgiref.sync import async_to_sync
 from django.conf import settings
@@ -9,14 +9,18 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser, Group
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
+from django.db import connection
 from django.http import Http404
 from django.test import Client, TestCase, override_settings
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone, translation
 from freezegun import freeze_time
+from treebeard.exceptions import InvalidMoveToDescendant
 
 from wagtail.actions.copy_for_translation import ParentNotTranslatedError
+from wagtail.actions.move_page import BulkMovePageAction
 from wagtail.coreutils import get_dummy_request
 from wagtail.locks import BasicLock, ScheduledForPublishLock, WorkflowLock
 from wagtail.models import (
@@ -27,13 +31,14 @@ from wagtail.models import (
     PageLogEntry,
     PageManager,
     PageViewRestriction,
+    ReferenceIndex,
     Site,
     Workflow,
     WorkflowTask,
     get_page_models,
     get_translatable_models,
 )
-from wagtail.signals import page_published
+from wagtail.signals import page_published, post_bulk_page_move
 from wagtail.test.testapp.models import (
     AbstractPage,
     Advert,
@@ -72,7 +77,7 @@ from wagtail.test.testapp.models import (
     TaggedPage,
 )
 from wagtail.test.utils import WagtailTestUtils
-from wagtail.url_routing import RouteResult
+from wagtail.url_routing import PageURLResolver, RouteResult
 
 
 def get_ct(model):
@@ -364,6 +369,102 @@ class TestSiteRouting(TestCase):
             self.assertEqual(Site.find_for_request(request), self.default_site)
 
 
+@override_settings(WAGTAIL_ROUTE_BY_URL_PATH=True)
+class TestRouteByUrlPath(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.default_site = Site.objects.get(is_default_site=True)
+        # Populate the content type cache, so that query counts only reflect routing
+        for content_type in ContentType.objects.all():
+            ContentType.objects.get_for_id(content_type.id)
+
+    def test_route_for_request(self):
+        steal_underpants = EventPage.objects.get(
+            url_path="/home/secret-plans/steal-underpants/"
+        )
+        request = get_dummy_request(
+            path="/secret-plans/steal-underpants/", site=self.default_site
+        )
+        # expect queries for the site, the pages along the path and the specific page
+        with self.assertNumQueries(3):
+            result = Page.route_for_request(request, request.path)
+        self.assertIsInstance(result, RouteResult)
+        self.assertEqual(tuple(result), (steal_underpants, [], {}))
+        self.assertIsInstance(result[0], EventPage)
+
+    def test_route_for_request_root_page(self):
+        request = get_dummy_request(site=self.default_site)
+        result = Page.route_for_request(request, request.path)
+        self.assertEqual(result[0], self.default_site.root_page)
+
+    def test_unknown_page_returns_404(self):
+        request = get_dummy_request(path="/secret-plans/steal-overpants/")
+        self.assertIsNone(Page.route_for_request(request, request.path))
+        with self.assertRaises(Http404):
+            Page.route_by_url_path(
+                request, self.default_site.root_page, ["does-not-exist", "about-us"]
+            )
+
+    def test_unpublished_page_returns_404(self):
+        homepage = Page.objects.get(url_path="/home/")
+        request = get_dummy_request(path="/events/tentative-unpublished-event/")
+        with self.assertRaises(Http404):
+            Page.route_by_url_path(
+                request, homepage, ["events", "tentative-unpublished-event"]
+            )
+
+    def test_page_outside_site_is_not_routable(self):
+        events_page = Page.objects.get(url_path="/home/events/")
+        request = get_dummy_request(path="/about-us/")
+        with self.assertRaises(Http404):
+            Page.route_by_url_path(request, events_page, ["about-us"])
+
+    def test_delegates_to_overridden_route(self):
+        saint_patrick = SingleEventPage.objects.get(
+            url_path="/home/events/saint-patrick/"
+        )
+        request = get_dummy_request(path="/events/saint-patrick/pointless-suffix/")
+        result = Page.route_for_request(request, request.path)
+        self.assertEqual(tuple(result), (saint_patrick, [], {}))
+
+        # EventIndex handles numeric path components as listing page numbers
+        request = get_dummy_request(path="/events/2/")
+        response = Page.route_for_request(request, request.path)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.context_data["self"],
+            EventIndex.objects.get(url_path="/home/events/"),
+        )
+
+    def test_matches_route(self):
+        homepage = Page.objects.get(url_path="/home/")
+        for path_components in [
+            ["events", "christmas"],
+            ["events", "saint-patrick", "pointless-suffix"],
+            ["secret-plans", "steal-underpants"],
+            ["about-us"],
+            [],
+        ]:
+            with self.subTest(path_components=path_components):
+                request = get_dummy_request()
+                self.assertEqual(
+                    tuple(Page.route_by_url_path(request, homepage, path_components)),
+                    tuple(homepage.specific.route(request, path_components)),
+                )
+
+    def test_cached_parent_obj_set(self):
+        homepage = Page.objects.get(url_path="/home/")
+        request = get_dummy_request(path="/secret-plans/steal-underpants/")
+        found_page, args, kwargs = Page.route_by_url_path(
+            request, homepage, ["secret-plans", "steal-underpants"]
+        )
+
+        secret_plans = SimplePage.objects.get(url_path="/home/secret-plans/")
+        with self.assertNumQueries(0):
+            self.assertEqual(found_page.get_parent(update=False), secret_plans)
+
+
 class TestRouting(TestCase):
     fixtures = ["test.json"]
 
@@ -516,6 +617,69 @@ class TestRouting(TestCase):
         self.assertIsNone(homepage.full_url)
         self.assertIsNone(homepage.url)
 
+    def assertPageURLResolverMatches(self, request=None, specific=True):
+        pages = Page.objects.order_by("path")
+        if specific:
+            pages = pages.specific()
+        resolver = PageURLResolver(request)
+        self.assertEqual(
+            [resolver.get_url_parts(page) for page in pages],
+            [page.get_url_parts(request) for page in pages],
+        )
+        self.assertEqual(
+            resolver.get_full_urls(pages),
+            [page.get_full_url(request) for page in pages],
+        )
+
+    def test_page_url_resolver(self):
+        homepage = Page.objects.get(url_path="/home/")
+        homepage.add_child(instance=SimplePage(title="Café", slug="café", content="-"))
+
+        self.assertPageURLResolverMatches()
+        self.assertPageURLResolverMatches(get_dummy_request())
+
+    @override_settings(
+        ALLOWED_HOSTS=["localhost", "testserver", "events.example.com"],
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}},
+    )
+    def test_page_url_resolver_with_multiple_sites(self):
+        events_page = Page.objects.get(url_path="/home/events/")
+        Site.objects.create(hostname="events.example.com", root_page=events_page)
+        Site.objects.create(
+            hostname="events.example.com", port=8080, root_page=events_page
+        )
+
+        self.assertPageURLResolverMatches()
+        self.assertPageURLResolverMatches(
+            get_dummy_request(site=Site.objects.get(port=8080))
+        )
+
+    @override_settings(ROOT_URLCONF="wagtail.test.non_root_urls")
+    def test_page_url_resolver_non_root_urls(self):
+        self.assertPageURLResolverMatches()
+
+    @override_settings(ROOT_URLCONF="wagtail.test.headless_urls")
+    def test_page_url_resolver_headless(self):
+        self.assertPageURLResolverMatches(specific=False)
+
+    @override_settings(
+        CACHES={"default": {"BACKEND": "django.core.cache.backends.dummy.DummyCache"}}
+    )
+    def test_page_url_resolver_reverses_once(self):
+        pages = list(Page.objects.order_by("path"))
+        resolver = PageURLResolver()
+        resolver.get_site_root_paths()
+
+        with (
+            self.assertNumQueries(0),
+            patch("wagtail.url_routing.reverse", wraps=reverse) as mock_reverse,
+        ):
+            urls = resolver.get_full_urls(pages)
+
+        self.assertEqual(urls, [page.get_full_url() for page in pages])
+        # The root path and a probe path are reversed to find the URL prefix
+        self.assertEqual(mock_reverse.call_count, 2)
+
     def test_request_routing(self):
         homepage = Page.objects.get(url_path="/home/")
         christmas_page = EventPage.objects.get(url_path="/home/events/christmas/")
@@ -691,6 +855,18 @@ class TestRoutingWithI18N(TestRouting):
         with translation.override("se"):
             self.test_urls()
 
+    def test_page_url_resolver_with_different_language_tree(self):
+        homepage = Page.objects.get(url_path="/home/")
+        christmas_page = Page.objects.get(url_path="/home/events/christmas/")
+
+        fr_locale = Locale.objects.create(language_code="fr")
+        homepage.copy_for_translation(fr_locale)
+        christmas_page.copy_for_translation(fr_locale, copy_parents=True)
+
+        self.assertPageURLResolverMatches()
+        with translation.override("en-us"):
+            self.assertPageURLResolverMatches()
+
     def test_urls_with_different_language_tree(self):
         default_site = Site.objects.get(is_default_site=True)
         homepage = Page.objects.get(url_path="/home/")
@@ -952,6 +1128,92 @@ class TestMovePage(TestCase):
         self.assertEqual(christmas.url_path, "/home/about-us/events/christmas/")
 
 
+class TestBulkMovePage(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        self.about_us_page = Page.objects.get(url_path="/home/about-us/")
+        self.events_index = Page.objects.get(url_path="/home/events/")
+        self.secret_plans = Page.objects.get(url_path="/home/secret-plans/")
+
+    def test_bulk_move_pages(self):
+        homepage = self.about_us_page.get_parent()
+        homepage_numchild = homepage.numchild
+
+        handler = Mock()
+        post_bulk_page_move.connect(handler)
+        try:
+            BulkMovePageAction(
+                [self.events_index, self.secret_plans], self.about_us_page
+            ).execute()
+        finally:
+            post_bulk_page_move.disconnect(handler)
+
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+
+        events_index = Page.objects.get(id=self.events_index.id)
+        self.assertEqual(events_index.url_path, "/home/about-us/events/")
+        self.assertEqual(events_index.depth, 4)
+        self.assertEqual(events_index.get_parent().id, self.about_us_page.id)
+
+        # Descendants should also have been updated
+        christmas = events_index.get_children().get(slug="christmas")
+        self.assertEqual(christmas.depth, 5)
+        self.assertEqual(christmas.url_path, "/home/about-us/events/christmas/")
+        steal_underpants = Page.objects.get(slug="steal-underpants")
+        self.assertEqual(
+            steal_underpants.url_path,
+            "/home/about-us/secret-plans/steal-underpants/",
+        )
+
+        self.assertEqual(
+            Page.objects.get(id=homepage.id).numchild, homepage_numchild - 2
+        )
+        self.assertEqual(Page.objects.get(id=self.about_us_page.id).numchild, 2)
+
+        # A single signal is sent for all moved pages
+        handler.assert_called_once()
+        moves = handler.call_args.kwargs["moves"]
+        self.assertEqual(
+            [
+                (move["instance"].id, move["url_path_before"], move["url_path_after"])
+                for move in moves
+            ],
+            [
+                (self.events_index.id, "/home/events/", "/home/about-us/events/"),
+                (
+                    self.secret_plans.id,
+                    "/home/secret-plans/",
+                    "/home/about-us/secret-plans/",
+                ),
+            ],
+        )
+        self.assertEqual(moves[0]["parent_page_before"].id, homepage.id)
+        self.assertEqual(moves[0]["parent_page_after"].id, self.about_us_page.id)
+
+    def test_bulk_move_pages_to_descendant(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        with self.assertRaises(InvalidMoveToDescendant):
+            BulkMovePageAction([self.events_index], christmas).execute()
+
+    def test_bulk_move_pages_with_ancestor(self):
+        christmas = Page.objects.get(url_path="/home/events/christmas/")
+        with self.assertRaises(ValueError):
+            BulkMovePageAction(
+                [self.events_index, christmas], self.about_us_page
+            ).execute()
+
+    def test_bulk_move_pages_with_duplicate_slug(self):
+        self.about_us_page.add_child(
+            instance=SimplePage(title="Events", slug="events", content="hello")
+        )
+        with self.assertRaises(ValidationError):
+            BulkMovePageAction([self.events_index], self.about_us_page).execute()
+
+        events_index = Page.objects.get(id=self.events_index.id)
+        self.assertEqual(events_index.url_path, "/home/events/")
+
+
 class TestPrevNextSiblings(TestCase):
     fixtures = ["test.json"]
 
@@ -1814,6 +2076,163 @@ class TestCopyPage(TestCase):
             "Revisions were removed from the original page",
         )
 
+    def test_bulk_copy_page_copies_recursively(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        old_christmas_event = EventPage.objects.get(url_path="/home/events/christmas/")
+        old_christmas_event.save_revision()
+
+        new_events_index = events_index.copy(
+            recursive=True,
+            update_attrs={"title": "New events index", "slug": "new-events-index"},
+            bulk=True,
+        )
+
+        # Check that the tree is consistent
+        self.assertEqual(Page.find_problems(), ([], [], [], [], []))
+        new_events_index.refresh_from_db()
+        self.assertEqual(new_events_index.numchild, events_index.numchild)
+
+        old_descendants = list(events_index.get_descendants().specific())
+        new_descendants = list(new_events_index.get_descendants().specific())
+        self.assertEqual(
+            [
+                (type(page), page.slug, page.depth, page.numchild)
+                for page in new_descendants
+            ],
+            [
+                (type(page), page.slug, page.depth, page.numchild)
+                for page in old_descendants
+            ],
+        )
+        for old_page, new_page in zip(old_descendants, new_descendants):
+            self.assertNotEqual(new_page.pk, old_page.pk)
+            self.assertEqual(
+                new_page.url_path,
+                old_page.url_path.replace("/events/", "/new-events-index/", 1),
+            )
+            self.assertEqual(new_page.live, old_page.live)
+            self.assertNotEqual(new_page.translation_key, old_page.translation_key)
+            # Copying creates a new revision, which is live if the page is kept live
+            self.assertEqual(
+                new_page.latest_revision, new_page.revisions.latest("created_at", "id")
+            )
+            self.assertEqual(new_page.live_revision, new_page.latest_revision)
+            self.assertEqual(new_page.revisions.count(), old_page.revisions.count() + 1)
+            self.assertTrue(
+                PageLogEntry.objects.filter(
+                    page=new_page, action="wagtail.copy"
+                ).exists()
+            )
+
+        # Check that child objects were copied
+        new_christmas_event = EventPage.objects.get(
+            url_path="/home/new-events-index/christmas/"
+        )
+        self.assertEqual(new_christmas_event.speakers.count(), 1)
+        self.assertNotEqual(
+            new_christmas_event.speakers.get().pk,
+            old_christmas_event.speakers.get().pk,
+        )
+        self.assertEqual(old_christmas_event.speakers.count(), 1)
+
+        # Check that child objects in the copied revision point to the copied objects
+        copied_revision = new_christmas_event.revisions.order_by("created_at", "id")[0]
+        self.assertEqual(copied_revision.content["pk"], new_christmas_event.pk)
+        self.assertEqual(
+            copied_revision.content["speakers"][0]["pk"],
+            new_christmas_event.speakers.get().pk,
+        )
+
+        # Check that pages using multi-table inheritance were copied
+        new_saint_patrick_event = SingleEventPage.objects.get(
+            url_path="/home/new-events-index/saint-patrick/"
+        )
+        self.assertEqual(
+            new_saint_patrick_event.excerpt,
+            SingleEventPage.objects.get(url_path="/home/events/saint-patrick/").excerpt,
+        )
+
+    def test_bulk_copy_page_not_kept_live(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+
+        new_events_index = events_index.copy(
+            recursive=True,
+            update_attrs={"title": "New events index", "slug": "new-events-index"},
+            keep_live=False,
+            copy_revisions=False,
+            bulk=True,
+        )
+
+        for new_page in new_events_index.get_descendants():
+            self.assertFalse(new_page.live)
+            self.assertTrue(new_page.has_unpublished_changes)
+            self.assertIsNone(new_page.live_revision)
+            self.assertIsNone(new_page.first_published_at)
+            self.assertEqual(new_page.revisions.count(), 1)
+            self.assertEqual(new_page.latest_revision, new_page.revisions.get())
+
+    def test_bulk_copy_page_updates_indexes(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+        backend = Mock(catch_indexing_errors=False)
+
+        with (
+            patch(
+                "wagtail.search.tasks.get_search_backends_with_name",
+                return_value=[("default", backend)],
+            ),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            new_events_index = events_index.copy(
+                recursive=True,
+                update_attrs={"title": "New events index", "slug": "new-events-index"},
+                bulk=True,
+            )
+
+        new_descendant_ids = set(
+            new_events_index.get_descendants().values_list("id", flat=True)
+        )
+        self.assertEqual(
+            {
+                obj.pk
+                for call in backend.add_bulk.call_args_list
+                for obj in call.args[1]
+            },
+            new_descendant_ids,
+        )
+        self.assertEqual(
+            set(
+                ReferenceIndex.objects.filter(
+                    base_content_type=ContentType.objects.get_for_model(Page),
+                    object_id__in=[str(pk) for pk in new_descendant_ids],
+                )
+                .values_list("object_id", flat=True)
+                .distinct()
+            ),
+            {
+                str(page.pk)
+                for page in new_events_index.get_descendants().specific()
+                if ReferenceIndex.is_indexed(type(page))
+                and list(ReferenceIndex._extract_references_from_object(page))
+            },
+        )
+
+    def test_bulk_copy_page_uses_fewer_queries(self):
+        events_index = EventIndex.objects.get(url_path="/home/events/")
+
+        with CaptureQueriesContext(connection) as recursive_queries:
+            events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Events copy", "slug": "events-copy"},
+            )
+        with CaptureQueriesContext(connection) as bulk_queries:
+            events_index.copy(
+                recursive=True,
+                update_attrs={"title": "Events bulk copy", "slug": "events-bulk-copy"},
+                bulk=True,
+            )
+
+        self.assertLess(len(bulk_queries), len(recursive_queries) / 2)
+
     def test_copy_page_copies_recursively_to_the_same_tree(self):
         events_index = EventIndex.objects.get(url_path="/home/events/")
         old_christmas_event = (
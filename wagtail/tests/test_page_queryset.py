@@ -7,6 +7,8 @@ from django.core import management
 from django.db.models import Count, Q
 from django.test import TestCase, TransactionTestCase
 
+from wagtail.images.models import Image
+from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Locale, Page, PageViewRestriction, Site, Workflow
 from wagtail.search.query import MATCH_ALL
 from wagtail.signals import page_unpublished
@@ -504,6 +506,28 @@ class TestPageQuerySet(TestCase):
             # Check that the event is in the results
             self.assertTrue(pages.filter(id=event.id).exists())
 
+    def test_view_restricted_q(self):
+        events_index = Page.objects.get(url_path="/home/events/")
+        event = Page.objects.get(url_path="/home/events/christmas/")
+        about_us = Page.objects.get(url_path="/home/about-us/")
+        homepage = Page.objects.get(url_path="/home/")
+
+        events_restriction = PageViewRestriction.objects.create(
+            page=events_index, password="hello"
+        )
+        PageViewRestriction.objects.create(page=about_us, password="hello")
+
+        pages = Page.objects.all()
+        restricted_pages = pages.filter(
+            pages.view_restricted_q([events_restriction.id])
+        )
+        self.assertFalse(restricted_pages.filter(id=homepage.id).exists())
+        self.assertFalse(restricted_pages.filter(id=about_us.id).exists())
+        self.assertTrue(restricted_pages.filter(id=events_index.id).exists())
+        self.assertTrue(restricted_pages.filter(id=event.id).exists())
+
+        self.assertFalse(pages.filter(pages.view_restricted_q([])).exists())
+
     def test_private_with_no_private_page(self):
         PageViewRestriction.objects.all().delete()
 
@@ -1365,3 +1389,84 @@ class TestFirstCommonAncestor(TestCase):
             self.assertNotIn("body", page.__dict__)
             with self.assertNumQueries(1):
                 page.body
+
+
+class TestPrefetchStreamBlocks(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.root_page = Page.objects.get(url_path="/home/")
+        cls.images = [
+            Image.objects.create(title=f"Image {i}", file=get_test_image_file())
+            for i in range(3)
+        ]
+        for i, image in enumerate(cls.images):
+            cls.root_page.add_child(
+                instance=StreamPage(
+                    title=f"Stream page {i}",
+                    slug=f"stream-page-{i}",
+                    body=[
+                        {"type": "text", "value": "foo"},
+                        {"type": "image", "value": image.pk},
+                    ],
+                )
+            )
+        cls.root_page.add_child(
+            instance=SimplePage(title="Simple page", slug="simple", content="hello")
+        )
+
+    def test_prefetch_stream_blocks(self):
+        with self.assertNumQueries(2):
+            pages = list(
+                StreamPage.objects.order_by("pk").prefetch_stream_blocks("body")
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual([page.body[1].value for page in pages], self.images)
+            self.assertEqual(pages[0].body[0].value, "foo")
+
+    def test_without_prefetch_stream_blocks(self):
+        pages = list(StreamPage.objects.order_by("pk"))
+
+        with self.assertNumQueries(3):
+            self.assertEqual([page.body[1].value for page in pages], self.images)
+
+    def test_prefetch_stream_blocks_with_specific(self):
+        with self.assertNumQueries(4):
+            pages = list(
+                self.root_page.get_children()
+                .order_by("pk")
+                .specific()
+                .prefetch_stream_blocks("body")
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                [page.body[1].value for page in pages if isinstance(page, StreamPage)],
+                self.images,
+            )
+
+    def test_prefetch_stream_blocks_with_iterator(self):
+        with self.assertNumQueries(3):
+            pages = list(
+                StreamPage.objects.order_by("pk")
+                .prefetch_stream_blocks("body")
+                .iterator(chunk_size=2)
+            )
+
+        with self.assertNumQueries(0):
+            self.assertEqual([page.body[1].value for page in pages], self.images)
+
+    def test_prefetch_stream_blocks_skips_deferred_fields(self):
+        with self.assertNumQueries(1):
+            pages = list(
+                StreamPage.objects.defer_streamfields().prefetch_stream_blocks("body")
+            )
+
+        for page in pages:
+            self.assertNotIn("body", page.__dict__)
+
+    def test_clear_prefetch_stream_blocks(self):
+        queryset = StreamPage.objects.prefetch_stream_blocks("body")
+        self.assertEqual(queryset._prefetch_stream_block_fields, ("body",))
+        queryset = queryset.prefetch_stream_blocks(None)
+        self.assertEqual(queryset._prefetch_stream_block_fields, ())
@@ -1,4 +1,10 @@
+import json
+import os
+import subprocess
+import sys
+import tempfile
 from io import StringIO
+from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core import management
@@ -14,6 +20,8 @@ from wagtail.images import get_image_model
 from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Page, ReferenceIndex
 from wagtail.rich_text import RichText
+from wagtail.signal_handlers import batch_reference_index_updates
+from wagtail.tasks import update_reference_index_task
 from wagtail.test.testapp.models import (
     Advert,
     AdvertWithCustomUUIDPrimaryKey,
@@ -172,6 +180,125 @@ class TestCreateOrUpdateForObject(TestCase):
             },
         )
 
+    def test_create_or_update_for_objects(self):
+        other_page = EventPage(
+            title="Other event page",
+            slug="other-event-page",
+            location="the moon",
+            audience="public",
+            cost="free",
+            date_from="2001-01-01",
+            feed_image=self.test_image_2,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.root_page.add_child(instance=other_page)
+
+        ReferenceIndex.get_references_for_object(other_page).delete()
+        reference_to_remove = ReferenceIndex.objects.create(
+            base_content_type=ReferenceIndex._get_base_content_type(self.event_page),
+            content_type=ContentType.objects.get_for_model(self.event_page),
+            object_id=self.event_page.pk,
+            to_content_type=self.image_content_type,
+            to_object_id=self.test_image_1.pk,
+            model_path="hero_image",  # Field doesn't exist
+            content_path="hero_image",
+            content_path_hash=ReferenceIndex._get_content_path_hash("hero_image"),
+        )
+
+        ReferenceIndex.create_or_update_for_objects(
+            [self.event_page, other_page, self.test_image_1]
+        )
+
+        self.assertFalse(
+            ReferenceIndex.objects.filter(id=reference_to_remove.id).exists()
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(other_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            {
+                (
+                    self.image_content_type.id,
+                    str(self.test_image_2.pk),
+                    "feed_image",
+                    "feed_image",
+                )
+            },
+        )
+
+    def test_batch_reference_index_updates(self):
+        with mock.patch("wagtail.signal_handlers.update_reference_index_task") as task:
+            with batch_reference_index_updates():
+                self.event_page.save()
+                self.test_image_1.save()
+                with batch_reference_index_updates():
+                    self.test_image_2.save()
+                self.event_page.save()
+
+                # Nothing is enqueued until the outermost block exits
+                task.enqueue.assert_not_called()
+
+        self.assertEqual(
+            task.enqueue.call_args_list,
+            [
+                mock.call("tests", "eventpage", str(self.event_page.pk)),
+                mock.call(
+                    self.test_image_1._meta.app_label,
+                    self.test_image_1._meta.model_name,
+                    str(self.test_image_1.pk),
+                    str(self.test_image_2.pk),
+                ),
+            ],
+        )
+
+    def test_batch_reference_index_updates_not_enqueued_on_error(self):
+        with mock.patch("wagtail.signal_handlers.update_reference_index_task") as task:
+            with self.assertRaises(ValueError):
+                with batch_reference_index_updates():
+                    self.event_page.save()
+                    raise ValueError
+
+            # Saves after the failed block are no longer batched
+            self.test_image_1.save()
+
+        task.enqueue.assert_called_once_with(
+            self.test_image_1._meta.app_label,
+            self.test_image_1._meta.model_name,
+            str(self.test_image_1.pk),
+        )
+
+    def test_update_reference_index_task_with_several_pks(self):
+        ReferenceIndex.get_references_for_object(self.event_page).delete()
+        carousel_item_pks = [
+            str(pk)
+            for pk in self.event_page.carousel_items.values_list("pk", flat=True)
+        ]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            update_reference_index_task.enqueue(
+                "tests", "eventpagecarouselitem", *carousel_item_pks, "0"
+            )
+
+        # The carousel items are indexed through their (shared) parent page
+        self.assertSetEqual(
+            set(
+                ReferenceIndex.get_references_for_object(self.event_page).values_list(
+                    "to_content_type", "to_object_id", "model_path", "content_path"
+                )
+            ),
+            self.expected_references,
+        )
+
     def test_saving_base_model_does_not_remove_references(self):
         with self.captureOnCommitCallbacks(execute=True):
             page = Page.objects.get(pk=self.event_page.pk)
@@ -276,6 +403,113 @@ class TestCreateOrUpdateForObject(TestCase):
         )
         self.assertFalse(stdout.getvalue())
 
+    def get_index_rows(self):
+        return set(
+            ReferenceIndex.objects.values_list(
+                "content_type",
+                "base_content_type",
+                "object_id",
+                "to_content_type",
+                "to_object_id",
+                "model_path",
+                "content_path_hash",
+            )
+        )
+
+    def test_rebuild_references_index_matches_index(self):
+        expected_rows = self.get_index_rows()
+        ReferenceIndex.objects.all().delete()
+
+        management.call_command(
+            "rebuild_references_index", chunk_size=1, stdout=StringIO()
+        )
+
+        self.assertEqual(self.get_index_rows(), expected_rows)
+
+    def test_bulk_create_for_objects(self):
+        expected_rows = self.get_index_rows()
+        objects = [self.event_page, self.test_feed_image]
+        ref_count = 0
+        for obj in objects:
+            refs = ReferenceIndex.get_references_for_object(obj)
+            ref_count += refs.count()
+            refs.delete()
+        self.assertGreater(ref_count, 0)
+
+        created = ReferenceIndex.bulk_create_for_objects(objects)
+
+        self.assertEqual(created, ref_count)
+        self.assertEqual(self.get_index_rows(), expected_rows)
+
+    def test_rebuild_references_index_resumes_from_checkpoint(self):
+        expected_rows = self.get_index_rows()
+        # Leave the references of the event page in place, as if the rebuild had
+        # been interrupted after indexing it
+        ReferenceIndex.objects.exclude(object_id=str(self.event_page.pk)).delete()
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            checkpoint_path = os.path.join(tmpdir, "checkpoint.json")
+            with open(checkpoint_path, "w") as f:
+                json.dump(
+                    {
+                        "completed_models": [],
+                        "last_pks": {"wagtailcore.Page": str(self.event_page.pk)},
+                    },
+                    f,
+                )
+
+            stdout = StringIO()
+            management.call_command(
+                "rebuild_references_index",
+                checkpoint=checkpoint_path,
+                stdout=stdout,
+            )
+
+            self.assertFalse(os.path.exists(checkpoint_path))
+
+        self.assertIn("Resuming reference index rebuild", stdout.getvalue())
+        self.assertEqual(self.get_index_rows(), expected_rows)
+
+    def test_rebuild_references_index_with_workers(self):
+        class InlineExecutor:
+            def __init__(self, max_workers, initializer):
+                self.max_workers = max_workers
+
+            def map(self, fn, *iterables):
+                return map(fn, *iterables)
+
+            def shutdown(self):
+                pass
+
+        expected_rows = self.get_index_rows()
+
+        with mock.patch(
+            "wagtail.management.commands.rebuild_references_index.ProcessPoolExecutor",
+            InlineExecutor,
+        ):
+            management.call_command(
+                "rebuild_references_index", workers=2, stdout=StringIO()
+            )
+
+        self.assertEqual(self.get_index_rows(), expected_rows)
+
+    def test_rebuild_references_index_worker_can_be_imported_before_setup(self):
+        # Worker processes started with spawn or forkserver (the defaults on macOS,
+        # Windows and Python 3.14+) import the command module to unpickle
+        # index_pk_range before django.setup() has been called
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import wagtail.management.commands.rebuild_references_index",
+            ],
+            capture_output=True,
+            text=True,
+            env={**os.environ, "DJANGO_SETTINGS_MODULE": "wagtail.test.settings"},
+        )
+
+        self.assertEqual(result.returncode, 0, result.stderr)
+
     def test_show_references_index(self):
         stdout = StringIO()
         management.call_command(
@@ -1,8 +1,10 @@
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
 from django.test import TestCase, override_settings
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
+from wagtail.models.sites import site_cache
 
 
 class TestSiteNaturalKey(TestCase):
@@ -216,3 +218,95 @@ class TestGetSiteRootPaths(TestCase):
         # Followed by entries for others in 'host' alphabetical order
         self.assertEqual(result[1][0], self.abc_site.id)
         self.assertEqual(result[2][0], self.def_site.id)
+
+
+@override_settings(
+    ALLOWED_HOSTS=["example.com", "unknown.com"],
+    WAGTAIL_SITE_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestSiteCache(TestCase):
+    def setUp(self):
+        self.default_site = Site.objects.get()
+        self.site = Site.objects.create(
+            hostname="example.com", port=80, root_page=Page.objects.get(pk=2)
+        )
+        site_cache.clear()
+
+    def tearDown(self):
+        site_cache.clear()
+
+    def find_for_host(self, hostname):
+        request = get_dummy_request()
+        request.META.update({"HTTP_HOST": hostname, "SERVER_PORT": 80})
+        return Site.find_for_request(request)
+
+    def test_find_for_request(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.find_for_host("example.com"), self.site)
+
+        with self.assertNumQueries(0):
+            site = self.find_for_host("example.com")
+            self.assertEqual(site, self.site)
+            self.assertEqual(site.root_page.pk, 2)
+
+    def test_unknown_host(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(self.find_for_host("unknown.com"), self.default_site)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.find_for_host("unknown.com"), self.default_site)
+
+    def test_no_matching_site(self):
+        Site.objects.all().delete()
+
+        with self.assertNumQueries(1):
+            self.assertIsNone(self.find_for_host("unknown.com"))
+
+        with self.assertNumQueries(0):
+            self.assertIsNone(self.find_for_host("unknown.com"))
+
+    def test_returns_copies(self):
+        site = self.find_for_host("example.com")
+        site.site_name = "Changed"
+        site.root_page.title = "Changed"
+
+        site = self.find_for_host("example.com")
+        self.assertEqual(site.site_name, "")
+        self.assertNotEqual(site.root_page.title, "Changed")
+
+    def test_invalidated_on_site_change(self):
+        self.find_for_host("unknown.com")
+
+        Site.objects.create(
+            hostname="unknown.com", port=80, root_page=Page.objects.get(pk=2)
+        )
+
+        site = self.find_for_host("unknown.com")
+        self.assertEqual(site.hostname, "unknown.com")
+
+    def test_invalidated_on_site_delete(self):
+        self.find_for_host("example.com")
+
+        self.site.delete()
+
+        self.assertEqual(self.find_for_host("example.com"), self.default_site)
+
+    def test_invalidated_on_root_page_change(self):
+        self.find_for_host("example.com")
+
+        root_page = Page.objects.get(pk=2)
+        root_page.title = "New title"
+        root_page.save()
+
+        self.assertEqual(self.find_for_host("example.com").root_page.title, "New title")
+
+    def test_invalidated_by_other_processes(self):
+        self.find_for_host("example.com")
+
+        # Simulate another process changing the site without signal handlers
+        # running in this one
+        Site.objects.filter(pk=self.site.pk).update(site_name="Updated")
+        cache.set(site_cache.version_cache_key, "another-version")
+
+        self.assertEqual(self.find_for_host("example.com").site_name, "Updated")
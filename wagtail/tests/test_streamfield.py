@@ -14,6 +14,7 @@ from wagtail.fields import StreamField
 from wagtail.images.models import Image
 from wagtail.images.tests.utils import get_test_image_file
 from wagtail.models import Page
+from wagtail.query import prefetch_stream_blocks
 from wagtail.rich_text import RichText
 from wagtail.signal_handlers import disable_reference_index_auto_update
 from wagtail.test.testapp.models import (
@@ -166,6 +167,26 @@ class TestLazyStreamField(TestCase):
             assert instance.body[1].value is None
             assert instance.body[2].value.title == "Test image 3"
 
+    def test_prefetch_stream_blocks(self):
+        """
+        Prefetching the blocks of several instances at once should fetch all of
+        their images in a single query
+        """
+        instances = list(
+            self.model.objects.filter(
+                pk__in=[self.with_image.pk, self.no_image.pk, self.three_items.pk]
+            ).order_by("pk")
+        )
+
+        with self.assertNumQueries(1):
+            prefetch_stream_blocks(instances, "body")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(instances[0].body[0].value, self.image)
+            self.assertEqual(instances[1].body[0].value, "foo")
+            self.assertEqual(instances[2].body[1].value, self.image)
+            self.assertEqual(instances[2].body[2].value, "bar")
+
     def test_lazy_load_get_prep_value(self):
         """
         Saving a lazy StreamField that hasn't had its data accessed should not
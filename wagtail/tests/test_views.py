@@ -1,12 +1,19 @@
 from unittest import mock
 
-from django.test import TestCase
+from django.http import Http404
+from django.test import TestCase, override_settings
 from django.urls import reverse
 
 from wagtail.coreutils import get_dummy_request
 from wagtail.models import Page, Site
-from wagtail.test.testapp.models import SimplePage
+from wagtail.test.testapp.models import (
+    EventIndex,
+    EventPage,
+    SimplePage,
+    SingleEventPage,
+)
 from wagtail.test.utils import WagtailTestUtils
+from wagtail.url_routing import route_cache
 from wagtail.views import serve
 
 
@@ -98,3 +105,103 @@ class TestServeView(TestCase):
                     response_b = self.client.get("/simple/")
                 self.assertEqual(response_b.content, b"Intercepted")
                 self.assertEqual(m.call_count, 1)
+
+
+@override_settings(
+    WAGTAIL_ROUTE_CACHE_ENABLED=True,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+)
+class TestRouteCache(TestCase):
+    fixtures = ["test.json"]
+
+    def setUp(self):
+        route_cache.clear()
+        route_cache.reset_stats()
+        self.addCleanup(route_cache.clear)
+        # Routes through pages with a custom route() method, such as the events
+        # index, aren't cached, so use a page that is only routed by Page.route()
+        self.event_page = EventPage.objects.get(
+            url_path="/home/secret-plans/steal-underpants/"
+        )
+
+    def route(self, path):
+        request = get_dummy_request(path=path)
+        return Page.route_for_request(request, request.path)
+
+    def test_repeat_routing_uses_cache(self):
+        page, args, kwargs = self.route("/secret-plans/steal-underpants/")
+        self.assertEqual(page, self.event_page)
+        self.assertEqual(route_cache.cache_info().misses, 1)
+        self.assertEqual(route_cache.cache_info().currsize, 1)
+
+        # expect queries for the site and the specific page only
+        with self.assertNumQueries(2):
+            page, args, kwargs = self.route("/secret-plans/steal-underpants/")
+        self.assertEqual(page, self.event_page)
+        self.assertIsInstance(page, EventPage)
+        self.assertEqual(route_cache.cache_info().hits, 1)
+
+    def test_custom_routes_are_not_cached(self):
+        saint_patrick = SingleEventPage.objects.get(
+            url_path="/home/events/saint-patrick/"
+        )
+        page, args, kwargs = self.route("/events/saint-patrick/pointless-suffix/")
+        self.assertEqual(page, saint_patrick)
+        self.assertIsNone(self.route("/events/does-not-exist/"))
+        self.assertEqual(route_cache.cache_info().currsize, 0)
+
+    def test_routes_through_custom_route_methods_are_not_cached(self):
+        # The events index overrides route(), which could route its children
+        # differently depending on the request
+        page, args, kwargs = self.route("/events/christmas/")
+        self.assertEqual(page.url_path, "/home/events/christmas/")
+        self.assertEqual(route_cache.cache_info().currsize, 0)
+
+        with mock.patch.object(EventIndex, "route", side_effect=Http404):
+            self.assertIsNone(self.route("/events/christmas/"))
+
+    def test_unpublish_invalidates_cache(self):
+        self.route("/secret-plans/steal-underpants/")
+        self.event_page.unpublish()
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+        self.assertEqual(route_cache.cache_info().hits, 0)
+
+    def test_slug_change_invalidates_cache(self):
+        self.route("/secret-plans/steal-underpants/")
+        self.event_page.slug = "xmas"
+        self.event_page.save_revision().publish()
+
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+        page, args, kwargs = self.route("/secret-plans/xmas/")
+        self.assertEqual(page, self.event_page)
+        self.assertEqual(route_cache.cache_info().hits, 0)
+
+    def test_move_invalidates_cache(self):
+        self.route("/secret-plans/steal-underpants/")
+        self.event_page.move(
+            Page.objects.get(url_path="/home/about-us/"), pos="last-child"
+        )
+
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+        page, args, kwargs = self.route("/about-us/steal-underpants/")
+        self.assertEqual(page, self.event_page)
+
+    def test_delete_invalidates_cache(self):
+        self.route("/secret-plans/steal-underpants/")
+        self.event_page.delete()
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+
+    def test_stale_entry_is_discarded(self):
+        self.route("/secret-plans/steal-underpants/")
+        # bypass signals, so that the tree version is not bumped
+        Page.objects.filter(id=self.event_page.id).update(live=False)
+        self.assertIsNone(self.route("/secret-plans/steal-underpants/"))
+        self.assertEqual(route_cache.cache_info().currsize, 0)
+
+    @override_settings(WAGTAIL_ROUTE_CACHE_MAX_ENTRIES=1)
+    def test_max_entries(self):
+        self.route("/events/christmas/")
+        self.route("/about-us/")
+        self.assertEqual(route_cache.cache_info().currsize, 1)
+        self.route("/about-us/")
+        self.assertEqual(route_cache.cache_info().hits, 1)
@@ -1,3 +1,23 @@
+import re
+import threading
+import uuid
+from collections import OrderedDict, namedtuple
+from contextlib import nullcontext
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
+from django.utils.http import RFC3986_SUBDELIMS
+
+from wagtail.coreutils import (
+    WAGTAIL_APPEND_SLASH,
+    get_supported_content_language_variant,
+)
+
+
 class RouteResult:
     """
     An object to be returned from Page.route, which encapsulates
@@ -14,3 +34,300 @@ class RouteResult:
 
     def __getitem__(self, index):
         return (self.page, self.args, self.kwargs)[index]
+
+
+RouteCacheInfo = namedtuple("RouteCacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class RouteCache:
+    """
+    A process-local cache of page routes, used by ``Page.route_for_request`` when
+    the ``WAGTAIL_ROUTE_CACHE_ENABLED`` setting is ``True``.
+
+    Entries map a ``(site_id, language_code, path_components)`` key to the id,
+    content type id and ``url_path`` of the page that the path routes to. They are
+    stamped with a tree version held in Django's cache, so that changes to the page
+    tree made in any process (publishing, unpublishing, moving, deleting or
+    changing the slug of a page) invalidate the entries of every process.
+    """
+
+    version_cache_key = "wagtail_route_cache_version"
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self):
+        return getattr(settings, "WAGTAIL_ROUTE_CACHE_ENABLED", False)
+
+    @property
+    def maxsize(self):
+        return getattr(settings, "WAGTAIL_ROUTE_CACHE_MAX_ENTRIES", 10000)
+
+    def get_version(self):
+        version = cache.get(self.version_cache_key)
+        if version is None:
+            cache.add(self.version_cache_key, uuid.uuid4().hex, None)
+            version = cache.get(self.version_cache_key)
+        return version
+
+    def get(self, key, version):
+        """
+        Return the ``(page_id, content_type_id, url_path)`` entry for the given key,
+        or ``None`` if there is no entry for the given tree version.
+        """
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def set(self, key, version, page):
+        with self._lock:
+            if version != self._version:
+                # the tree has changed since this route was looked up
+                return
+
+            self._entries[key] = (page.pk, page.content_type_id, page.url_path)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self):
+        """
+        Invalidate the cached routes of all processes, by bumping the tree version.
+        """
+        cache.set(self.version_cache_key, uuid.uuid4().hex, None)
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+    def cache_info(self):
+        return RouteCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def reset_stats(self):
+        self.hits = 0
+        self.misses = 0
+
+
+route_cache = RouteCache()
+
+
+# Page paths that can be appended to the reversed URL of the root path without
+# changing the result of reversing them with the ``wagtail_serve`` URL pattern
+SERVE_PATH_RE = re.compile(r"(?:[\w\-]+/)*\Z")
+
+
+class _SiteRootPathTrieNode:
+    __slots__ = ("children", "site_root_paths")
+
+    def __init__(self):
+        self.children = {}
+        self.site_root_paths = []
+
+
+class PageURLResolver:
+    """
+    Computes the URLs of many pages, with the same results as calling
+    ``Page.get_url_parts`` and ``Page.get_full_url`` on each of them.
+
+    The site root paths are arranged into a trie of path segments, so that the sites
+    a page belongs to are found by walking the segments of its ``url_path`` rather
+    than by testing every root path, and the ``wagtail_serve`` URL is only reversed
+    once for each language, to find the prefix that page paths are appended to.
+    Pages that override ``get_url_parts`` or ``get_full_url`` are passed to those
+    methods instead.
+
+    A resolver does not notice changes to sites or URL configuration, so it should
+    only be kept for the duration of a single operation, such as purging a batch of
+    pages or rendering a sitemap.
+    """
+
+    def __init__(self, request=None):
+        # As with Page.get_url_parts, the request may be any object that the site
+        # root paths can be cached on
+        self.request = request
+        self._trie = None
+        self._serve_prefixes = {}
+        self._content_language_variants = {}
+
+    def get_site_root_paths(self):
+        """
+        Return ``Site.get_site_root_paths()``, using the cached copy on the
+        request object if available.
+        """
+        from wagtail.models import Site
+
+        cache_object = self.request if self.request else self
+        try:
+            return cache_object._wagtail_cached_site_root_paths
+        except AttributeError:
+            cache_object._wagtail_cached_site_root_paths = Site.get_site_root_paths()
+            return cache_object._wagtail_cached_site_root_paths
+
+    def _get_trie(self):
+        if self._trie is None:
+            self._trie = _SiteRootPathTrieNode()
+            for site_root_path in self.get_site_root_paths():
+                node = self._trie
+                for segment in site_root_path.root_path.split("/"):
+                    if segment:
+                        node = node.children.setdefault(
+                            segment, _SiteRootPathTrieNode()
+                        )
+                node.site_root_paths.append(site_root_path)
+        return self._trie
+
+    def get_relevant_site_root_paths(self, url_path):
+        """
+        Return a tuple of root paths for all sites that the page with the given
+        ``url_path`` belongs to, most specific path first.
+        """
+        node = self._get_trie()
+        matches = [node.site_root_paths]
+        for segment in url_path.split("/"):
+            if segment:
+                node = node.children.get(segment)
+                if node is None:
+                    break
+                matches.append(node.site_root_paths)
+
+        return tuple(
+            site_root_path
+            for site_root_paths in reversed(matches)
+            for site_root_path in site_root_paths
+        )
+
+    def _get_language_code(self, language_code):
+        # If the active language code is a variant of the page's language, then
+        # use that instead
+        active_language = translation.get_language()
+        if active_language not in self._content_language_variants:
+            try:
+                variant = get_supported_content_language_variant(active_language)
+            except LookupError:
+                variant = None
+            self._content_language_variants[active_language] = variant
+
+        if self._content_language_variants[active_language] == language_code:
+            return active_language
+        return language_code
+
+    def _get_serve_prefix(self, language_code):
+        # The reversed URL may also depend on the active language, such as when
+        # wagtail_serve is within i18n_patterns
+        key = (language_code, translation.get_language())
+        if key not in self._serve_prefixes:
+            prefix = None
+            try:
+                with (
+                    translation.override(language_code)
+                    if language_code
+                    else nullcontext()
+                ):
+                    root_path = reverse("wagtail_serve", args=("",))
+                    probe_path = reverse("wagtail_serve", args=("probe/",))
+                if probe_path == root_path + "probe/":
+                    prefix = root_path
+            except NoReverseMatch:
+                pass
+            self._serve_prefixes[key] = prefix
+
+        return self._serve_prefixes[key]
+
+    def _reverse(self, path, language_code):
+        prefix = self._get_serve_prefix(language_code)
+        if prefix is not None and SERVE_PATH_RE.match(path):
+            return prefix + quote(path, safe=RFC3986_SUBDELIMS + "/~:@")
+
+        try:
+            with (
+                translation.override(language_code) if language_code else nullcontext()
+            ):
+                return reverse("wagtail_serve", args=(path,))
+        except NoReverseMatch:
+            return None
+
+    def get_url_parts(self, page):
+        """
+        Return the ``(site_id, site_root_url, page_url_relative_to_site_root)`` tuple
+        for the given page, as returned by ``page.get_url_parts(request)``.
+        """
+        from wagtail.models import Page, Site
+
+        if type(page).get_url_parts is not Page.get_url_parts:
+            return page.get_url_parts(request=self.request)
+
+        possible_sites = self.get_relevant_site_root_paths(page.url_path)
+
+        if not possible_sites:
+            return None
+
+        site_id, root_path, root_url, language_code = possible_sites[0]
+
+        unique_site_ids = {values[0] for values in possible_sites}
+        if len(unique_site_ids) > 1 and isinstance(self.request, HttpRequest):
+            site = Site.find_for_request(self.request)
+            if site:
+                for values in possible_sites:
+                    if values[0] == site.pk:
+                        site_id, root_path, root_url, language_code = values
+                        break
+
+        if getattr(settings, "WAGTAIL_I18N_ENABLED", False):
+            language_code = self._get_language_code(language_code)
+        else:
+            language_code = None
+
+        page_path = self._reverse(page.url_path[len(root_path) :], language_code)
+        if page_path is None:
+            return (site_id, None, None)
+
+        if not WAGTAIL_APPEND_SLASH and page_path != "/":
+            page_path = page_path.rstrip("/")
+
+        return (site_id, root_url, page_path)
+
+    def get_full_url(self, page):
+        """
+        Return the full URL of the given page, as returned by
+        ``page.get_full_url(request)``.
+        """
+        from wagtail.models import Page
+
+        if type(page).get_full_url is not Page.get_full_url:
+            return page.get_full_url(request=self.request)
+
+        url_parts = self.get_url_parts(page)
+
+        if url_parts is None or url_parts[1] is None and url_parts[2] is None:
+            # page is not routable
+            return
+
+        site_id, root_url, page_path = url_parts
+
+        return root_url + page_path
+
+    def get_full_urls(self, pages):
+        """
+        Return a list of the full URLs of the given pages, in the same order.
+        """
+        return [self.get_full_url(page) for page in pages]